@@ -0,0 +1,22 @@
+"""Build the precomputed net benefit surfaces shipped with the engine.
+
+Run from the backend directory after changing the engine, the defaults, the
+city presets or SURFACE_AXES:
+
+    uv run python scripts/build_surfaces.py
+"""
+
+from importlib import resources
+from pathlib import Path
+
+from ownvsrent.engine.surfaces import SURFACE_FILE, write_surfaces
+
+
+def main():
+    path = Path(str(resources.files("ownvsrent.engine").joinpath("data", SURFACE_FILE)))
+    write_surfaces(path)
+    print(f"Wrote {path} ({path.stat().st_size / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,13 +4,60 @@ from fastapi import APIRouter, HTTPException
 from pydantic import ValidationError
 
 from ownvsrent.engine import (
+    BacktestResult,
     CalculatorInputs,
     CalculatorResults,
+    CityCompareRequest,
+    CityComparisonResult,
+    CompareRequest,
+    ComputeDtype,
+    DistributionFormat,
+    FanChartResult,
+    FinancingRequest,
+    FinancingResult,
+    GlobalSensitivityRequest,
+    GlobalSensitivityResult,
+    GradientResult,
+    GridRequest,
+    GridResult,
+    HoldingPeriodMode,
+    HorizonsResult,
+    MonteCarloRequest,
     MonteCarloResult,
+    MultilevelResult,
+    NetBenefitEstimate,
+    PairedMonteCarloResult,
+    ProbabilitySolveRequest,
+    ProbabilitySolveResult,
+    SensitivityCurve,
+    SensitivityCurvesRequest,
+    SensitivityRequest,
     SensitivityResult,
+    SimulationMode,
+    SolveRequest,
+    SolveResult,
+    TailRiskResult,
+    UncertaintyMethod,
     calculate,
+    calculate_all_horizons,
+    calculate_gradients,
+    compare_cities,
+    estimate_net_benefit,
+    estimate_tail_risk,
+    evaluate_grid,
+    optimize_financing,
+    propagate_moments,
+    run_backtest,
+    run_fan_chart,
+    run_global_sensitivity,
     run_monte_carlo,
+    run_multilevel_monte_carlo,
+    run_paired_monte_carlo,
     run_sensitivity_analysis,
+    run_sensitivity_curves,
+    solve_for_input,
+    solve_for_probability,
+    tenure_weights,
 )
 
 router = APIRouter()
@@ -35,6 +82,104 @@ async def calculate_endpoint(inputs: CalculatorInputs) -> CalculatorResults:
         raise HTTPException(status_code=500, detail=f"Calculation error: {str(e)}")
 
 
+@router.post("/calculate/horizons", response_model=HorizonsResult)
+async def horizons_endpoint(inputs: CalculatorInputs, max_years: int = 30) -> HorizonsResult:
+    """Calculate the outcome of every holding period from one simulation.
+
+    Args:
+        inputs: Calculator input parameters (the holding period is ignored)
+        max_years: Longest holding period to report (default 30)
+
+    Returns:
+        Net benefit, verdict, break-even year and rent equivalent for each
+        holding period from 1 to ``max_years``
+    """
+    try:
+        result = calculate_all_horizons(inputs, max_years=max_years)
+        return result
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Calculation error: {str(e)}")
+
+
+@router.post("/calculate/net-benefit", response_model=NetBenefitEstimate)
+async def net_benefit_endpoint(
+    inputs: CalculatorInputs, approximate: bool = False
+) -> NetBenefitEstimate:
+    """Net benefit and verdict at the holding period only.
+
+    Args:
+        inputs: Calculator input parameters
+        approximate: Answer from a precomputed surface when the inputs
+            differ from the defaults or a city preset only in appreciation,
+            investment return, mortgage rate, down payment and holding
+            period; otherwise (or when out of range) the exact engine answers
+
+    Returns:
+        Net benefit with an estimated interpolation error (0 when exact)
+    """
+    try:
+        result = estimate_net_benefit(inputs, approximate=approximate)
+        return result
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Calculation error: {str(e)}")
+
+
+@router.post("/cities/compare", response_model=CityComparisonResult)
+async def compare_cities_endpoint(request: CityCompareRequest) -> CityComparisonResult:
+    """Evaluate the user's situation in every preset city.
+
+    Rent, price, property tax, insurance, HOA and state tax come from each
+    city; all other inputs are the user's. Cities are evaluated as one batch.
+
+    Args:
+        request: Calculator inputs and optional city slugs to compare
+
+    Returns:
+        Cities ranked by net benefit (most favorable to buying first)
+    """
+    try:
+        result = compare_cities(request.inputs, request.cities)
+        return result
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"City comparison error: {str(e)}")
+
+
+@router.post("/gradients", response_model=GradientResult)
+async def gradients_endpoint(inputs: CalculatorInputs) -> GradientResult:
+    """Calculate the exact derivative of net benefit for every continuous input.
+
+    Uses forward-mode automatic differentiation, so all derivatives come
+    from a single pass.
+
+    Args:
+        inputs: Calculator input parameters
+
+    Returns:
+        Net benefit and per-input derivatives ranked by local influence
+    """
+    try:
+        result = calculate_gradients(inputs)
+        return result
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Gradient error: {str(e)}")
+
+
 @router.post("/sensitivity", response_model=list[SensitivityResult])
 async def sensitivity_endpoint(inputs: CalculatorInputs) -> list[SensitivityResult]:
     """Calculate sensitivity analysis for tornado chart.
@@ -56,10 +201,258 @@ async def sensitivity_endpoint(inputs: CalculatorInputs) -> list[SensitivityResu
         raise HTTPException(status_code=500, detail=f"Sensitivity analysis error: {str(e)}")
 
 
+@router.post("/sensitivity/custom", response_model=list[SensitivityResult])
+async def custom_sensitivity_endpoint(request: SensitivityRequest) -> list[SensitivityResult]:
+    """Calculate a tornado chart for user-selected variables and deltas.
+
+    Args:
+        request: Calculator inputs and the variables to vary, each with its delta
+
+    Returns:
+        List of sensitivity results sorted by impact
+    """
+    variables = [(v.variable, v.label, v.delta) for v in request.variables]
+
+    try:
+        results = run_sensitivity_analysis(request.inputs, variables)
+        return results
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Sensitivity analysis error: {str(e)}")
+
+
+@router.post("/sensitivity/curves", response_model=list[SensitivityCurve])
+async def sensitivity_curves_endpoint(request: SensitivityCurvesRequest) -> list[SensitivityCurve]:
+    """Calculate net benefit and break-even curves for a spider plot.
+
+    Each variable is evaluated at evenly spaced points across its valid
+    range; every point of every variable is evaluated in one batch.
+
+    Args:
+        request: Calculator inputs, the variables to trace, points per
+            variable and optional ranges
+
+    Returns:
+        One curve per variable
+    """
+    try:
+        results = run_sensitivity_curves(
+            request.inputs, request.variables, request.points, request.ranges
+        )
+        return results
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Sensitivity analysis error: {str(e)}")
+
+
+@router.post("/sensitivity/global", response_model=GlobalSensitivityResult)
+def global_sensitivity_endpoint(
+    request: GlobalSensitivityRequest,
+    samples: int = 1024,
+) -> GlobalSensitivityResult:
+    """Calculate variance-based (Sobol) sensitivity indices.
+
+    Varies every numeric input at once, so interactions between inputs are
+    captured (unlike the one-at-a-time tornado chart). The handler is
+    synchronous so FastAPI runs this CPU-bound work in its threadpool
+    instead of on the event loop.
+
+    Args:
+        request: Calculator inputs and optional (low, high) range per input
+        samples: Draws per Saltelli base matrix (default 1024)
+
+    Returns:
+        First-order and total-effect indices sorted by total effect
+    """
+    if not 64 <= samples <= 8192:
+        raise HTTPException(status_code=400, detail="samples must be between 64 and 8192")
+
+    try:
+        result = run_global_sensitivity(request.inputs, ranges=request.ranges, samples=samples)
+        return result
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Sensitivity analysis error: {str(e)}")
+
+
+@router.post("/grid", response_model=GridResult)
+def grid_endpoint(
+    request: GridRequest,
+    simulations: int = 0,
+    seed: int | None = None,
+) -> GridResult:
+    """Calculate a buy vs. rent heatmap over two inputs.
+
+    Every cell is evaluated together as one vectorized batch. The handler
+    is synchronous so FastAPI runs this CPU-bound work in its threadpool
+    instead of on the event loop.
+
+    Args:
+        request: Calculator inputs and the two inputs to vary, each with a
+            range and number of steps (up to 100 x 100 cells), plus an
+            optional Monte Carlo uncertainty model
+        simulations: Monte Carlo simulations per cell for P(buy wins)
+            (default 0, deterministic matrices only); cells x simulations
+            may not exceed 100,000
+        seed: Optional random seed for reproducibility
+
+    Returns:
+        Net benefit and verdict matrices indexed [y][x], and P(buy wins)
+        per cell when simulations are requested
+    """
+    if simulations and not 10 <= simulations <= 1000:
+        raise HTTPException(status_code=400, detail="simulations must be 0 or between 10 and 1000")
+
+    try:
+        result = evaluate_grid(
+            request.inputs,
+            request.x,
+            request.y,
+            simulations=simulations,
+            seed=seed,
+            std_devs=request.std_devs,
+            correlation=request.correlation,
+        )
+        return result
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Grid error: {str(e)}")
+
+
+@router.post("/solve", response_model=SolveResult)
+async def solve_endpoint(request: SolveRequest) -> SolveResult:
+    """Find the value of one input at which buying and renting tie.
+
+    For example, the highest purchase price at which buying still wins, or
+    the appreciation needed to break even by a given year.
+
+    Args:
+        request: Calculator inputs, the input to solve for, the target
+            ("net_benefit" at the holding period or "break_even" by ``year``)
+            and an optional search range
+
+    Returns:
+        The tie value and whether buying wins above or below it
+    """
+    try:
+        result = solve_for_input(
+            request.inputs,
+            request.variable,
+            target=request.target,
+            year=request.year,
+            low=request.low,
+            high=request.high,
+        )
+        return result
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Solver error: {str(e)}")
+
+
+@router.post("/solve/probability", response_model=ProbabilitySolveResult)
+def solve_probability_endpoint(
+    request: ProbabilitySolveRequest,
+    simulations: int = 1000,
+    seed: int | None = None,
+) -> ProbabilitySolveResult:
+    """Find the value of one input that gives buying a target chance to win.
+
+    For example, the appreciation needed for an 80% chance that buying wins.
+    The handler is synchronous so FastAPI runs this CPU-bound work in its
+    threadpool instead of on the event loop.
+
+    Args:
+        request: Calculator inputs, the input to solve for, the target win
+            probability, an optional search range and uncertainty model
+        simulations: Simulations in the shared sample matrix (default 1000);
+            simulations x values tried x years may not exceed 1,500,000
+        seed: Optional random seed for reproducibility
+
+    Returns:
+        The required value and the win probability at the base value
+    """
+    if simulations < 10:
+        raise HTTPException(status_code=400, detail="simulations must be at least 10")
+
+    try:
+        result = solve_for_probability(
+            request.inputs,
+            request.variable,
+            request.buy_wins_pct,
+            target=request.target,
+            year=request.year,
+            low=request.low,
+            high=request.high,
+            simulations=simulations,
+            seed=seed,
+            std_devs=request.std_devs,
+            correlation=request.correlation,
+        )
+        return result
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Solver error: {str(e)}")
+
+
+@router.post("/optimize", response_model=FinancingResult)
+async def optimize_endpoint(request: FinancingRequest) -> FinancingResult:
+    """Find the best combinations of loan term, down payment and holding period.
+
+    Every combination is evaluated in one batch; only options that no other
+    option beats on both net benefit and monthly cost are returned.
+
+    Args:
+        request: Calculator inputs and optional down payments and holding
+            periods to try (every loan term is always tried)
+
+    Returns:
+        Pareto-optimal options ranked by net benefit within each holding period
+    """
+    try:
+        result = optimize_financing(
+            request.inputs,
+            down_payments=request.down_payments,
+            holding_periods=request.holding_periods,
+        )
+        return result
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Optimization error: {str(e)}")
+
+
 @router.post("/montecarlo", response_model=MonteCarloResult)
 async def montecarlo_endpoint(
     inputs: CalculatorInputs,
     simulations: int = 1000,
+    distribution_format: DistributionFormat = "full",
+    histogram_bins: int = 50,
+    dtype: ComputeDtype = "float64",
+    mode: SimulationMode = "constant",
+    autocorrelation: float = 0.0,
+    block_length: int = 5,
+    method: UncertaintyMethod = "simulation",
+    holding_period: HoldingPeriodMode = "fixed",
 ) -> MonteCarloResult:
     """Run Monte Carlo simulation.
 
@@ -69,19 +462,311 @@ async def montecarlo_endpoint(
     Args:
         inputs: Calculator input parameters
         simulations: Number of simulations to run (default 1000)
+        distribution_format: "full" (default) for every sorted sample, or
+            "histogram", "quantiles" or "sketch" for a fixed-size summary
+        histogram_bins: Number of histogram bins (default 50)
+        dtype: Kernel precision, "float64" (default) or "float32"
+        mode: "constant" (default) draws one rate per simulation;
+            "path" draws a rate for every year; "bootstrap" resamples
+            blocks of historical years
+        autocorrelation: Year-over-year correlation of rates in "path" mode
+        block_length: Years per resampled block in "bootstrap" mode (default 5)
+        method: "simulation" (default) or "moments" for an instant analytic
+            approximation (percentile grid only; sampling options are ignored)
+        holding_period: "fixed" (default) sells at ``holding_period_years``;
+            "empirical" draws each simulation's sale year from a typical
+            owner-tenure distribution with that median
+
+    Returns:
+        Monte Carlo results with statistics and distribution
+    """
+    _check_montecarlo_params(simulations, histogram_bins, autocorrelation)
+
+    try:
+        if method == "moments":
+            return propagate_moments(inputs)
+        weights = None
+        if holding_period == "empirical":
+            weights = tenure_weights(inputs.holding_period_years)
+        result = run_monte_carlo(
+            inputs,
+            simulations=simulations,
+            distribution_format=distribution_format,
+            histogram_bins=histogram_bins,
+            dtype=dtype,
+            mode=mode,
+            autocorrelation=autocorrelation,
+            block_length=block_length,
+            holding_period_weights=weights,
+        )
+        return result
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Monte Carlo error: {str(e)}")
+
+
+@router.post("/montecarlo/correlated", response_model=MonteCarloResult)
+async def correlated_montecarlo_endpoint(
+    request: MonteCarloRequest,
+    simulations: int = 1000,
+    distribution_format: DistributionFormat = "full",
+    histogram_bins: int = 50,
+    dtype: ComputeDtype = "float64",
+    mode: SimulationMode = "constant",
+    autocorrelation: float = 0.0,
+    block_length: int = 5,
+    method: UncertaintyMethod = "simulation",
+) -> MonteCarloResult:
+    """Run Monte Carlo simulation with a custom uncertainty model.
+
+    Any non-integer input (e.g. mortgage_rate, property_tax_rate,
+    maintenance_rate) can be randomized, and the randomized variables can be
+    correlated with each other.
+
+    Args:
+        request: Calculator inputs, standard deviations, correlation matrix,
+            and optional sale-year weights
+        simulations: Number of simulations to run (default 1000)
+        distribution_format: "full" (default) for every sorted sample, or
+            "histogram", "quantiles" or "sketch" for a fixed-size summary
+        histogram_bins: Number of histogram bins (default 50)
+        dtype: Kernel precision, "float64" (default) or "float32"
+        mode: "constant" (default) draws one rate per simulation;
+            "path" draws a rate for every year; "bootstrap" resamples
+            blocks of historical years (no correlation matrix)
+        autocorrelation: Year-over-year correlation of rates in "path" mode
+        block_length: Years per resampled block in "bootstrap" mode (default 5)
+        method: "simulation" (default) or "moments" for an instant analytic
+            approximation (percentile grid only; sampling options are ignored)
 
     Returns:
         Monte Carlo results with statistics and distribution
     """
+    _check_montecarlo_params(simulations, histogram_bins, autocorrelation)
+
+    try:
+        if method == "moments":
+            return propagate_moments(request.inputs, request.std_devs, request.correlation)
+        result = run_monte_carlo(
+            request.inputs,
+            simulations=simulations,
+            std_devs=request.std_devs,
+            distribution_format=distribution_format,
+            histogram_bins=histogram_bins,
+            dtype=dtype,
+            mode=mode,
+            autocorrelation=autocorrelation,
+            block_length=block_length,
+            correlation=request.correlation,
+            holding_period_weights=request.holding_period_weights,
+        )
+        return result
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Monte Carlo error: {str(e)}")
+
+
+@router.post("/montecarlo/fan", response_model=FanChartResult)
+async def fan_chart_endpoint(
+    request: MonteCarloRequest,
+    simulations: int = 1000,
+    dtype: ComputeDtype = "float64",
+    mode: SimulationMode = "constant",
+    autocorrelation: float = 0.0,
+    block_length: int = 5,
+) -> FanChartResult:
+    """Run Monte Carlo simulation and report percentile bands for every year.
+
+    Args:
+        request: Calculator inputs, standard deviations, and correlation matrix
+        simulations: Number of simulations to run (default 1000)
+        dtype: Kernel precision, "float64" (default) or "float32"
+        mode: "constant" (default), "path", or "bootstrap"
+        autocorrelation: Year-over-year correlation of rates in "path" mode
+        block_length: Years per resampled block in "bootstrap" mode (default 5)
+
+    Returns:
+        Per-year wealth and net benefit bands, P(buy ahead), and break-even timing
+    """
+    _check_montecarlo_params(simulations, histogram_bins=1, autocorrelation=autocorrelation)
+
+    try:
+        result = run_fan_chart(
+            request.inputs,
+            simulations=simulations,
+            std_devs=request.std_devs,
+            dtype=dtype,
+            mode=mode,
+            autocorrelation=autocorrelation,
+            correlation=request.correlation,
+            block_length=block_length,
+        )
+        return result
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Monte Carlo error: {str(e)}")
+
+
+@router.post("/montecarlo/compare", response_model=PairedMonteCarloResult)
+async def compare_montecarlo_endpoint(
+    request: CompareRequest,
+    simulations: int = 1000,
+    distribution_format: DistributionFormat = "full",
+    histogram_bins: int = 50,
+    dtype: ComputeDtype = "float64",
+) -> PairedMonteCarloResult:
+    """Compare scenarios A and B under the same random draws.
+
+    Both scenarios see identical market outcomes, so the distribution of
+    their difference reflects only how the scenarios differ.
+
+    Args:
+        request: Scenarios A and B, plus an optional uncertainty model
+        simulations: Number of paired simulations (default 1000)
+        distribution_format: "full" (default) for every sorted difference, or
+            "histogram", "quantiles" or "sketch" for a fixed-size summary
+        histogram_bins: Number of histogram bins (default 50)
+        dtype: Kernel precision, "float64" (default) or "float32"
+
+    Returns:
+        Distribution of A's net benefit minus B's, and P(A beats B)
+    """
+    _check_montecarlo_params(simulations, histogram_bins, autocorrelation=0.0)
+
+    try:
+        result = run_paired_monte_carlo(
+            request.a,
+            request.b,
+            simulations=simulations,
+            std_devs=request.std_devs,
+            correlation=request.correlation,
+            distribution_format=distribution_format,
+            histogram_bins=histogram_bins,
+            dtype=dtype,
+        )
+        return result
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Monte Carlo error: {str(e)}")
+
+
+@router.post("/montecarlo/tailrisk", response_model=TailRiskResult)
+def tail_risk_endpoint(
+    inputs: CalculatorInputs,
+    loss_threshold: float = 100_000,
+    simulations: int = 10_000,
+) -> TailRiskResult:
+    """Estimate the chance of buying trailing renting by more than a threshold.
+
+    Uses importance sampling, so small probabilities come with useful
+    standard errors at modest sample counts. The handler is synchronous so
+    FastAPI runs this CPU-bound work in its threadpool instead of on the
+    event loop.
+
+    Args:
+        inputs: Calculator input parameters
+        loss_threshold: Loss in dollars that defines the tail (default $100k)
+        simulations: Number of importance-sampled draws (default 10000)
+
+    Returns:
+        Tail probability and expected shortfall with standard errors
+    """
+    if simulations < 100:
+        raise HTTPException(status_code=400, detail="Minimum 100 simulations required")
+    if simulations > 100_000:
+        raise HTTPException(status_code=400, detail="Maximum 100000 simulations allowed")
+
+    try:
+        result = estimate_tail_risk(inputs, loss_threshold=loss_threshold, simulations=simulations)
+        return result
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Tail risk error: {str(e)}")
+
+
+@router.post("/montecarlo/multilevel", response_model=MultilevelResult)
+def multilevel_montecarlo_endpoint(
+    inputs: CalculatorInputs,
+    target_std_error: float = 1000.0,
+) -> MultilevelResult:
+    """Estimate the expected net benefit with multilevel Monte Carlo.
+
+    Many cheap annual-step draws plus a few paired monthly corrections reach
+    the requested precision at a fraction of plain Monte Carlo's cost. The
+    handler is synchronous so FastAPI runs this CPU-bound work in its
+    threadpool instead of on the event loop.
+
+    Args:
+        inputs: Calculator input parameters
+        target_std_error: Desired standard error in dollars (default $1,000)
+
+    Returns:
+        Estimate, standard error, and per-level sample allocation;
+        ``target_met`` is false when the achieved standard error is above
+        the target
+    """
+    if target_std_error < 100:
+        raise HTTPException(status_code=400, detail="target_std_error must be at least 100")
+
+    try:
+        result = run_multilevel_monte_carlo(inputs, target_std_error=target_std_error)
+        return result
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Monte Carlo error: {str(e)}")
+
+
+def _check_montecarlo_params(simulations: int, histogram_bins: int, autocorrelation: float) -> None:
+    """Reject out-of-range Monte Carlo query parameters with a 400."""
     if simulations < 10:
         raise HTTPException(status_code=400, detail="Minimum 10 simulations required")
     if simulations > 10000:
         raise HTTPException(status_code=400, detail="Maximum 10000 simulations allowed")
+    if not 1 <= histogram_bins <= 500:
+        raise HTTPException(status_code=400, detail="histogram_bins must be between 1 and 500")
+    if not -1 < autocorrelation < 1:
+        raise HTTPException(
+            status_code=400, detail="autocorrelation must be between -1 and 1 (exclusive)"
+        )
+
 
+@router.post("/backtest", response_model=BacktestResult)
+async def backtest_endpoint(inputs: CalculatorInputs) -> BacktestResult:
+    """Replay the scenario over every rolling window of US history.
+
+    Appreciation, investment return and rent growth come from the realized
+    annual rates of each window instead of the inputs.
+
+    Args:
+        inputs: Calculator input parameters
+
+    Returns:
+        Distribution of net benefit across windows with best and worst start years
+    """
     try:
-        result = run_monte_carlo(inputs, simulations=simulations)
+        result = run_backtest(inputs)
         return result
     except ValidationError as e:
         raise HTTPException(status_code=422, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Monte Carlo error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Backtest error: {str(e)}")
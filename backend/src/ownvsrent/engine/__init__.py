@@ -10,15 +10,39 @@ from ownvsrent.engine.amortization import (
     calculate_payment_breakdown,
     calculate_total_interest,
 )
+from ownvsrent.engine.batch import BatchResults, calculate_batch
 from ownvsrent.engine.calculator import calculate
+from ownvsrent.engine.cities import CITY_PRESETS, compare_cities, get_city_preset
 from ownvsrent.engine.defaults import (
     DEFAULTS,
     get_capital_gains_exemption,
     get_salt_cap,
     get_standard_deduction,
 )
-from ownvsrent.engine.montecarlo import run_monte_carlo
-from ownvsrent.engine.sensitivity import run_sensitivity_analysis
+from ownvsrent.engine.distribution import QuantileDigest
+from ownvsrent.engine.fanchart import run_fan_chart
+from ownvsrent.engine.gradients import Dual, calculate_gradients
+from ownvsrent.engine.grid import evaluate_grid
+from ownvsrent.engine.historical import HistoricalSeries, load_history, run_backtest
+from ownvsrent.engine.horizons import calculate_all_horizons
+from ownvsrent.engine.moments import propagate_moments
+from ownvsrent.engine.montecarlo import (
+    merge_monte_carlo_results,
+    run_monte_carlo,
+    run_paired_monte_carlo,
+    tenure_weights,
+)
+from ownvsrent.engine.multilevel import run_multilevel_monte_carlo
+from ownvsrent.engine.optimize import optimize_financing
+from ownvsrent.engine.sampling import correlation_factor
+from ownvsrent.engine.sensitivity import (
+    run_global_sensitivity,
+    run_sensitivity_analysis,
+    run_sensitivity_curves,
+)
+from ownvsrent.engine.solver import solve_for_input, solve_for_probability
+from ownvsrent.engine.surfaces import SURFACE_AXES, estimate_net_benefit, get_surface
+from ownvsrent.engine.tailrisk import estimate_tail_risk
 from ownvsrent.engine.taxes import (
     calculate_annual_tax_benefit,
     calculate_deductible_mortgage_interest,
@@ -26,26 +50,156 @@ from ownvsrent.engine.taxes import (
     calculate_itemized_deductions,
 )
 from ownvsrent.engine.types import (
+    BacktestResult,
+    BacktestWindow,
     CalculatorInputs,
     CalculatorResults,
+    CityCompareRequest,
+    CityComparison,
+    CityComparisonResult,
+    CityPreset,
+    CompareRequest,
+    ComputeDtype,
+    DistributionFormat,
+    FanChartResult,
+    FanChartYear,
+    FinancingOption,
+    FinancingRequest,
+    FinancingResult,
+    GlobalSensitivityRequest,
+    GlobalSensitivityResult,
+    GradientResult,
+    GridAxis,
+    GridRequest,
+    GridResult,
+    Histogram,
+    HoldingPeriodMode,
+    HorizonOutcome,
+    HorizonsResult,
+    InputGradient,
+    MonteCarloRequest,
     MonteCarloResult,
     MonthlySnapshot,
+    MultilevelLevel,
+    MultilevelResult,
+    NetBenefitEstimate,
+    PairedMonteCarloResult,
+    PercentileBand,
+    ProbabilitySolveRequest,
+    ProbabilitySolveResult,
+    QuantileGrid,
+    QuantileSketch,
+    SensitivityCurve,
+    SensitivityCurvesRequest,
+    SensitivityRequest,
     SensitivityResult,
+    SensitivityVariable,
+    SimulationMode,
+    SobolIndex,
+    SolveRequest,
+    SolveResult,
+    SolveTarget,
+    SolveVariable,
+    TailRiskResult,
+    TimeResolution,
+    UncertaintyMethod,
     YearlySnapshot,
 )
 
 __all__ = [
     # Main calculator
     "calculate",
+    "calculate_batch",
+    "calculate_all_horizons",
+    "BatchResults",
+    # Gradients
+    "calculate_gradients",
+    "Dual",
+    # Heatmap grids & goal seek
+    "evaluate_grid",
+    "solve_for_input",
+    "solve_for_probability",
+    "optimize_financing",
+    # Approximate answers
+    "estimate_net_benefit",
+    "get_surface",
+    "SURFACE_AXES",
+    # Cities
+    "compare_cities",
+    "get_city_preset",
+    "CITY_PRESETS",
     # Sensitivity & Monte Carlo
     "run_sensitivity_analysis",
+    "run_global_sensitivity",
+    "run_sensitivity_curves",
     "run_monte_carlo",
+    "run_paired_monte_carlo",
+    "run_fan_chart",
+    "estimate_tail_risk",
+    "run_multilevel_monte_carlo",
+    "propagate_moments",
+    "merge_monte_carlo_results",
+    "tenure_weights",
+    "correlation_factor",
+    "QuantileDigest",
+    # Historical backtest
+    "run_backtest",
+    "load_history",
+    "HistoricalSeries",
     # Types
+    "BacktestResult",
+    "BacktestWindow",
+    "CompareRequest",
     "CalculatorInputs",
     "CalculatorResults",
+    "CityCompareRequest",
+    "CityComparison",
+    "CityComparisonResult",
+    "CityPreset",
+    "ComputeDtype",
+    "DistributionFormat",
+    "FanChartResult",
+    "FanChartYear",
+    "FinancingOption",
+    "FinancingRequest",
+    "FinancingResult",
+    "GlobalSensitivityRequest",
+    "GlobalSensitivityResult",
+    "GradientResult",
+    "GridAxis",
+    "GridRequest",
+    "GridResult",
+    "Histogram",
+    "HoldingPeriodMode",
+    "HorizonOutcome",
+    "HorizonsResult",
+    "InputGradient",
+    "MonteCarloRequest",
     "MonteCarloResult",
+    "PairedMonteCarloResult",
     "MonthlySnapshot",
+    "MultilevelLevel",
+    "MultilevelResult",
+    "NetBenefitEstimate",
+    "PercentileBand",
+    "ProbabilitySolveRequest",
+    "ProbabilitySolveResult",
+    "QuantileGrid",
+    "QuantileSketch",
+    "SensitivityCurve",
+    "SensitivityCurvesRequest",
+    "SensitivityRequest",
     "SensitivityResult",
+    "SensitivityVariable",
+    "SimulationMode",
+    "SobolIndex",
+    "SolveRequest",
+    "SolveResult",
+    "SolveTarget",
+    "SolveVariable",
+    "TailRiskResult",
+    "TimeResolution",
+    "UncertaintyMethod",
     "YearlySnapshot",
     # Amortization
     "calculate_loan_balance",
@@ -0,0 +1,670 @@
+"""Vectorized evaluation of many scenarios at once.
+
+`calculate()` walks one scenario month by month and records full snapshots.
+This module evaluates a whole batch of scenarios together: every input can be
+shared by the batch or given per scenario, and the monthly recurrences run as
+(scenarios x months) array operations. Only year-end wealth figures are kept,
+which is all that Monte Carlo and sensitivity analysis need.
+
+Results match `calculate()` up to floating-point rounding. A coarse
+"annual" resolution steps the same recurrences a year at a time (about 12x
+cheaper); it approximates the monthly results and is used as the cheap level
+of multilevel Monte Carlo.
+"""
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+
+import numpy as np
+
+from ownvsrent.engine.defaults import (
+    CAP_GAINS_EXEMPTION_MARRIED,
+    CAP_GAINS_EXEMPTION_SINGLE,
+    MIN_OWNERSHIP_YEARS_FOR_EXEMPTION,
+    PMI_LTV_THRESHOLD,
+)
+from ownvsrent.engine.types import CalculatorInputs, ComputeDtype, TimeResolution
+
+# Net benefit above which the verdict is "buy" (see wealth.determine_verdict)
+VERDICT_THRESHOLD = 1000
+
+# Upper bound on elements per (scenarios x months) intermediate array.
+# Batches are processed in row chunks of this size to bound peak memory.
+CHUNK_ELEMENTS = 1 << 18
+
+NUMERIC_FIELDS = tuple(name for name in CalculatorInputs.model_fields if name != "filing_status")
+
+# Rates that may vary year by year: overrides for these can be 2-D
+# (scenarios, years) arrays holding a rate for each simulated year.
+PATH_FIELDS = ("annual_appreciation", "annual_investment_return", "annual_rent_increase")
+
+# Per-year arrays produced by the simulation kernel
+_YEARLY_OUTPUTS = (
+    "sale_proceeds",
+    "buyer_portfolio",
+    "renter_portfolio",
+    "buyer_basis",
+    "renter_basis",
+    "rent_equivalent",
+)
+
+
+@dataclass(frozen=True)
+class BatchResults:
+    """Year-end state for a batch of scenarios.
+
+    Yearly arrays have shape (scenarios, years); column ``y - 1`` holds the
+    value at the end of year ``y``. A simulation's first ``y`` years do not
+    depend on when it ends, so each row covers every holding period up to
+    ``years``.
+    """
+
+    sale_proceeds: np.ndarray
+    buyer_portfolio: np.ndarray
+    renter_portfolio: np.ndarray
+    buyer_basis: np.ndarray
+    renter_basis: np.ndarray
+    rent_equivalent: np.ndarray
+    security_deposit: np.ndarray
+    capital_gains_tax_rate: np.ndarray
+    monthly_ownership_cost: np.ndarray
+    monthly_mortgage_payment: np.ndarray
+    holding_period_years: np.ndarray
+
+    @property
+    def scenarios(self) -> int:
+        """Number of scenarios in the batch."""
+        return self.sale_proceeds.shape[0]
+
+    @property
+    def years(self) -> int:
+        """Number of simulated years."""
+        return self.sale_proceeds.shape[1]
+
+    def _wealth(
+        self, buyer_basis: np.ndarray, renter_basis: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Buyer and renter wealth given portfolio cost bases."""
+        tax_rate = self.capital_gains_tax_rate[:, None]
+        buyer = (
+            self.sale_proceeds
+            + self.buyer_portfolio
+            - np.maximum(self.buyer_portfolio - buyer_basis, 0) * tax_rate
+        )
+        renter = (
+            self.renter_portfolio
+            - np.maximum(self.renter_portfolio - renter_basis, 0) * tax_rate
+            + self.security_deposit[:, None]
+        )
+        return buyer, renter
+
+    @property
+    def buyer_wealth(self) -> np.ndarray:
+        """Buyer wealth if the home is sold at the end of each year."""
+        return self._wealth(self.buyer_basis, self.renter_basis)[0]
+
+    @property
+    def renter_wealth(self) -> np.ndarray:
+        """Renter wealth if the comparison ends at the end of each year."""
+        return self._wealth(self.buyer_basis, self.renter_basis)[1]
+
+    @property
+    def net_benefit(self) -> np.ndarray:
+        """Net benefit (buyer - renter) for a sale at the end of each year.
+
+        Column ``y - 1`` equals ``calculate()``'s ``net_benefit_at_horizon``
+        with ``holding_period_years = y``.
+        """
+        buyer, renter = self._wealth(self.buyer_basis, self.renter_basis)
+        return buyer - renter
+
+    def at_horizon(self, yearly: np.ndarray) -> np.ndarray:
+        """Read a yearly array at each scenario's holding period."""
+        rows = np.arange(yearly.shape[0])
+        return yearly[rows, self.holding_period_years - 1]
+
+    @property
+    def net_benefit_at_horizon(self) -> np.ndarray:
+        """Net benefit at each scenario's holding period."""
+        return self.at_horizon(self.net_benefit)
+
+    def yearly_wealth(self) -> tuple[np.ndarray, np.ndarray]:
+        """Buyer and renter wealth by year as reported in ``calculate()``'s yearly snapshots.
+
+        ``calculate()`` taxes every year's portfolio gains against the cost
+        basis accumulated over the whole holding period, so intermediate years
+        differ slightly from `buyer_wealth` and `renter_wealth`. Years past a
+        scenario's holding period are NaN.
+        """
+        buyer_basis = self.at_horizon(self.buyer_basis)[:, None]
+        renter_basis = self.at_horizon(self.renter_basis)[:, None]
+        buyer, renter = self._wealth(buyer_basis, renter_basis)
+        year_numbers = np.arange(1, self.years + 1)
+        within = year_numbers[None, :] <= self.holding_period_years[:, None]
+        return np.where(within, buyer, np.nan), np.where(within, renter, np.nan)
+
+    def yearly_net_benefit(self) -> np.ndarray:
+        """Net benefit by year as reported in ``calculate()``'s yearly snapshots.
+
+        See `yearly_wealth`; years past a scenario's holding period are NaN.
+        """
+        buyer, renter = self.yearly_wealth()
+        return buyer - renter
+
+    def break_even_years(self) -> np.ndarray:
+        """First year with positive net benefit, or 0 if never within the horizon."""
+        positive = self.yearly_net_benefit() > 0
+        return np.where(positive.any(axis=1), positive.argmax(axis=1) + 1, 0)
+
+    def break_even_by_horizon(self) -> np.ndarray:
+        """Break-even year for every holding period up to ``years``.
+
+        Entry ``[s, h - 1]`` equals `break_even_years` for scenario ``s``
+        held for ``h`` years (0 if never): years up to ``h`` are taxed
+        against the cost bases accumulated by year ``h``. Intermediate
+        arrays are (scenarios x years x years).
+        """
+        tax_rate = self.capital_gains_tax_rate[:, None, None]
+        buyer_portfolio = self.buyer_portfolio[:, None, :]
+        renter_portfolio = self.renter_portfolio[:, None, :]
+        # Axis 1 is the holding period, axis 2 the year
+        buyer = (
+            self.sale_proceeds[:, None, :]
+            + buyer_portfolio
+            - np.maximum(buyer_portfolio - self.buyer_basis[:, :, None], 0) * tax_rate
+        )
+        renter = (
+            renter_portfolio
+            - np.maximum(renter_portfolio - self.renter_basis[:, :, None], 0) * tax_rate
+            + self.security_deposit[:, None, None]
+        )
+        within = np.tri(self.years, dtype=bool)
+        positive = (buyer - renter > 0) & within
+        return np.where(positive.any(axis=2), positive.argmax(axis=2) + 1, 0)
+
+    def verdicts(self) -> np.ndarray:
+        """Verdict at each scenario's holding period."""
+        return verdict_labels(self.net_benefit_at_horizon)
+
+
+def verdict_labels(net_benefit: np.ndarray) -> np.ndarray:
+    """Verdict ("buy", "rent" or "toss-up") for each net benefit."""
+    return np.where(
+        net_benefit > VERDICT_THRESHOLD,
+        "buy",
+        np.where(net_benefit < -VERDICT_THRESHOLD, "rent", "toss-up"),
+    )
+
+
+def calculate_batch(
+    inputs: CalculatorInputs,
+    overrides: Mapping[str, object] | None = None,
+    years: int | None = None,
+    dtype: ComputeDtype = "float64",
+    resolution: TimeResolution = "monthly",
+) -> BatchResults:
+    """Evaluate a batch of scenarios derived from base inputs.
+
+    Args:
+        inputs: Base calculator inputs shared by every scenario
+        overrides: Optional mapping of input name to a 1-D array with one value
+            per scenario (or a scalar). All arrays must have the same length.
+            Fields in PATH_FIELDS also accept (scenarios, years) arrays of
+            per-year rates.
+        years: Years to simulate. Defaults to the longest holding period.
+        dtype: Precision of the (scenarios x months) intermediates. "float32"
+            halves their memory footprint; running sums and year-end wealth
+            stay in float64. Net benefit drifts by a few dollars per scenario
+            relative to "float64".
+        resolution: "monthly" (default) mirrors `calculate()`; "annual" steps
+            a year at a time with mid-year approximations for costs and
+            contributions. The annual model ignores ``dtype``.
+
+    Returns:
+        BatchResults with year-end state for every scenario
+    """
+    params, scenarios = _resolve_parameters(inputs, overrides or {})
+    horizons = params.pop("holding_period_years").astype(np.int64)
+    if years is None:
+        years = int(horizons.max())
+    if horizons.max() > years:
+        raise ValueError("years must cover every scenario's holding period")
+    for name in PATH_FIELDS:
+        if params[name].ndim == 2:
+            if params[name].shape[1] < years:
+                raise ValueError(f"Rate path for {name} is shorter than {years} years")
+            params[name] = params[name][:, :years]
+
+    yearly = {name: np.empty((scenarios, years)) for name in _YEARLY_OUTPUTS}
+    ownership_cost = np.empty(scenarios)
+    mortgage_payment = np.empty(scenarios)
+
+    compute_dtype = np.dtype(dtype)
+    steps_per_year = 12 if resolution == "monthly" else 1
+    chunk = max(1, CHUNK_ELEMENTS // (years * steps_per_year))
+    for start in range(0, scenarios, chunk):
+        rows = slice(start, min(start + chunk, scenarios))
+        chunk_params = {
+            name: values[rows, None] if values.ndim == 1 else values[rows]
+            for name, values in params.items()
+        }
+        if resolution == "annual":
+            chunk_yearly, chunk_cost, chunk_payment = _simulate_annual_chunk(chunk_params, years)
+        else:
+            chunk_yearly, chunk_cost, chunk_payment = _simulate_chunk(
+                chunk_params, years, compute_dtype
+            )
+        for name, values in chunk_yearly.items():
+            yearly[name][rows] = values
+        ownership_cost[rows] = chunk_cost
+        mortgage_payment[rows] = chunk_payment
+
+    return BatchResults(
+        **yearly,
+        security_deposit=params["monthly_rent"] * params["security_deposit"],
+        capital_gains_tax_rate=np.asarray(params["capital_gains_tax_rate"]),
+        monthly_ownership_cost=ownership_cost,
+        monthly_mortgage_payment=mortgage_payment,
+        holding_period_years=horizons,
+    )
+
+
+def _resolve_parameters(
+    inputs: CalculatorInputs, overrides: Mapping[str, object]
+) -> tuple[dict[str, np.ndarray], int]:
+    """Broadcast base inputs and overrides to one array per field."""
+    unknown = set(overrides) - set(CalculatorInputs.model_fields)
+    if unknown:
+        raise ValueError(f"Unknown inputs: {', '.join(sorted(unknown))}")
+
+    arrays = {name: np.asarray(values) for name, values in overrides.items()}
+    for name, values in arrays.items():
+        max_ndim = 2 if name in PATH_FIELDS else 1
+        if values.ndim > max_ndim:
+            raise ValueError(f"Override for {name} has too many dimensions")
+    lengths = {values.shape[0] for values in arrays.values() if values.ndim >= 1}
+    if len(lengths) > 1:
+        raise ValueError("All override arrays must have the same length")
+    scenarios = lengths.pop() if lengths else 1
+
+    filing_status = arrays.pop("filing_status", np.asarray(inputs.filing_status))
+    params = {}
+    for name in NUMERIC_FIELDS:
+        values = np.asarray(arrays.get(name, getattr(inputs, name)), dtype=np.float64)
+        shape = (scenarios, values.shape[1]) if values.ndim == 2 else (scenarios,)
+        params[name] = np.broadcast_to(values, shape)
+    params["capital_gains_exemption"] = np.broadcast_to(
+        np.where(
+            filing_status == "married",
+            float(CAP_GAINS_EXEMPTION_MARRIED),
+            float(CAP_GAINS_EXEMPTION_SINGLE),
+        ),
+        (scenarios,),
+    )
+    return params, scenarios
+
+
+def _simulate_chunk(
+    p: dict[str, np.ndarray], years: int, dtype: np.dtype
+) -> tuple[dict[str, np.ndarray], np.ndarray, np.ndarray]:
+    """Run the monthly recurrences for a chunk of scenarios.
+
+    Every array in ``p`` has shape (rows, 1) so it broadcasts against the
+    (rows, months) grid. Mirrors the arithmetic of `calculate()`.
+
+    Only the (rows, months) arrays are computed in ``dtype``; per-scenario
+    values, running sums, and the year-end wealth arithmetic stay float64.
+
+    Returns:
+        Tuple of (yearly outputs, first-month ownership cost, mortgage payment)
+    """
+    total_months = years * 12
+    months = np.arange(1, total_months + 1, dtype=dtype)[None, :]
+    year_end = np.arange(12, total_months + 1, 12) - 1
+    year_numbers = np.arange(1, years + 1)[None, :]
+
+    def grid(values: np.ndarray) -> np.ndarray:
+        """Cast a per-scenario float64 column for monthly arithmetic."""
+        return values.astype(dtype, copy=False)
+
+    # Derived values
+    price = p["purchase_price"]
+    down_payment = price * p["down_payment_percent"]
+    loan_amount = price - down_payment
+    closing_costs = loan_amount * p["buyer_closing_costs_percent"]
+
+    # === MORTGAGE ===
+    num_payments = p["loan_term_years"] * 12
+    monthly_rate = p["mortgage_rate"] / 12
+    payment, _, _ = _mortgage_terms(loan_amount, monthly_rate, num_payments)
+
+    def amortization_schedule(
+        loan_amount: np.ndarray, monthly_rate: np.ndarray, num_payments: np.ndarray
+    ) -> np.ndarray:
+        """Loan balance after each month."""
+        payment, growth_n, denominator = _mortgage_terms(loan_amount, monthly_rate, num_payments)
+        balance = np.where(
+            months >= grid(num_payments),
+            0,
+            grid(loan_amount / denominator)
+            * (grid(growth_n) - _compound(np.log1p(monthly_rate), months)),
+        )
+        balance = np.where(
+            grid(monthly_rate == 0), grid(loan_amount) - grid(payment) * months, balance
+        )
+        return np.maximum(balance, 0)
+
+    def compounding(annual_rates: np.ndarray) -> np.ndarray:
+        return _monthly_compounding(annual_rates, months)
+
+    # One schedule per distinct loan (e.g. per mortgage rate in a grid)
+    balance = _per_distinct_row(amortization_schedule, loan_amount, monthly_rate, num_payments)
+
+    # === BUYER COSTS ===
+    home_value = grid(price) * _per_distinct_row(compounding, p["annual_appreciation"])
+    pmi = np.where(
+        balance / home_value > PMI_LTV_THRESHOLD,
+        grid(loan_amount * p["pmi_rate"] / 12),
+        0,
+    )
+    value_based_rate = (
+        p["property_tax_rate"] + p["home_insurance_rate"] + p["maintenance_rate"]
+    ) / 12
+    buyer_cost = grid(payment + p["hoa_monthly"]) + home_value * grid(value_based_rate) + pmi
+
+    # === RENTER COSTS ===
+    base_rent = p["monthly_rent"]
+    rent = grid(base_rent) * _per_distinct_row(
+        lambda rates: _annual_step_growth(rates, months), p["annual_rent_increase"]
+    )
+    renter_cost = rent + grid(p["renter_insurance"])
+
+    # === PORTFOLIOS ===
+    # Whoever has the cheaper month invests the difference
+    monthly_difference = buyer_cost - renter_cost
+    renter_contribution = np.maximum(monthly_difference, 0)
+    buyer_contribution = np.maximum(-monthly_difference, 0)
+
+    renter_initial = down_payment + closing_costs - base_rent * p["broker_fee"]
+    growth = _per_distinct_row(compounding, p["annual_investment_return"])
+
+    renter_portfolio = _grow_portfolio(renter_initial, renter_contribution, growth, years)
+    buyer_portfolio = _grow_portfolio(np.zeros_like(price), buyer_contribution, growth, years)
+
+    # === YEAR-END STATE ===
+    value = home_value[:, year_end].astype(np.float64)
+    remaining = balance[:, year_end].astype(np.float64)
+    selling_costs = value * p["selling_costs_percent"]
+    gain = value - price
+    taxable_gain = np.where(
+        year_numbers >= MIN_OWNERSHIP_YEARS_FOR_EXEMPTION,
+        np.maximum(gain - p["capital_gains_exemption"], 0),
+        gain,
+    )
+    cap_gains_tax = np.where(gain > 0, taxable_gain * p["capital_gains_tax_rate"], 0.0)
+    net_proceeds = value - remaining - selling_costs
+
+    # Rent equivalent: (all ownership outflows - net sale proceeds) / months held
+    outflow = _cumulative_at(buyer_cost, years) + down_payment + closing_costs
+
+    yearly = {
+        "sale_proceeds": net_proceeds - cap_gains_tax,
+        "buyer_portfolio": buyer_portfolio,
+        "renter_portfolio": renter_portfolio,
+        "buyer_basis": _cumulative_at(buyer_contribution, years),
+        "renter_basis": renter_initial + _cumulative_at(renter_contribution, years),
+        "rent_equivalent": (outflow - net_proceeds) / (year_numbers * 12),
+    }
+    return yearly, buyer_cost[:, 0], payment[:, 0]
+
+
+def _simulate_annual_chunk(
+    p: dict[str, np.ndarray], years: int
+) -> tuple[dict[str, np.ndarray], np.ndarray, np.ndarray]:
+    """Step the recurrences of `_simulate_chunk` one year at a time.
+
+    Value-based costs and PMI use mid-year home value and loan balance, rent
+    steps yearly exactly as in the monthly model, and each year's portfolio
+    contribution earns the average growth of a monthly contribution stream.
+    Year-end balances and home values are exact.
+
+    Returns:
+        Tuple of (yearly outputs, first-month ownership cost, mortgage payment)
+    """
+    rows = p["purchase_price"].shape[0]
+    year_numbers = np.arange(1, years + 1)[None, :]
+
+    def per_year(rates: np.ndarray) -> np.ndarray:
+        return np.broadcast_to(rates, (rows, years))
+
+    # Derived values
+    price = p["purchase_price"]
+    down_payment = price * p["down_payment_percent"]
+    loan_amount = price - down_payment
+    closing_costs = loan_amount * p["buyer_closing_costs_percent"]
+
+    # === MORTGAGE ===
+    num_payments = p["loan_term_years"] * 12
+    monthly_rate = p["mortgage_rate"] / 12
+    payment, growth_n, denominator = _mortgage_terms(loan_amount, monthly_rate, num_payments)
+
+    def balance_after(months: np.ndarray) -> np.ndarray:
+        amortizing = loan_amount / denominator * (growth_n - (1 + monthly_rate) ** months)
+        balance = np.where(monthly_rate == 0, loan_amount - payment * months, amortizing)
+        return np.maximum(np.where(months >= num_payments, 0, balance), 0)
+
+    year_end_months = 12 * year_numbers
+
+    # === BUYER COSTS ===
+    appreciation = np.log1p(per_year(p["annual_appreciation"]))
+    value_growth = np.cumsum(appreciation, axis=1)
+    value = price * np.exp(value_growth)
+    mid_year_value = price * np.exp(value_growth - appreciation / 2)
+    pmi = np.where(
+        balance_after(year_end_months - 6) / mid_year_value > PMI_LTV_THRESHOLD,
+        loan_amount * p["pmi_rate"],
+        0,
+    )
+    value_based_rate = p["property_tax_rate"] + p["home_insurance_rate"] + p["maintenance_rate"]
+    buyer_cost = 12 * (payment + p["hoa_monthly"]) + mid_year_value * value_based_rate + pmi
+
+    # === RENTER COSTS ===
+    base_rent = p["monthly_rent"]
+    rent_growth = np.log1p(per_year(p["annual_rent_increase"]))
+    rent = base_rent * np.exp(np.cumsum(rent_growth, axis=1) - rent_growth)
+    renter_cost = 12 * (rent + p["renter_insurance"])
+
+    # === PORTFOLIOS ===
+    annual_difference = buyer_cost - renter_cost
+    renter_contribution = np.maximum(annual_difference, 0)
+    buyer_contribution = np.maximum(-annual_difference, 0)
+
+    renter_initial = down_payment + closing_costs - base_rent * p["broker_fee"]
+    growth = 1 + per_year(p["annual_investment_return"])
+    # A contribution made in month m grows for 12 - m months: 5.5 on average
+    contribution_growth = growth ** (5.5 / 12)
+
+    renter_portfolio = np.empty((rows, years))
+    buyer_portfolio = np.empty((rows, years))
+    renter_balance = np.maximum(renter_initial[:, 0], 0)
+    buyer_balance = np.zeros(rows)
+    for year in range(years):
+        renter_balance = (
+            renter_balance * growth[:, year]
+            + renter_contribution[:, year] * contribution_growth[:, year]
+        )
+        buyer_balance = (
+            buyer_balance * growth[:, year]
+            + buyer_contribution[:, year] * contribution_growth[:, year]
+        )
+        renter_portfolio[:, year] = renter_balance
+        buyer_portfolio[:, year] = buyer_balance
+
+    # === YEAR-END STATE ===
+    remaining = balance_after(year_end_months)
+    selling_costs = value * p["selling_costs_percent"]
+    gain = value - price
+    taxable_gain = np.where(
+        year_numbers >= MIN_OWNERSHIP_YEARS_FOR_EXEMPTION,
+        np.maximum(gain - p["capital_gains_exemption"], 0),
+        gain,
+    )
+    cap_gains_tax = np.where(gain > 0, taxable_gain * p["capital_gains_tax_rate"], 0.0)
+    net_proceeds = value - remaining - selling_costs
+
+    outflow = np.cumsum(buyer_cost, axis=1) + down_payment + closing_costs
+    first_month_value = price * np.exp(appreciation[:, :1] / 12)
+    first_month_cost = (
+        payment + p["hoa_monthly"] + first_month_value * value_based_rate / 12 + pmi[:, :1] / 12
+    )
+
+    yearly = {
+        "sale_proceeds": net_proceeds - cap_gains_tax,
+        "buyer_portfolio": buyer_portfolio,
+        "renter_portfolio": renter_portfolio,
+        "buyer_basis": np.cumsum(buyer_contribution, axis=1),
+        "renter_basis": renter_initial + np.cumsum(renter_contribution, axis=1),
+        "rent_equivalent": (outflow - net_proceeds) / (year_numbers * 12),
+    }
+    return yearly, first_month_cost[:, 0], payment[:, 0]
+
+
+def _per_distinct_row(compute: Callable[..., np.ndarray], *columns: np.ndarray) -> np.ndarray:
+    """Evaluate a (rows, months) computation once per distinct row of its inputs.
+
+    Scenarios in a batch often share inputs: Monte Carlo rarely randomizes
+    the mortgage, and a grid sweep varies only two inputs. When every row
+    agrees the result is a single (1, months) row that broadcasts against the
+    batch; when few rows are distinct they are computed once and gathered.
+
+    Args:
+        compute: Function of the columns returning one row per input row
+        columns: Per-scenario inputs, each of shape (rows, 1) or (rows, years)
+
+    Returns:
+        Array with one row per scenario, or a single broadcastable row
+    """
+    rows = max(column.shape[0] for column in columns)
+    columns = [np.broadcast_to(column, (rows, column.shape[1])) for column in columns]
+    keys = np.hstack(columns)
+    if rows == 1 or np.all(keys == keys[:1]):
+        return compute(*(column[:1] for column in columns))
+
+    distinct, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    if len(distinct) > rows // 2:
+        return compute(*columns)
+    computed = compute(*(column[first] for column in columns))
+    return computed[inverse.ravel()]
+
+
+def _mortgage_terms(
+    loan_amount: np.ndarray, monthly_rate: np.ndarray, num_payments: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Monthly payment plus the terms of the closed-form balance.
+
+    Returns:
+        Tuple of (payment, (1 + r)^n, (1 + r)^n - 1), where the last is
+        replaced by 1 for zero-rate loans so it can be divided by safely
+    """
+    zero_rate = monthly_rate == 0
+    growth_n = (1 + monthly_rate) ** num_payments
+    denominator = np.where(zero_rate, 1.0, growth_n - 1)
+    payment = np.where(
+        zero_rate,
+        loan_amount / num_payments,
+        loan_amount * ((monthly_rate * growth_n) / denominator),
+    )
+    return payment, growth_n, denominator
+
+
+def _compound(log_factor: np.ndarray, exponents: np.ndarray) -> np.ndarray:
+    """Raise per-scenario growth factors to a grid of powers.
+
+    Computed as ``exp(exponent * log(factor))`` with the logarithm taken in
+    float64, so low-precision grids don't amplify the rounding of ``1 + r``.
+
+    Args:
+        log_factor: ``log(1 + rate)`` per scenario, float64 shape (rows, 1)
+        exponents: Powers to raise to, shape (1, months), in the compute dtype
+
+    Returns:
+        Array of shape (rows, months) in the dtype of ``exponents``
+    """
+    return np.exp(exponents * log_factor.astype(exponents.dtype, copy=False))
+
+
+def _monthly_compounding(annual_rates: np.ndarray, months: np.ndarray) -> np.ndarray:
+    """Growth through each month of an annual rate compounded monthly.
+
+    Args:
+        annual_rates: Shape (rows, 1) for a constant rate, or (rows, years)
+            for a rate per simulated year
+        months: Month numbers, shape (1, months), in the compute dtype
+
+    Returns:
+        Cumulative growth factor at the end of each month, shape (rows, months)
+    """
+    log_monthly = np.log1p(annual_rates) / 12
+    if log_monthly.shape[1] == 1:
+        return _compound(log_monthly, months)
+
+    rows, years = log_monthly.shape
+    # Log growth accumulated before each year starts, then months within it
+    year_start = np.cumsum(log_monthly, axis=1) * 12 - log_monthly * 12
+    within_year = np.arange(1, 13, dtype=months.dtype)
+    exponent = (
+        year_start.astype(months.dtype)[:, :, None]
+        + log_monthly.astype(months.dtype)[:, :, None] * within_year
+    )
+    return np.exp(exponent).reshape(rows, years * 12)
+
+
+def _annual_step_growth(annual_rates: np.ndarray, months: np.ndarray) -> np.ndarray:
+    """Growth of an amount that steps up once a year (at months 13, 25, ...).
+
+    Args:
+        annual_rates: Shape (rows, 1) for a constant rate, or (rows, years)
+            for a rate per simulated year
+        months: Month numbers, shape (1, months), in the compute dtype
+
+    Returns:
+        Growth factor in effect during each month, shape (rows, months)
+    """
+    log_annual = np.log1p(annual_rates)
+    if log_annual.shape[1] == 1:
+        return _compound(log_annual, (months - 1) // 12)
+
+    year_start = np.cumsum(log_annual, axis=1) - log_annual
+    return np.repeat(np.exp(year_start).astype(months.dtype), 12, axis=1)
+
+
+def _cumulative_at(monthly: np.ndarray, years: int) -> np.ndarray:
+    """Running float64 sum of a (rows, months) array at each year end."""
+    annual = monthly.reshape(monthly.shape[0], years, 12).sum(axis=2, dtype=np.float64)
+    return np.cumsum(annual, axis=1)
+
+
+def _grow_portfolio(
+    initial: np.ndarray, contributions: np.ndarray, growth: np.ndarray, years: int
+) -> np.ndarray:
+    """Compound a portfolio with monthly contributions.
+
+    Vectorized form of repeatedly applying `renting.grow_portfolio`:
+    ``value = max(0, value * (1 + r) + contribution)``. Contributions are never
+    negative, so the floor at zero can only bind in the first month (when the
+    initial value is negative); afterwards the recurrence is linear and
+    solved with a discounted running sum.
+
+    Args:
+        initial: Starting value, shape (rows, 1)
+        contributions: Monthly contributions, shape (rows, months)
+        growth: Cumulative growth factor through each month, shape (rows, months)
+        years: Number of years covered by the months axis
+
+    Returns:
+        Portfolio value at the end of each year, shape (rows, years)
+    """
+    first = np.maximum(initial * growth[:, :1] + contributions[:, :1], 0)
+    discounted = contributions / growth
+    discounted[:, 0] = first[:, 0] / growth[:, 0]
+    return _cumulative_at(discounted, years) * growth[:, 11::12]
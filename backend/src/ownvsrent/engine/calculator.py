@@ -4,6 +4,9 @@ This module runs the month-by-month simulation comparing renting vs buying,
 producing detailed snapshots and final wealth comparison.
 """
 
+from collections.abc import Iterator, Mapping
+from typing import Any
+
 from ownvsrent.engine.amortization import (
     calculate_loan_balance,
     calculate_monthly_payment,
@@ -42,51 +45,50 @@ from ownvsrent.engine.wealth import (
 )
 
 
-def calculate(inputs: CalculatorInputs) -> CalculatorResults:
-    """Run the full rent vs buy calculation.
-
-    Performs month-by-month simulation for the holding period, tracking:
-    - Monthly costs for both scenarios
-    - Portfolio growth for both parties
-    - Tax benefits from homeownership
-    - Final wealth comparison
+def purchase_costs(params: Mapping[str, Any]) -> tuple[Any, Any, Any]:
+    """Down payment, loan amount and buyer closing costs.
 
     Args:
-        inputs: Calculator inputs
+        params: Calculator inputs by field name (values may be Duals)
 
     Returns:
-        Complete calculation results with snapshots and verdict
+        Tuple of (down_payment, loan_amount, buyer_closing_costs)
     """
-    # Derived values
-    down_payment = inputs.purchase_price * inputs.down_payment_percent
-    loan_amount = inputs.purchase_price - down_payment
-    buyer_closing_costs = loan_amount * inputs.buyer_closing_costs_percent
-    total_months = inputs.holding_period_years * 12
-    monthly_investment_return = (1 + inputs.annual_investment_return) ** (1 / 12) - 1
+    down_payment = params["purchase_price"] * params["down_payment_percent"]
+    loan_amount = params["purchase_price"] - down_payment
+    buyer_closing_costs = loan_amount * params["buyer_closing_costs_percent"]
+    return down_payment, loan_amount, buyer_closing_costs
+
+
+def simulate_months(params: Mapping[str, Any]) -> Iterator[dict[str, Any]]:
+    """Run the month-by-month simulation of both scenarios.
+
+    Only uses arithmetic and comparisons on the continuous inputs, so
+    `gradients.Dual` values pass through unchanged.
+
+    Args:
+        params: Calculator inputs by field name (values may be Duals)
+
+    Yields:
+        State of both scenarios after each month of the holding period
+    """
+    down_payment, loan_amount, buyer_closing_costs = purchase_costs(params)
+    total_months = params["holding_period_years"] * 12
+    monthly_investment_return = (1 + params["annual_investment_return"]) ** (1 / 12) - 1
 
     # Monthly mortgage payment (P&I)
     mortgage_payment = calculate_monthly_payment(
         principal=loan_amount,
-        annual_rate=inputs.mortgage_rate,
-        term_years=inputs.loan_term_years,
-    )
-
-    # Find PMI removal month
-    pmi_removed_month = find_pmi_removal_month(
-        loan_amount=loan_amount,
-        purchase_price=inputs.purchase_price,
-        mortgage_rate=inputs.mortgage_rate,
-        loan_term_years=inputs.loan_term_years,
-        annual_appreciation=inputs.annual_appreciation,
-        down_payment_percent=inputs.down_payment_percent,
+        annual_rate=params["mortgage_rate"],
+        term_years=params["loan_term_years"],
     )
 
     # Initial portfolios
     renter_initial = calculate_renter_initial_investment(
         down_payment=down_payment,
         closing_costs=buyer_closing_costs,
-        security_deposit=inputs.monthly_rent * inputs.security_deposit,
-        broker_fee=inputs.monthly_rent * inputs.broker_fee,
+        security_deposit=params["monthly_rent"] * params["security_deposit"],
+        broker_fee=params["monthly_rent"] * params["broker_fee"],
     )
     renter_portfolio = renter_initial
     renter_contributions = renter_initial
@@ -94,74 +96,62 @@ def calculate(inputs: CalculatorInputs) -> CalculatorResults:
     buyer_portfolio = 0.0
     buyer_contributions = 0.0
 
-    # Track monthly and yearly data
-    monthly_snapshots: list[MonthlySnapshot] = []
-    yearly_data: dict[int, dict] = {}
-
-    # Month-by-month simulation
     for month in range(1, total_months + 1):
-        year = (month - 1) // 12 + 1
-        tax_year = 2025 + year  # Assuming calculation starts in 2026
-
         # === RENTER CALCULATIONS ===
         rent = calculate_monthly_rent(
-            base_rent=inputs.monthly_rent,
+            base_rent=params["monthly_rent"],
             month=month,
-            annual_rent_increase=inputs.annual_rent_increase,
+            annual_rent_increase=params["annual_rent_increase"],
         )
         renter_cost = calculate_renter_monthly_cost(
             rent=rent,
-            renter_insurance=inputs.renter_insurance,
+            renter_insurance=params["renter_insurance"],
         )
 
         # === BUYER CALCULATIONS ===
         home_value = calculate_home_value(
-            purchase_price=inputs.purchase_price,
+            purchase_price=params["purchase_price"],
             month=month,
-            annual_appreciation=inputs.annual_appreciation,
+            annual_appreciation=params["annual_appreciation"],
         )
         loan_balance = calculate_loan_balance(
             principal=loan_amount,
-            annual_rate=inputs.mortgage_rate,
-            term_years=inputs.loan_term_years,
+            annual_rate=params["mortgage_rate"],
+            term_years=params["loan_term_years"],
             month=month,
         )
         principal, interest = calculate_payment_breakdown(
             principal=loan_amount,
-            annual_rate=inputs.mortgage_rate,
-            term_years=inputs.loan_term_years,
+            annual_rate=params["mortgage_rate"],
+            term_years=params["loan_term_years"],
             month=month,
         )
         property_tax = calculate_property_tax(
             home_value=home_value,
-            property_tax_rate=inputs.property_tax_rate,
+            property_tax_rate=params["property_tax_rate"],
         )
         home_insurance = calculate_home_insurance(
             home_value=home_value,
-            home_insurance_rate=inputs.home_insurance_rate,
+            home_insurance_rate=params["home_insurance_rate"],
         )
         maintenance = calculate_maintenance(
             home_value=home_value,
-            maintenance_rate=inputs.maintenance_rate,
+            maintenance_rate=params["maintenance_rate"],
         )
         pmi = calculate_pmi(
             loan_balance=loan_balance,
             home_value=home_value,
             original_loan_amount=loan_amount,
-            pmi_rate=inputs.pmi_rate,
+            pmi_rate=params["pmi_rate"],
         )
         buyer_cost = calculate_buyer_monthly_cost(
             mortgage_payment=mortgage_payment,
             property_tax=property_tax,
             home_insurance=home_insurance,
             maintenance=maintenance,
-            hoa=inputs.hoa_monthly,
+            hoa=params["hoa_monthly"],
             pmi=pmi,
         )
-        home_equity = calculate_home_equity(
-            home_value=home_value,
-            loan_balance=loan_balance,
-        )
 
         # === PORTFOLIO UPDATES ===
         # Both parties invest their monthly savings (fair comparison)
@@ -190,6 +180,125 @@ def calculate(inputs: CalculatorInputs) -> CalculatorResults:
         )
         buyer_contributions += buyer_contribution
 
+        yield {
+            "month": month,
+            "rent": rent,
+            "renter_cost": renter_cost,
+            "renter_portfolio": renter_portfolio,
+            "renter_contributions": renter_contributions,
+            "mortgage_payment": mortgage_payment,
+            "principal": principal,
+            "interest": interest,
+            "property_tax": property_tax,
+            "home_insurance": home_insurance,
+            "maintenance": maintenance,
+            "pmi": pmi,
+            "buyer_cost": buyer_cost,
+            "loan_balance": loan_balance,
+            "home_value": home_value,
+            "home_equity": calculate_home_equity(
+                home_value=home_value,
+                loan_balance=loan_balance,
+            ),
+            "buyer_portfolio": buyer_portfolio,
+            "buyer_contributions": buyer_contributions,
+        }
+
+
+def wealth_at_sale(
+    params: Mapping[str, Any],
+    state: Mapping[str, Any],
+    years_owned: int,
+    buyer_cost_basis: Any,
+    renter_cost_basis: Any,
+) -> tuple[Any, Any]:
+    """Wealth of both parties if the home is sold at a month's end.
+
+    Args:
+        params: Calculator inputs by field name (values may be Duals)
+        state: Month state from `simulate_months`
+        years_owned: Years since purchase
+        buyer_cost_basis: Buyer's total portfolio contributions
+        renter_cost_basis: Renter's total portfolio contributions
+
+    Returns:
+        Tuple of (buyer_wealth, renter_wealth)
+    """
+    selling_costs = calculate_selling_costs(
+        sale_price=state["home_value"],
+        selling_costs_percent=params["selling_costs_percent"],
+    )
+
+    buyer_sale_proceeds = calculate_home_sale_proceeds(
+        sale_price=state["home_value"],
+        loan_balance=state["loan_balance"],
+        selling_costs=selling_costs,
+        purchase_price=params["purchase_price"],
+        capital_gains_tax_rate=params["capital_gains_tax_rate"],
+        filing_status=params["filing_status"],
+        years_owned=years_owned,
+    )
+
+    buyer_wealth = calculate_buyer_final_wealth(
+        home_sale_proceeds=buyer_sale_proceeds,
+        investment_portfolio=state["buyer_portfolio"],
+        portfolio_cost_basis=buyer_cost_basis,
+        capital_gains_tax_rate=params["capital_gains_tax_rate"],
+    )
+
+    security_deposit_returned = params["monthly_rent"] * params["security_deposit"]
+    renter_wealth = calculate_renter_final_wealth(
+        investment_portfolio=state["renter_portfolio"],
+        portfolio_cost_basis=renter_cost_basis,
+        capital_gains_tax_rate=params["capital_gains_tax_rate"],
+        security_deposit_returned=security_deposit_returned,
+    )
+
+    return buyer_wealth, renter_wealth
+
+
+def calculate(inputs: CalculatorInputs) -> CalculatorResults:
+    """Run the full rent vs buy calculation.
+
+    Performs month-by-month simulation for the holding period, tracking:
+    - Monthly costs for both scenarios
+    - Portfolio growth for both parties
+    - Tax benefits from homeownership
+    - Final wealth comparison
+
+    Args:
+        inputs: Calculator inputs
+
+    Returns:
+        Complete calculation results with snapshots and verdict
+    """
+    params = dict(inputs)
+
+    # Derived values
+    down_payment, loan_amount, buyer_closing_costs = purchase_costs(params)
+    total_months = inputs.holding_period_years * 12
+
+    # Find PMI removal month
+    pmi_removed_month = find_pmi_removal_month(
+        loan_amount=loan_amount,
+        purchase_price=inputs.purchase_price,
+        mortgage_rate=inputs.mortgage_rate,
+        loan_term_years=inputs.loan_term_years,
+        annual_appreciation=inputs.annual_appreciation,
+        down_payment_percent=inputs.down_payment_percent,
+    )
+
+    # Track monthly and yearly data
+    monthly_snapshots: list[MonthlySnapshot] = []
+    yearly_data: dict[int, dict] = {}
+    year_end_states: list[dict] = []
+
+    # Month-by-month simulation
+    for state in simulate_months(params):
+        year = (state["month"] - 1) // 12 + 1
+        if state["month"] % 12 == 0:
+            year_end_states.append(state)
+
         # === TRACK YEARLY DATA ===
         if year not in yearly_data:
             yearly_data[year] = {
@@ -200,36 +309,41 @@ def calculate(inputs: CalculatorInputs) -> CalculatorResults:
                 "pmi": 0,
             }
 
-        yearly_data[year]["total_rent_paid"] += renter_cost
-        yearly_data[year]["total_buy_cost_paid"] += buyer_cost
-        yearly_data[year]["mortgage_interest"] += interest
-        yearly_data[year]["property_tax"] += property_tax
-        yearly_data[year]["pmi"] += pmi
+        yearly_data[year]["total_rent_paid"] += state["renter_cost"]
+        yearly_data[year]["total_buy_cost_paid"] += state["buyer_cost"]
+        yearly_data[year]["mortgage_interest"] += state["interest"]
+        yearly_data[year]["property_tax"] += state["property_tax"]
+        yearly_data[year]["pmi"] += state["pmi"]
 
         # Store snapshot
         monthly_snapshots.append(
             MonthlySnapshot(
-                month=month,
-                rent=rent,
+                month=state["month"],
+                rent=state["rent"],
                 renter_insurance=inputs.renter_insurance,
-                total_rent_cost=renter_cost,
-                renter_portfolio=renter_portfolio,
-                mortgage_payment=mortgage_payment,
-                principal=principal,
-                interest=interest,
-                property_tax=property_tax,
-                home_insurance=home_insurance,
-                maintenance=maintenance,
+                total_rent_cost=state["renter_cost"],
+                renter_portfolio=state["renter_portfolio"],
+                mortgage_payment=state["mortgage_payment"],
+                principal=state["principal"],
+                interest=state["interest"],
+                property_tax=state["property_tax"],
+                home_insurance=state["home_insurance"],
+                maintenance=state["maintenance"],
                 hoa=inputs.hoa_monthly,
-                pmi=pmi,
-                total_buy_cost=buyer_cost,
-                loan_balance=loan_balance,
-                home_value=home_value,
-                home_equity=home_equity,
-                buyer_portfolio=buyer_portfolio,
+                pmi=state["pmi"],
+                total_buy_cost=state["buyer_cost"],
+                loan_balance=state["loan_balance"],
+                home_value=state["home_value"],
+                home_equity=state["home_equity"],
+                buyer_portfolio=state["buyer_portfolio"],
             )
         )
 
+    final_state = year_end_states[-1]
+    mortgage_payment = final_state["mortgage_payment"]
+    buyer_contributions = final_state["buyer_contributions"]
+    renter_contributions = final_state["renter_contributions"]
+
     # === YEARLY SNAPSHOTS WITH TAX BENEFITS ===
     yearly_snapshots: list[YearlySnapshot] = []
     cumulative_rent = 0.0
@@ -264,34 +378,12 @@ def calculate(inputs: CalculatorInputs) -> CalculatorResults:
         )
 
         # Calculate wealth at this point
-        selling_costs = calculate_selling_costs(
-            sale_price=eoy_snapshot.home_value,
-            selling_costs_percent=inputs.selling_costs_percent,
-        )
-
-        buyer_sale_proceeds = calculate_home_sale_proceeds(
-            sale_price=eoy_snapshot.home_value,
-            loan_balance=eoy_snapshot.loan_balance,
-            selling_costs=selling_costs,
-            purchase_price=inputs.purchase_price,
-            capital_gains_tax_rate=inputs.capital_gains_tax_rate,
-            filing_status=inputs.filing_status,
+        buyer_wealth, renter_wealth = wealth_at_sale(
+            params,
+            year_end_states[year - 1],
             years_owned=year,
-        )
-
-        buyer_wealth = calculate_buyer_final_wealth(
-            home_sale_proceeds=buyer_sale_proceeds,
-            investment_portfolio=eoy_snapshot.buyer_portfolio,
-            portfolio_cost_basis=buyer_contributions,
-            capital_gains_tax_rate=inputs.capital_gains_tax_rate,
-        )
-
-        security_deposit_returned = inputs.monthly_rent * inputs.security_deposit
-        renter_wealth = calculate_renter_final_wealth(
-            investment_portfolio=eoy_snapshot.renter_portfolio,
-            portfolio_cost_basis=renter_contributions,
-            capital_gains_tax_rate=inputs.capital_gains_tax_rate,
-            security_deposit_returned=security_deposit_returned,
+            buyer_cost_basis=buyer_contributions,
+            renter_cost_basis=renter_contributions,
         )
 
         net_benefit = buyer_wealth - renter_wealth
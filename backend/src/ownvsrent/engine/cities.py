@@ -0,0 +1,362 @@
+"""City presets and cross-city comparison.
+
+``CITY_PRESETS`` is a copy of the frontend's presets in
+frontend/src/data/cities.ts, which the frontend still reads from; a change
+to one must be made to both (tests/engine/test_cities.py checks that they
+match).
+
+Presets set only the location-specific inputs. A comparison overlays them
+onto the user's own inputs (down payment, horizon, rates, tax situation)
+and evaluates every city as one row of a single batch.
+"""
+
+import numpy as np
+
+from ownvsrent.engine.batch import calculate_batch, verdict_labels
+from ownvsrent.engine.types import (
+    CalculatorInputs,
+    CityComparison,
+    CityComparisonResult,
+    CityPreset,
+)
+
+# Inputs set by a city preset; every other input comes from the user
+LOCATION_FIELDS = (
+    "monthly_rent",
+    "purchase_price",
+    "property_tax_rate",
+    "home_insurance_rate",
+    "hoa_monthly",
+    "state_tax_rate",
+)
+
+# Mirrored copy of CITY_PRESETS in frontend/src/data/cities.ts
+CITY_PRESETS = (
+    CityPreset(
+        name="National Average",
+        slug="national",
+        monthly_rent=2000,
+        purchase_price=400_000,
+        property_tax_rate=0.011,
+        home_insurance_rate=0.005,
+        hoa_monthly=0,
+        state_tax_rate=0.05,
+    ),
+    CityPreset(
+        name="San Francisco",
+        slug="san-francisco",
+        monthly_rent=3200,
+        purchase_price=1_100_000,
+        property_tax_rate=0.0118,
+        home_insurance_rate=0.003,
+        hoa_monthly=600,
+        state_tax_rate=0.093,
+    ),
+    CityPreset(
+        name="New York City",
+        slug="new-york",
+        monthly_rent=3800,
+        purchase_price=750_000,
+        property_tax_rate=0.009,
+        home_insurance_rate=0.004,
+        hoa_monthly=900,
+        state_tax_rate=0.0685,
+    ),
+    CityPreset(
+        name="Los Angeles",
+        slug="los-angeles",
+        monthly_rent=2800,
+        purchase_price=850_000,
+        property_tax_rate=0.0118,
+        home_insurance_rate=0.004,
+        hoa_monthly=400,
+        state_tax_rate=0.093,
+    ),
+    CityPreset(
+        name="Seattle",
+        slug="seattle",
+        monthly_rent=2400,
+        purchase_price=700_000,
+        property_tax_rate=0.009,
+        home_insurance_rate=0.003,
+        hoa_monthly=350,
+        state_tax_rate=0,
+    ),
+    CityPreset(
+        name="Boston",
+        slug="boston",
+        monthly_rent=3100,
+        purchase_price=700_000,
+        property_tax_rate=0.0109,
+        home_insurance_rate=0.004,
+        hoa_monthly=450,
+        state_tax_rate=0.05,
+    ),
+    CityPreset(
+        name="Austin",
+        slug="austin",
+        monthly_rent=1900,
+        purchase_price=480_000,
+        property_tax_rate=0.022,
+        home_insurance_rate=0.006,
+        hoa_monthly=150,
+        state_tax_rate=0,
+    ),
+    CityPreset(
+        name="Denver",
+        slug="denver",
+        monthly_rent=2100,
+        purchase_price=550_000,
+        property_tax_rate=0.006,
+        home_insurance_rate=0.004,
+        hoa_monthly=200,
+        state_tax_rate=0.0455,
+    ),
+    CityPreset(
+        name="Miami",
+        slug="miami",
+        monthly_rent=2600,
+        purchase_price=550_000,
+        property_tax_rate=0.009,
+        home_insurance_rate=0.012,
+        hoa_monthly=500,
+        state_tax_rate=0,
+    ),
+    CityPreset(
+        name="Chicago",
+        slug="chicago",
+        monthly_rent=2000,
+        purchase_price=350_000,
+        property_tax_rate=0.021,
+        home_insurance_rate=0.005,
+        hoa_monthly=350,
+        state_tax_rate=0.0495,
+    ),
+    CityPreset(
+        name="Washington DC",
+        slug="washington-dc",
+        monthly_rent=2500,
+        purchase_price=600_000,
+        property_tax_rate=0.0085,
+        home_insurance_rate=0.004,
+        hoa_monthly=400,
+        state_tax_rate=0.085,
+    ),
+    CityPreset(
+        name="San Diego",
+        slug="san-diego",
+        monthly_rent=2700,
+        purchase_price=850_000,
+        property_tax_rate=0.0118,
+        home_insurance_rate=0.003,
+        hoa_monthly=350,
+        state_tax_rate=0.093,
+    ),
+    CityPreset(
+        name="Portland",
+        slug="portland",
+        monthly_rent=1900,
+        purchase_price=500_000,
+        property_tax_rate=0.01,
+        home_insurance_rate=0.004,
+        hoa_monthly=200,
+        state_tax_rate=0.09,
+    ),
+    CityPreset(
+        name="Phoenix",
+        slug="phoenix",
+        monthly_rent=1700,
+        purchase_price=420_000,
+        property_tax_rate=0.006,
+        home_insurance_rate=0.005,
+        hoa_monthly=100,
+        state_tax_rate=0.025,
+    ),
+    CityPreset(
+        name="Dallas",
+        slug="dallas",
+        monthly_rent=1700,
+        purchase_price=380_000,
+        property_tax_rate=0.022,
+        home_insurance_rate=0.006,
+        hoa_monthly=100,
+        state_tax_rate=0,
+    ),
+    CityPreset(
+        name="Atlanta",
+        slug="atlanta",
+        monthly_rent=1800,
+        purchase_price=380_000,
+        property_tax_rate=0.009,
+        home_insurance_rate=0.006,
+        hoa_monthly=150,
+        state_tax_rate=0.055,
+    ),
+    CityPreset(
+        name="Houston",
+        slug="houston",
+        monthly_rent=1600,
+        purchase_price=320_000,
+        property_tax_rate=0.022,
+        home_insurance_rate=0.008,
+        hoa_monthly=75,
+        state_tax_rate=0,
+    ),
+    CityPreset(
+        name="Philadelphia",
+        slug="philadelphia",
+        monthly_rent=1800,
+        purchase_price=350_000,
+        property_tax_rate=0.014,
+        home_insurance_rate=0.005,
+        hoa_monthly=200,
+        state_tax_rate=0.0307,
+    ),
+    CityPreset(
+        name="Minneapolis",
+        slug="minneapolis",
+        monthly_rent=1600,
+        purchase_price=350_000,
+        property_tax_rate=0.011,
+        home_insurance_rate=0.005,
+        hoa_monthly=200,
+        state_tax_rate=0.0785,
+    ),
+    CityPreset(
+        name="Nashville",
+        slug="nashville",
+        monthly_rent=1900,
+        purchase_price=450_000,
+        property_tax_rate=0.007,
+        home_insurance_rate=0.005,
+        hoa_monthly=150,
+        state_tax_rate=0,
+    ),
+    CityPreset(
+        name="Raleigh",
+        slug="raleigh",
+        monthly_rent=1700,
+        purchase_price=420_000,
+        property_tax_rate=0.008,
+        home_insurance_rate=0.005,
+        hoa_monthly=150,
+        state_tax_rate=0.0525,
+    ),
+    CityPreset(
+        name="Salt Lake City",
+        slug="salt-lake-city",
+        monthly_rent=1600,
+        purchase_price=500_000,
+        property_tax_rate=0.006,
+        home_insurance_rate=0.004,
+        hoa_monthly=150,
+        state_tax_rate=0.0495,
+    ),
+    CityPreset(
+        name="Charlotte",
+        slug="charlotte",
+        monthly_rent=1700,
+        purchase_price=380_000,
+        property_tax_rate=0.008,
+        home_insurance_rate=0.005,
+        hoa_monthly=150,
+        state_tax_rate=0.0525,
+    ),
+    CityPreset(
+        name="Tampa",
+        slug="tampa",
+        monthly_rent=1900,
+        purchase_price=380_000,
+        property_tax_rate=0.009,
+        home_insurance_rate=0.01,
+        hoa_monthly=200,
+        state_tax_rate=0,
+    ),
+    CityPreset(
+        name="San Jose",
+        slug="san-jose",
+        monthly_rent=3000,
+        purchase_price=1_300_000,
+        property_tax_rate=0.0118,
+        home_insurance_rate=0.003,
+        hoa_monthly=500,
+        state_tax_rate=0.093,
+    ),
+    CityPreset(
+        name="Las Vegas",
+        slug="las-vegas",
+        monthly_rent=1700,
+        purchase_price=400_000,
+        property_tax_rate=0.006,
+        home_insurance_rate=0.005,
+        hoa_monthly=100,
+        state_tax_rate=0,
+    ),
+)
+
+
+def get_city_preset(slug: str) -> CityPreset:
+    """Look up a city preset by slug.
+
+    Args:
+        slug: City slug, e.g. "san-francisco"
+
+    Returns:
+        The matching CityPreset
+
+    Raises:
+        ValueError: If no preset has this slug
+    """
+    for preset in CITY_PRESETS:
+        if preset.slug == slug:
+            return preset
+    raise ValueError(f"Unknown city: {slug}")
+
+
+def compare_cities(
+    inputs: CalculatorInputs, slugs: list[str] | None = None
+) -> CityComparisonResult:
+    """Evaluate the user's situation in each city.
+
+    Args:
+        inputs: The user's calculator inputs; location inputs are replaced
+            by each city's preset
+        slugs: Optional cities to compare. Defaults to every preset.
+
+    Returns:
+        CityComparisonResult ranked by net benefit (most favorable to
+        buying first)
+    """
+    presets = list(CITY_PRESETS) if slugs is None else [get_city_preset(slug) for slug in slugs]
+
+    overrides = {
+        name: np.array([getattr(preset, name) for preset in presets], dtype=float)
+        for name in LOCATION_FIELDS
+    }
+    batch = calculate_batch(inputs, overrides)
+    size = len(presets)
+    net_benefit = np.broadcast_to(batch.net_benefit_at_horizon, size)
+    verdicts = verdict_labels(net_benefit)
+    rent_equivalent = np.broadcast_to(batch.at_horizon(batch.rent_equivalent), size)
+    break_even = np.broadcast_to(batch.break_even_years(), size)
+    monthly_cost = np.broadcast_to(batch.monthly_ownership_cost, size)
+
+    cities = [
+        CityComparison(
+            name=preset.name,
+            slug=preset.slug,
+            rank=0,
+            verdict=verdicts[i],
+            net_benefit=float(net_benefit[i]),
+            rent_equivalent=float(rent_equivalent[i]),
+            monthly_rent=preset.monthly_rent,
+            monthly_cost=float(monthly_cost[i]),
+            break_even_year=int(break_even[i]) or None,
+        )
+        for i, preset in enumerate(presets)
+    ]
+    cities.sort(key=lambda city: city.net_benefit, reverse=True)
+    for rank, city in enumerate(cities, start=1):
+        city.rank = rank
+
+    return CityComparisonResult(cities=cities)
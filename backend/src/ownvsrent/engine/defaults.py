@@ -45,6 +45,16 @@ MIN_OWNERSHIP_YEARS_FOR_EXEMPTION = 2
 PMI_LTV_THRESHOLD = 0.80  # PMI removed when LTV <= 80%
 PMI_DOWN_PAYMENT_THRESHOLD = 0.20  # No PMI if down payment >= 20%
 
+# =============================================================================
+# OWNER TENURE
+# =============================================================================
+
+# Log-scale spread of how long owners actually stay before selling; an
+# approximate lognormal fit to Census ACS "year householder moved into unit"
+# data for owner-occupied homes
+TENURE_LOG_STD = 0.6
+MAX_TENURE_YEARS = 30
+
 # =============================================================================
 # DEFAULT INPUT VALUES (nationally representative midpoints)
 # =============================================================================
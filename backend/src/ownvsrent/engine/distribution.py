@@ -0,0 +1,265 @@
+"""Compact summaries of simulated outcome distributions.
+
+Monte Carlo runs produce thousands of net-benefit samples. Shipping every
+sample to the client is wasteful, so this module reduces them to:
+- A fixed-bin histogram (what the frontend chart draws)
+- A quantile grid (e.g. every percentile)
+- A mergeable t-digest quantile sketch
+"""
+
+import math
+
+import numpy as np
+
+from ownvsrent.engine.types import (
+    DistributionFormat,
+    Histogram,
+    QuantileGrid,
+    QuantileSketch,
+)
+
+DEFAULT_HISTOGRAM_BINS = 50
+DEFAULT_COMPRESSION = 200.0
+
+# Every percentile from 1 to 99
+PERCENTILE_LEVELS = [i / 100 for i in range(1, 100)]
+
+
+class QuantileDigest:
+    """Merging t-digest for approximate quantiles in bounded memory.
+
+    Samples are absorbed into weighted centroids whose size limit follows the
+    k1 scale function, so clusters are tiny in the tails and larger around the
+    median. The centroid count stays near ``compression / 2`` regardless of
+    how many samples are added, and two digests merge by pooling centroids.
+    """
+
+    def __init__(self, compression: float = DEFAULT_COMPRESSION):
+        self.compression = compression
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._means = np.empty(0)
+        self._weights = np.empty(0)
+
+    @property
+    def centroid_count(self) -> int:
+        """Number of centroids currently held."""
+        return len(self._means)
+
+    def update(self, values) -> None:
+        """Add a batch of samples.
+
+        Args:
+            values: Array-like of finite samples
+        """
+        batch = np.asarray(values, dtype=np.float64).ravel()
+        if batch.size == 0:
+            return
+
+        self.count += batch.size
+        self.min = min(self.min, float(batch.min()))
+        self.max = max(self.max, float(batch.max()))
+        self._compress(
+            np.concatenate([self._means, batch]),
+            np.concatenate([self._weights, np.ones(batch.size)]),
+        )
+
+    def merge(self, other: "QuantileDigest") -> None:
+        """Fold another digest (e.g. from a separate process) into this one.
+
+        Args:
+            other: Digest to absorb
+        """
+        if other.count == 0:
+            return
+
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress(
+            np.concatenate([self._means, other._means]),
+            np.concatenate([self._weights, other._weights]),
+        )
+
+    def _compress(self, means: np.ndarray, weights: np.ndarray) -> None:
+        """Sort centroids and merge neighbours whose centres share a unit of k-space.
+
+        Bucketing by centre (rather than left edge) keeps a heavy centroid
+        from absorbing a full unit of new samples on every compression.
+        """
+        order = np.argsort(means, kind="stable")
+        means = means[order]
+        weights = weights[order]
+
+        total = weights.sum()
+        q_centre = (np.cumsum(weights) - weights / 2) / total
+        # k1 scale function: k(q) = delta / (2 pi) * asin(2q - 1)
+        k = self.compression / (2 * math.pi) * np.arcsin(2 * q_centre - 1)
+        cluster = np.floor(k - k[0]).astype(np.int64)
+        # Clusters are contiguous runs, so renumber them densely
+        _, cluster = np.unique(cluster, return_inverse=True)
+
+        merged_weights = np.bincount(cluster, weights=weights)
+        self._means = np.bincount(cluster, weights=means * weights) / merged_weights
+        self._weights = merged_weights
+
+    def quantiles(self, levels) -> np.ndarray:
+        """Estimate quantiles.
+
+        Args:
+            levels: Array-like of quantile levels in [0, 1]
+
+        Returns:
+            Estimated values at each level
+        """
+        if self.count == 0:
+            raise ValueError("Cannot compute quantiles of an empty digest")
+
+        positions, values = self._interpolation_points()
+        targets = np.asarray(levels, dtype=np.float64) * self.count
+        return np.interp(targets, positions, values)
+
+    def cdf(self, x) -> np.ndarray:
+        """Estimate the fraction of samples at or below each value.
+
+        Args:
+            x: Array-like of values
+
+        Returns:
+            Estimated cumulative probabilities
+        """
+        if self.count == 0:
+            raise ValueError("Cannot compute the CDF of an empty digest")
+
+        positions, values = self._interpolation_points()
+        x = np.asarray(x, dtype=np.float64)
+        if self.min == self.max:
+            return np.where(x >= self.max, 1.0, 0.0)
+        return np.interp(x, values, positions, left=0.0, right=self.count) / self.count
+
+    def _interpolation_points(self) -> tuple[np.ndarray, np.ndarray]:
+        """Cumulative positions of centroid centres, anchored at min and max."""
+        centres = np.cumsum(self._weights) - self._weights / 2
+        positions = np.concatenate([[0.0], centres, [float(self.count)]])
+        values = np.concatenate([[self.min], self._means, [self.max]])
+        return positions, values
+
+    def to_sketch(self) -> QuantileSketch:
+        """Serialize the digest for an API response."""
+        return QuantileSketch(
+            compression=self.compression,
+            count=self.count,
+            min=self.min,
+            max=self.max,
+            means=self._means.tolist(),
+            weights=self._weights.tolist(),
+        )
+
+    @classmethod
+    def from_sketch(cls, sketch: QuantileSketch) -> "QuantileDigest":
+        """Rebuild a digest from its serialized form."""
+        digest = cls(compression=sketch.compression)
+        digest.count = sketch.count
+        digest.min = sketch.min
+        digest.max = sketch.max
+        digest._means = np.asarray(sketch.means, dtype=np.float64)
+        digest._weights = np.asarray(sketch.weights, dtype=np.float64)
+        return digest
+
+
+def build_histogram(values, bins: int = DEFAULT_HISTOGRAM_BINS) -> Histogram:
+    """Bin samples into equal-width bins spanning their range.
+
+    Args:
+        values: Array-like of samples
+        bins: Number of bins
+
+    Returns:
+        Histogram with ``bins + 1`` edges and ``bins`` counts
+    """
+    counts, edges = np.histogram(np.asarray(values, dtype=np.float64), bins=bins)
+    return Histogram(bin_edges=edges.tolist(), counts=counts.tolist())
+
+
+def build_quantile_grid(values, levels: list[float] | None = None) -> QuantileGrid:
+    """Compute exact quantiles of samples at a grid of levels.
+
+    Args:
+        values: Array-like of samples
+        levels: Quantile levels in [0, 1]. Defaults to every percentile.
+
+    Returns:
+        QuantileGrid of levels and values
+    """
+    if levels is None:
+        levels = PERCENTILE_LEVELS
+    grid = np.quantile(np.asarray(values, dtype=np.float64), levels)
+    return QuantileGrid(levels=list(levels), values=grid.tolist())
+
+
+def summarize_distribution(
+    values,
+    distribution_format: DistributionFormat,
+    histogram_bins: int = DEFAULT_HISTOGRAM_BINS,
+) -> dict:
+    """Build the distribution fields of a MonteCarloResult.
+
+    Args:
+        values: Array-like of samples
+        distribution_format: "histogram", "quantiles", "sketch", or "full"
+        histogram_bins: Number of bins for the histogram format
+
+    Returns:
+        Dict of MonteCarloResult fields to set
+    """
+    values = np.asarray(values, dtype=np.float64)
+
+    if distribution_format == "full":
+        return {"distribution": np.sort(values).tolist()}
+    if distribution_format == "histogram":
+        return {"histogram": build_histogram(values, bins=histogram_bins)}
+    if distribution_format == "quantiles":
+        return {"quantiles": build_quantile_grid(values)}
+    if distribution_format == "sketch":
+        digest = QuantileDigest()
+        digest.update(values)
+        return {"sketch": digest.to_sketch()}
+
+    raise ValueError(f"Unknown distribution format: {distribution_format}")
+
+
+def summarize_digest(
+    digest: QuantileDigest,
+    distribution_format: DistributionFormat,
+    histogram_bins: int = DEFAULT_HISTOGRAM_BINS,
+) -> dict:
+    """Build the distribution fields of a MonteCarloResult from a digest.
+
+    Used when the samples themselves were not retained. Histogram counts are
+    read off the digest's CDF, so they are approximate.
+
+    Args:
+        digest: Digest of every sample
+        distribution_format: "histogram", "quantiles", or "sketch"
+        histogram_bins: Number of bins for the histogram format
+
+    Returns:
+        Dict of MonteCarloResult fields to set
+    """
+    if distribution_format == "histogram":
+        edges = np.linspace(digest.min, digest.max, histogram_bins + 1)
+        cumulative = np.round(digest.cdf(edges) * digest.count).astype(np.int64)
+        cumulative[0] = 0
+        cumulative[-1] = digest.count
+        counts = np.diff(np.maximum.accumulate(cumulative))
+        return {"histogram": Histogram(bin_edges=edges.tolist(), counts=counts.tolist())}
+    if distribution_format == "quantiles":
+        values = digest.quantiles(PERCENTILE_LEVELS)
+        return {"quantiles": QuantileGrid(levels=PERCENTILE_LEVELS, values=values.tolist())}
+    if distribution_format == "sketch":
+        return {"sketch": digest.to_sketch()}
+    if distribution_format == "full":
+        raise ValueError("The full distribution requires retaining every sample")
+
+    raise ValueError(f"Unknown distribution format: {distribution_format}")
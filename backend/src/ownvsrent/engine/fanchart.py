@@ -0,0 +1,128 @@
+"""Year-by-year Monte Carlo bands for fan charts.
+
+`run_monte_carlo` summarizes only the final year. A simulation's batch
+results already hold every year-end (see batch.py), so one (simulations x
+years) evaluation yields the whole fan: per-year percentiles of buyer
+wealth, renter wealth and net benefit, the chance buying is ahead in each
+year, and when each simulation first breaks even.
+
+Each year's percentiles stream through their own t-digest, so memory stays
+fixed however many simulations are run.
+"""
+
+import numpy as np
+
+from ownvsrent.engine.batch import calculate_batch
+from ownvsrent.engine.distribution import QuantileDigest
+from ownvsrent.engine.historical import DEFAULT_BLOCK_LENGTH
+from ownvsrent.engine.montecarlo import DEFAULT_BATCH_SIZE
+from ownvsrent.engine.sampling import sample_batch, sampling_model
+from ownvsrent.engine.types import (
+    CalculatorInputs,
+    ComputeDtype,
+    FanChartResult,
+    FanChartYear,
+    PercentileBand,
+    SimulationMode,
+)
+
+_SERIES = ("buyer_wealth", "renter_wealth", "net_benefit")
+
+
+def run_fan_chart(
+    inputs: CalculatorInputs,
+    simulations: int = 1000,
+    seed: int | None = None,
+    std_devs: dict[str, float] | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    dtype: ComputeDtype = "float64",
+    mode: SimulationMode = "constant",
+    autocorrelation: float = 0.0,
+    correlation: list[list[float]] | None = None,
+    block_length: int = DEFAULT_BLOCK_LENGTH,
+) -> FanChartResult:
+    """Run Monte Carlo simulation and summarize every year of the horizon.
+
+    Draws follow the same uncertainty model as `run_monte_carlo` (same
+    arguments), so the final year's band matches its percentiles.
+
+    Args:
+        inputs: Base calculator inputs (means for distributions)
+        simulations: Number of simulations to run
+        seed: Optional random seed for reproducibility
+        std_devs: Optional custom standard deviations
+        batch_size: Simulations evaluated per vectorized batch
+        dtype: Precision of the monthly kernel arrays
+        mode: "constant", "path" or "bootstrap" (see `run_monte_carlo`)
+        autocorrelation: Year-over-year AR(1) coefficient for "path" mode
+        correlation: Optional correlation matrix between the variables in
+            ``std_devs``, in their insertion order
+        block_length: Consecutive historical years per block in "bootstrap" mode
+
+    Returns:
+        FanChartResult with one entry per year of the holding period
+    """
+    rng = np.random.default_rng(seed)
+    std_devs, factor = sampling_model(std_devs, correlation, mode, autocorrelation)
+    years = inputs.holding_period_years
+
+    digests = {name: [QuantileDigest() for _ in range(years)] for name in _SERIES}
+    buy_ahead = np.zeros(years, dtype=np.int64)
+    # Index 0 counts simulations that never break even
+    break_even = np.zeros(years + 1, dtype=np.int64)
+    count = 0
+
+    for start in range(0, simulations, batch_size):
+        size = min(batch_size, simulations - start)
+        overrides = sample_batch(
+            inputs, std_devs, size, rng, mode, autocorrelation, factor, block_length
+        )
+        batch = calculate_batch(inputs, overrides, dtype=dtype)
+        buyer, renter = batch.yearly_wealth()
+        buyer = np.broadcast_to(buyer, (size, years))
+        renter = np.broadcast_to(renter, (size, years))
+
+        # Skip failed simulations
+        valid = np.isfinite(buyer).all(axis=1) & np.isfinite(renter).all(axis=1)
+        buyer, renter = buyer[valid], renter[valid]
+        net_benefit = buyer - renter
+
+        for name, values in zip(_SERIES, (buyer, renter, net_benefit)):
+            for year, digest in enumerate(digests[name]):
+                digest.update(values[:, year])
+
+        positive = net_benefit > 0
+        buy_ahead += np.count_nonzero(positive, axis=0)
+        first_year = np.where(positive.any(axis=1), positive.argmax(axis=1) + 1, 0)
+        break_even += np.bincount(first_year, minlength=years + 1)
+        count += len(net_benefit)
+
+    if count == 0:
+        raise ValueError("Every simulation failed")
+
+    def band(name: str, year: int) -> PercentileBand:
+        p10, median, p90 = digests[name][year].quantiles([0.1, 0.5, 0.9])
+        return PercentileBand(p10=p10, median=median, p90=p90)
+
+    yearly = [
+        FanChartYear(
+            year=year + 1,
+            buyer_wealth=band("buyer_wealth", year),
+            renter_wealth=band("renter_wealth", year),
+            net_benefit=band("net_benefit", year),
+            buy_ahead_pct=buy_ahead[year] / count * 100,
+            break_even_pct=break_even[year + 1] / count * 100,
+        )
+        for year in range(years)
+    ]
+
+    # Never breaking even sorts after every year
+    ordered = np.cumsum(np.append(break_even[1:], break_even[0]))
+    median_index = int(np.searchsorted(ordered, count / 2))
+
+    return FanChartResult(
+        simulations=count,
+        years=yearly,
+        never_breaks_even_pct=break_even[0] / count * 100,
+        median_break_even_year=median_index + 1 if median_index < years else None,
+    )
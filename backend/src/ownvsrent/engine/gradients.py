@@ -0,0 +1,198 @@
+"""Exact input gradients by forward-mode automatic differentiation.
+
+A `Dual` number carries a value together with its derivatives with respect
+to every continuous input (a vector of tangents). The scalar engine functions
+in amortization.py, buying.py, renting.py, taxes.py and wealth.py only use
+arithmetic, powers, comparisons and ``max``/``min``, so they accept duals
+unchanged and propagate derivatives alongside values.
+
+One dual pass through the calculator's simulation therefore yields the net
+benefit and its derivative with respect to every continuous input, instead
+of two finite-difference runs per input. Every operation carries a tangent
+entry per input, so the pass costs about 6-8 `calculate()` runs, against
+roughly 40 for central differences over all inputs. At kinks (e.g.
+``max(0, x)``) and steps (PMI removal, the capital-gains exemption) the
+derivative is that of the branch taken at the base point.
+"""
+
+import math
+
+import numpy as np
+
+from ownvsrent.engine.batch import NUMERIC_FIELDS
+from ownvsrent.engine.calculator import simulate_months, wealth_at_sale
+from ownvsrent.engine.types import CalculatorInputs, GradientResult, InputGradient
+
+# Whole-number inputs have no derivative; they stay plain integers
+DISCRETE_FIELDS = ("loan_term_years", "holding_period_years")
+
+DIFFERENTIABLE_FIELDS = tuple(name for name in NUMERIC_FIELDS if name not in DISCRETE_FIELDS)
+
+
+class Dual:
+    """A value and its partial derivatives with respect to several inputs.
+
+    Arithmetic with plain numbers treats them as constants. Comparisons look
+    at values only, so branching code follows the same path it would for
+    the plain value.
+    """
+
+    __slots__ = ("value", "tangent")
+
+    def __init__(self, value: float, tangent: np.ndarray):
+        self.value = float(value)
+        self.tangent = tangent
+
+    @classmethod
+    def variables(cls, values: list[float]) -> list["Dual"]:
+        """Seed independent variables, one tangent direction each.
+
+        Args:
+            values: Values of the variables
+
+        Returns:
+            Duals whose tangents are the unit vectors
+        """
+        identity = np.eye(len(values))
+        return [cls(value, identity[i]) for i, value in enumerate(values)]
+
+    def __repr__(self) -> str:
+        return f"Dual({self.value!r}, {self.tangent!r})"
+
+    def __float__(self) -> float:
+        return self.value
+
+    # === ARITHMETIC ===
+
+    def __add__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value + other.value, self.tangent + other.tangent)
+        return Dual(self.value + other, self.tangent)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value - other.value, self.tangent - other.tangent)
+        return Dual(self.value - other, self.tangent)
+
+    def __rsub__(self, other):
+        return Dual(other - self.value, -self.tangent)
+
+    def __mul__(self, other):
+        if isinstance(other, Dual):
+            return Dual(
+                self.value * other.value,
+                self.tangent * other.value + other.tangent * self.value,
+            )
+        return Dual(self.value * other, self.tangent * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Dual):
+            value = self.value / other.value
+            return Dual(value, (self.tangent - other.tangent * value) / other.value)
+        return Dual(self.value / other, self.tangent / other)
+
+    def __rtruediv__(self, other):
+        value = other / self.value
+        return Dual(value, self.tangent * (-value / self.value))
+
+    def __pow__(self, other):
+        if isinstance(other, Dual):
+            value = self.value**other.value
+            return Dual(
+                value,
+                value
+                * (other.tangent * math.log(self.value) + other.value * self.tangent / self.value),
+            )
+        if other == 0:
+            return Dual(1.0, self.tangent * 0.0)
+        return Dual(self.value**other, self.tangent * (other * self.value ** (other - 1)))
+
+    def __rpow__(self, other):
+        value = other**self.value
+        return Dual(value, self.tangent * (value * math.log(other)))
+
+    def __neg__(self):
+        return Dual(-self.value, -self.tangent)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return -self if self.value < 0 else self
+
+    # === COMPARISONS (by value) ===
+
+    @staticmethod
+    def _value(other) -> float:
+        return other.value if isinstance(other, Dual) else other
+
+    def __lt__(self, other) -> bool:
+        return self.value < self._value(other)
+
+    def __le__(self, other) -> bool:
+        return self.value <= self._value(other)
+
+    def __gt__(self, other) -> bool:
+        return self.value > self._value(other)
+
+    def __ge__(self, other) -> bool:
+        return self.value >= self._value(other)
+
+    def __eq__(self, other) -> bool:
+        return self.value == self._value(other)
+
+    def __ne__(self, other) -> bool:
+        return self.value != self._value(other)
+
+    __hash__ = None
+
+
+def calculate_gradients(inputs: CalculatorInputs) -> GradientResult:
+    """Net benefit and its derivative with respect to every continuous input.
+
+    Runs the same `simulate_months` and `wealth_at_sale` as `calculate()`,
+    with the continuous inputs as duals.
+
+    Args:
+        inputs: Calculator inputs
+
+    Returns:
+        GradientResult with one entry per continuous input, sorted by the
+        size of a 1% relative change's effect
+    """
+    values = [getattr(inputs, name) for name in DIFFERENTIABLE_FIELDS]
+    params = {**dict(inputs), **dict(zip(DIFFERENTIABLE_FIELDS, Dual.variables(values)))}
+
+    *_, state = simulate_months(params)
+    buyer_wealth, renter_wealth = wealth_at_sale(
+        params,
+        state,
+        years_owned=inputs.holding_period_years,
+        buyer_cost_basis=state["buyer_contributions"],
+        renter_cost_basis=state["renter_contributions"],
+    )
+    net_benefit = _as_dual(buyer_wealth - renter_wealth, len(values))
+
+    gradients = [
+        InputGradient(
+            variable=name,
+            value=value,
+            derivative=float(derivative),
+            impact_per_percent=float(derivative) * abs(value) / 100,
+        )
+        for name, value, derivative in zip(DIFFERENTIABLE_FIELDS, values, net_benefit.tangent)
+    ]
+    gradients.sort(key=lambda gradient: abs(gradient.impact_per_percent), reverse=True)
+
+    return GradientResult(net_benefit=net_benefit.value, gradients=gradients)
+
+
+def _as_dual(value, size: int) -> Dual:
+    """Promote a plain number (no dependence on any input) to a dual."""
+    if isinstance(value, Dual):
+        return value
+    return Dual(value, np.zeros(size))
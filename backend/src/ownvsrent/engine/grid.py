@@ -0,0 +1,171 @@
+"""Two-input parameter grids for buy vs. rent heatmaps.
+
+Every cell of an (x, y) grid is a scenario in one `calculate_batch` call,
+so a 100 x 100 heatmap costs a single vectorized evaluation. Cells that
+share inputs also share schedules inside the batch kernel (one amortization
+schedule per distinct mortgage, one growth curve per distinct rate).
+
+With simulations, each cell also reports P(buy wins) under the Monte Carlo
+uncertainty model. Every cell reuses the same standard-normal draws (common
+random numbers), so differences between neighbouring cells reflect the
+inputs rather than sampling noise, and the (cells x simulations) scenarios
+are evaluated a bounded number of rows at a time.
+"""
+
+import numpy as np
+
+from ownvsrent.engine.batch import NUMERIC_FIELDS, VERDICT_THRESHOLD, calculate_batch
+from ownvsrent.engine.montecarlo import DEFAULT_BATCH_SIZE
+from ownvsrent.engine.sampling import clip_sampled, sampling_model, standard_normals
+from ownvsrent.engine.sensitivity import LOAN_TERMS, field_bounds
+from ownvsrent.engine.types import CalculatorInputs, GridAxis, GridResult
+
+# Most scenarios (cells x simulations) a single grid request may evaluate
+MAX_GRID_SCENARIOS = 100_000
+
+
+def evaluate_grid(
+    inputs: CalculatorInputs,
+    x: GridAxis,
+    y: GridAxis,
+    simulations: int = 0,
+    seed: int | None = None,
+    std_devs: dict[str, float] | None = None,
+    correlation: list[list[float]] | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> GridResult:
+    """Evaluate net benefit over a grid of two inputs.
+
+    Args:
+        inputs: Base calculator inputs; every other input stays fixed
+        x: Input varied along each row of the grid
+        y: Input varied down each column of the grid
+        simulations: Monte Carlo simulations per cell for P(buy wins);
+            0 skips the probability matrix
+        seed: Optional random seed for reproducibility
+        std_devs: Optional custom standard deviations (see `run_monte_carlo`).
+            A randomized grid input is drawn around each cell's value.
+        correlation: Optional correlation matrix between the variables in
+            ``std_devs``, in their insertion order
+        batch_size: Scenarios (cells x simulations) evaluated per batch
+
+    Returns:
+        GridResult whose matrices are indexed [y][x]
+
+    Raises:
+        ValueError: If both axes vary the same input, or cells x simulations
+            exceeds MAX_GRID_SCENARIOS
+    """
+    if x.variable == y.variable:
+        raise ValueError("Grid axes must vary different inputs")
+    if x.steps * y.steps * simulations > MAX_GRID_SCENARIOS:
+        raise ValueError(
+            f"Grid of {x.steps * y.steps} cells x {simulations} simulations exceeds "
+            f"{MAX_GRID_SCENARIOS:,} scenarios; reduce the steps or simulations"
+        )
+    x_values = _axis_values(x)
+    y_values = _axis_values(y)
+
+    # Row-major cells: x varies fastest
+    overrides = {
+        x.variable: np.tile(x_values, len(y_values)),
+        y.variable: np.repeat(y_values, len(x_values)),
+    }
+    batch = calculate_batch(inputs, overrides)
+    shape = (len(y_values), len(x_values))
+    net_benefit = np.broadcast_to(batch.net_benefit_at_horizon, shape[0] * shape[1])
+    verdicts = np.broadcast_to(batch.verdicts(), shape[0] * shape[1])
+
+    buy_wins_pct = None
+    if simulations > 0:
+        std_devs, factor = sampling_model(std_devs, correlation, "constant", 0.0)
+        draws = standard_normals(np.random.default_rng(seed), (simulations, len(std_devs)), factor)
+        probabilities = win_probabilities(inputs, overrides, std_devs, draws, batch_size)
+        buy_wins_pct = probabilities.reshape(shape).tolist()
+
+    return GridResult(
+        x_variable=x.variable,
+        y_variable=y.variable,
+        x_values=x_values.tolist(),
+        y_values=y_values.tolist(),
+        net_benefit=net_benefit.reshape(shape).tolist(),
+        verdicts=verdicts.reshape(shape).tolist(),
+        simulations=simulations,
+        buy_wins_pct=buy_wins_pct,
+    )
+
+
+def win_probabilities(
+    inputs: CalculatorInputs,
+    cells: dict[str, np.ndarray],
+    std_devs: dict[str, float],
+    draws: np.ndarray,
+    batch_size: int,
+) -> np.ndarray:
+    """Percentage of simulations in which buying wins, per cell.
+
+    Every cell applies the same ``draws`` (simulations x variables) around
+    its own means, and whole cells are evaluated together in chunks of
+    about ``batch_size`` scenarios so memory stays bounded.
+
+    Args:
+        inputs: Base calculator inputs
+        cells: Override values per varied input, one entry per cell
+        std_devs: Standard deviations from `sampling_model`
+        draws: Shared standard normals from `standard_normals`
+        batch_size: Scenarios (cells x simulations) evaluated per batch
+
+    Returns:
+        P(buy wins) as a percentage, one entry per cell
+    """
+    simulations = len(draws)
+    cell_count = len(next(iter(cells.values())))
+    cells_per_chunk = max(1, batch_size // simulations)
+    wins = np.zeros(cell_count)
+
+    for start in range(0, cell_count, cells_per_chunk):
+        stop = min(start + cells_per_chunk, cell_count)
+        size = stop - start
+        # Cell-major rows: each cell's simulations are contiguous
+        overrides = {
+            name: np.repeat(values[start:stop], simulations) for name, values in cells.items()
+        }
+        for column, (name, std_dev) in enumerate(std_devs.items()):
+            means = overrides.get(name, getattr(inputs, name))
+            shocks = np.tile(std_dev * draws[:, column], size)
+            overrides[name] = clip_sampled(name, means + shocks)
+
+        net_benefit = np.broadcast_to(
+            calculate_batch(inputs, overrides).net_benefit_at_horizon, size * simulations
+        ).reshape(size, simulations)
+        # Skip failed simulations
+        valid = np.isfinite(net_benefit)
+        finished = np.count_nonzero(valid, axis=1)
+        buy_wins = np.count_nonzero(valid & (net_benefit > VERDICT_THRESHOLD), axis=1)
+        wins[start:stop] = np.divide(
+            buy_wins * 100, finished, out=np.zeros(size), where=finished > 0
+        )
+    return wins
+
+
+def _axis_values(axis: GridAxis) -> np.ndarray:
+    """Evenly spaced values of one axis, snapped to valid whole numbers.
+
+    Holding periods round to whole years and loan terms to the nearest
+    allowed term.
+    """
+    if axis.variable not in NUMERIC_FIELDS:
+        raise ValueError(f"Cannot vary input: {axis.variable}")
+    if axis.low > axis.high:
+        raise ValueError(f"Range for {axis.variable} must have low <= high")
+    low_bound, high_bound = field_bounds(axis.variable)
+    if axis.low < low_bound or axis.high > high_bound:
+        raise ValueError(f"Range for {axis.variable} must lie within [{low_bound}, {high_bound}]")
+
+    values = np.linspace(axis.low, axis.high, axis.steps)
+    if axis.variable == "holding_period_years":
+        values = np.round(values)
+    elif axis.variable == "loan_term_years":
+        terms = np.asarray(LOAN_TERMS, dtype=float)
+        values = terms[np.abs(values[:, None] - terms).argmin(axis=1)]
+    return values
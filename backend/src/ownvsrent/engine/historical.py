@@ -0,0 +1,183 @@
+"""Historical backtesting of rent vs buy decisions.
+
+Instead of assuming normally distributed rates, replay the scenario through
+actual US history: every rolling window of ``holding_period_years`` consecutive
+years supplies a realized path of home price appreciation, stock market
+returns (where the renter's savings are invested) and shelter inflation
+(rent growth).
+
+The same rows also feed block-bootstrap Monte Carlo: contiguous multi-year
+blocks of joint (appreciation, return, rent growth) rows are resampled, which
+keeps both their cross-correlation and their serial correlation.
+
+The bundled dataset (data/us_annual_history.csv) holds rounded annual
+percentage changes; see the file header for sources.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib import resources
+
+import numpy as np
+
+from ownvsrent.engine.batch import VERDICT_THRESHOLD, calculate_batch
+from ownvsrent.engine.types import BacktestResult, BacktestWindow, CalculatorInputs
+
+HISTORY_FILE = "us_annual_history.csv"
+
+# Years per resampled block in block-bootstrap Monte Carlo
+DEFAULT_BLOCK_LENGTH = 5
+
+
+@dataclass(frozen=True)
+class HistoricalSeries:
+    """Annual rates of change, one entry per calendar year (decimals)."""
+
+    years: np.ndarray
+    appreciation: np.ndarray
+    investment_return: np.ndarray
+    rent_increase: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.years)
+
+    def rate_paths(self, length: int) -> dict[str, np.ndarray]:
+        """Rates for every rolling window of consecutive years.
+
+        Args:
+            length: Years per window
+
+        Returns:
+            Mapping of calculator input name to a (windows, length) array,
+            where row i covers years[i] through years[i + length - 1]
+        """
+        if not 1 <= length <= len(self):
+            raise ValueError(f"Window length must be between 1 and {len(self)} years")
+
+        def windows(values: np.ndarray) -> np.ndarray:
+            return np.lib.stride_tricks.sliding_window_view(values, length)
+
+        return {
+            "annual_appreciation": windows(self.appreciation),
+            "annual_investment_return": windows(self.investment_return),
+            "annual_rent_increase": windows(self.rent_increase),
+        }
+
+    def take(self, rows: np.ndarray) -> dict[str, np.ndarray]:
+        """Rates of the given rows (year indices), keeping the rows' shape.
+
+        Args:
+            rows: Integer array of indices into the series
+
+        Returns:
+            Mapping of calculator input name to rates shaped like ``rows``
+        """
+        return {
+            "annual_appreciation": self.appreciation[rows],
+            "annual_investment_return": self.investment_return[rows],
+            "annual_rent_increase": self.rent_increase[rows],
+        }
+
+
+@lru_cache(maxsize=1)
+def load_history() -> HistoricalSeries:
+    """Load the bundled US annual history.
+
+    Returns:
+        HistoricalSeries covering every year in the dataset
+    """
+    source = resources.files("ownvsrent.engine").joinpath("data", HISTORY_FILE)
+    with source.open() as f:
+        table = np.loadtxt(f, delimiter=",", comments="#", skiprows=6)
+
+    series = HistoricalSeries(
+        years=table[:, 0].astype(np.int64),
+        appreciation=table[:, 1] / 100,
+        investment_return=table[:, 2] / 100,
+        rent_increase=table[:, 3] / 100,
+    )
+    for values in vars(series).values():
+        values.setflags(write=False)
+    return series
+
+
+def run_backtest(
+    inputs: CalculatorInputs,
+    history: HistoricalSeries | None = None,
+) -> BacktestResult:
+    """Evaluate the scenario over every rolling historical window.
+
+    All windows are evaluated together as one batch over a
+    (windows x years) rate matrix.
+
+    Args:
+        inputs: Calculator inputs. Appreciation, investment return and rent
+            growth are replaced by the historical rates.
+        history: Optional series to replay. Defaults to the bundled dataset.
+
+    Returns:
+        BacktestResult with the distribution of net benefit across windows
+        and the best and worst start years
+    """
+    if history is None:
+        history = load_history()
+
+    years = inputs.holding_period_years
+    if years > len(history):
+        raise ValueError(f"Holding period exceeds the {len(history)} years of available history")
+
+    net_benefit = calculate_batch(inputs, history.rate_paths(years)).net_benefit_at_horizon
+    start_years = history.years[: len(net_benefit)]
+
+    windows = [
+        BacktestWindow(
+            start_year=int(start),
+            end_year=int(start) + years - 1,
+            net_benefit=float(outcome),
+        )
+        for start, outcome in zip(start_years, net_benefit)
+    ]
+    p10, median, p90 = np.percentile(net_benefit, [10, 50, 90])
+
+    return BacktestResult(
+        windows=len(windows),
+        buy_wins_pct=float(np.mean(net_benefit > VERDICT_THRESHOLD) * 100),
+        median=median,
+        p10=p10,
+        p90=p90,
+        best=windows[int(np.argmax(net_benefit))],
+        worst=windows[int(np.argmin(net_benefit))],
+        results=windows,
+    )
+
+
+def bootstrap_paths(
+    history: HistoricalSeries,
+    size: int,
+    years: int,
+    block_length: int,
+    rng: np.random.Generator,
+) -> dict[str, np.ndarray]:
+    """Draw rate paths by concatenating random blocks of consecutive years.
+
+    Block start indices for every simulation are drawn in one call, and all
+    three rates are read from the same rows, so each block keeps the joint
+    behavior of that stretch of history.
+
+    Args:
+        history: Series to resample
+        size: Number of paths
+        years: Years per path
+        block_length: Consecutive years per block
+        rng: Random generator
+
+    Returns:
+        Mapping of calculator input name to a (size, years) array
+    """
+    if not 1 <= block_length <= len(history):
+        raise ValueError(f"block_length must be between 1 and {len(history)}")
+
+    blocks = -(-years // block_length)
+    starts = rng.integers(0, len(history) - block_length + 1, size=(size, blocks))
+    rows = (starts[:, :, None] + np.arange(block_length)).reshape(size, -1)[:, :years]
+    return history.take(rows)
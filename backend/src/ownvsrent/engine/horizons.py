@@ -0,0 +1,51 @@
+"""Results for every holding period from one simulation.
+
+Net benefit at a sale year does not depend on how much longer the home
+would have been kept: buyer and renter follow the same monthly path until
+the sale. One simulation to the longest holding period therefore yields
+every shorter one, including the per-year terms that depend on the exit
+year (capital-gains exemption eligibility, cost bases, rent equivalent).
+"""
+
+from ownvsrent.engine.batch import calculate_batch, verdict_labels
+from ownvsrent.engine.types import CalculatorInputs, HorizonOutcome, HorizonsResult
+
+# Longest holding period allowed by CalculatorInputs
+MAX_HOLDING_PERIOD = 30
+
+
+def calculate_all_horizons(
+    inputs: CalculatorInputs, max_years: int = MAX_HOLDING_PERIOD
+) -> HorizonsResult:
+    """Calculate the outcome of every holding period from 1 to ``max_years``.
+
+    Entry ``h`` matches `calculate()` with ``holding_period_years = h``;
+    the inputs' own holding period is ignored.
+
+    Args:
+        inputs: Calculator inputs
+        max_years: Longest holding period to report
+
+    Returns:
+        HorizonsResult with one outcome per holding period
+    """
+    if not 1 <= max_years <= MAX_HOLDING_PERIOD:
+        raise ValueError(f"max_years must be between 1 and {MAX_HOLDING_PERIOD}")
+
+    batch = calculate_batch(inputs, {"holding_period_years": max_years})
+    net_benefit = batch.net_benefit[0]
+    verdicts = verdict_labels(net_benefit)
+    break_even = batch.break_even_by_horizon()[0]
+    rent_equivalent = batch.rent_equivalent[0]
+
+    horizons = [
+        HorizonOutcome(
+            holding_period_years=year,
+            net_benefit=float(net_benefit[year - 1]),
+            verdict=verdicts[year - 1],
+            break_even_year=int(break_even[year - 1]) or None,
+            rent_equivalent=float(rent_equivalent[year - 1]),
+        )
+        for year in range(1, max_years + 1)
+    ]
+    return HorizonsResult(horizons=horizons)
@@ -2,21 +2,67 @@
 
 This module runs multiple simulations with randomized inputs to show
 the distribution of possible outcomes.
+
+Simulations are drawn and evaluated in vectorized batches (see batch.py).
+Each batch is folded into a t-digest as it completes, so runs too large to
+hold in memory still report percentiles from a fixed-size summary.
+
+The sale year can itself be random: given holding-period weights, each
+simulation draws its exit year, every simulation runs to the longest possible
+horizon in one batch, and each is read off at its own exit year.
+
+In "path" mode each simulation draws a fresh rate for every year (optionally
+autocorrelated) instead of one rate held for the whole horizon. "bootstrap"
+mode instead resamples blocks of actual history (see historical.py).
+
+Randomized variables can be correlated: a correlation matrix is validated and
+Cholesky-factored once (and cached), and every variable comes from a single
+correlated normal draw (see sampling.py).
 """
 
-import random
-from statistics import median, quantiles
+import math
+from collections.abc import Sequence
+from statistics import NormalDist
+
+import numpy as np
 
+from ownvsrent.engine.batch import (
+    NUMERIC_FIELDS,
+    VERDICT_THRESHOLD,
+    calculate_batch,
+)
 from ownvsrent.engine.calculator import calculate
-from ownvsrent.engine.types import CalculatorInputs, MonteCarloResult
+from ownvsrent.engine.defaults import MAX_TENURE_YEARS, TENURE_LOG_STD
+from ownvsrent.engine.distribution import (
+    DEFAULT_HISTOGRAM_BINS,
+    QuantileDigest,
+    summarize_digest,
+    summarize_distribution,
+)
+from ownvsrent.engine.historical import DEFAULT_BLOCK_LENGTH
+from ownvsrent.engine.sampling import (
+    DEFAULT_STD_DEVS,
+    apply_draws,
+    sample_batch,
+    sampling_model,
+    standard_normals,
+    uncertainty_factor,
+)
+from ownvsrent.engine.types import (
+    CalculatorInputs,
+    ComputeDtype,
+    DistributionFormat,
+    MonteCarloResult,
+    PairedMonteCarloResult,
+    SimulationMode,
+)
 
+# Simulations evaluated per vectorized batch
+DEFAULT_BATCH_SIZE = 10_000
 
-# Default standard deviations for random variables
-DEFAULT_STD_DEVS = {
-    "annual_appreciation": 0.05,  # High volatility in home prices
-    "annual_investment_return": 0.15,  # Stock market volatility
-    "annual_rent_increase": 0.02,  # Moderate rent variation
-}
+# Runs up to this size keep every sample for exact percentiles (~800 KB);
+# larger runs rely on the t-digest alone so memory stays fixed.
+EXACT_QUANTILE_LIMIT = 100_000
 
 
 def run_monte_carlo(
@@ -24,6 +70,15 @@ def run_monte_carlo(
     simulations: int = 1000,
     seed: int | None = None,
     std_devs: dict[str, float] | None = None,
+    distribution_format: DistributionFormat = "full",
+    histogram_bins: int = DEFAULT_HISTOGRAM_BINS,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    dtype: ComputeDtype = "float64",
+    mode: SimulationMode = "constant",
+    autocorrelation: float = 0.0,
+    correlation: list[list[float]] | None = None,
+    block_length: int = DEFAULT_BLOCK_LENGTH,
+    holding_period_weights: Sequence[float] | None = None,
 ) -> MonteCarloResult:
     """Run Monte Carlo simulation for rent vs buy analysis.
 
@@ -36,53 +91,68 @@ def run_monte_carlo(
         inputs: Base calculator inputs (means for distributions)
         simulations: Number of simulations to run
         seed: Optional random seed for reproducibility
-        std_devs: Optional custom standard deviations
+        std_devs: Optional custom standard deviations. Any non-integer input
+            can be randomized (see sampling.EXTRA_STD_DEVS for suggested values).
+        distribution_format: How to return the outcome distribution:
+            "full" (default, every sorted sample), or the fixed-size
+            "histogram", "quantiles" (every percentile), or "sketch"
+            (mergeable t-digest)
+        histogram_bins: Number of bins for the histogram format
+        batch_size: Simulations evaluated per vectorized batch
+        dtype: Precision of the monthly kernel arrays. "float32" halves their
+            memory; percentiles drift by a few dollars from "float64".
+        mode: "constant" draws one rate per simulation for the whole horizon;
+            "path" draws a rate for every year of every simulation;
+            "bootstrap" resamples blocks of historical appreciation, return
+            and rent growth (other variables in ``std_devs`` are still drawn
+            from normal distributions)
+        autocorrelation: Year-over-year AR(1) coefficient for "path" mode,
+            in (-1, 1). 0 gives independent years.
+        correlation: Optional correlation matrix between the variables in
+            ``std_devs``, in their insertion order. Defaults to independent.
+            Not supported in "bootstrap" mode.
+        block_length: Consecutive historical years per block in "bootstrap" mode
+        holding_period_weights: Optional relative chance of selling at the end
+            of year 1, 2, ... (see `tenure_weights`). Each simulation draws
+            its own sale year, overriding ``holding_period_years``.
 
     Returns:
         MonteCarloResult with distribution statistics
     """
-    if seed is not None:
-        random.seed(seed)
+    rng = np.random.default_rng(seed)
+    std_devs, factor = sampling_model(std_devs, correlation, mode, autocorrelation)
+    if holding_period_weights is not None:
+        sale_year_probabilities = _normalized_weights(holding_period_weights)
+        # Rate paths must cover the longest possible sale year
+        inputs = inputs.model_copy(update={"holding_period_years": len(sale_year_probabilities)})
 
-    if std_devs is None:
-        std_devs = DEFAULT_STD_DEVS
-
-    distribution: list[float] = []
+    digest = QuantileDigest()
+    retain = simulations <= EXACT_QUANTILE_LIMIT or distribution_format == "full"
+    retained: list[np.ndarray] = []
     buy_wins_count = 0
 
-    for _ in range(simulations):
-        # Sample random values for each variable
-        sampled_values = {}
-
-        for var_name, std_dev in std_devs.items():
-            mean = getattr(inputs, var_name)
-            sampled = random.gauss(mean, std_dev)
-
-            # Apply bounds
-            if var_name == "annual_appreciation":
-                sampled = max(-0.15, min(0.20, sampled))
-            elif var_name == "annual_investment_return":
-                sampled = max(-0.10, min(0.25, sampled))
-            elif var_name == "annual_rent_increase":
-                sampled = max(0, min(0.15, sampled))
-
-            sampled_values[var_name] = sampled
-
-        # Create modified inputs
-        sim_inputs = inputs.model_copy(update=sampled_values)
+    for start in range(0, simulations, batch_size):
+        size = min(batch_size, simulations - start)
+        overrides = sample_batch(
+            inputs, std_devs, size, rng, mode, autocorrelation, factor, block_length
+        )
+        if holding_period_weights is not None:
+            overrides["holding_period_years"] = 1 + rng.choice(
+                len(sale_year_probabilities), size=size, p=sale_year_probabilities
+            )
+        net_benefit = calculate_batch(
+            inputs, overrides, years=inputs.holding_period_years, dtype=dtype
+        ).net_benefit_at_horizon
 
-        try:
-            result = calculate(sim_inputs)
-            net_benefit = result.net_benefit_at_horizon
-            distribution.append(net_benefit)
+        # Skip failed simulations
+        net_benefit = net_benefit[np.isfinite(net_benefit)]
 
-            if result.verdict == "buy":
-                buy_wins_count += 1
-        except Exception:
-            # Skip failed simulations
-            continue
+        buy_wins_count += int(np.count_nonzero(net_benefit > VERDICT_THRESHOLD))
+        digest.update(net_benefit)
+        if retain:
+            retained.append(net_benefit)
 
-    if not distribution:
+    if digest.count == 0:
         # All simulations failed - return base case
         base_result = calculate(inputs)
         return MonteCarloResult(
@@ -91,29 +161,246 @@ def run_monte_carlo(
             median=base_result.net_benefit_at_horizon,
             p10=base_result.net_benefit_at_horizon,
             p90=base_result.net_benefit_at_horizon,
-            distribution=[base_result.net_benefit_at_horizon],
+            distribution_format=distribution_format,
+            **summarize_distribution(
+                [base_result.net_benefit_at_horizon], distribution_format, histogram_bins
+            ),
         )
 
-    # Calculate statistics
-    distribution.sort()
-    actual_sims = len(distribution)
-
-    # Calculate percentiles
-    if actual_sims >= 4:
-        # Use quantiles for sufficient data
-        qs = quantiles(distribution, n=10)
-        p10 = qs[0]  # 10th percentile
-        p90 = qs[-1]  # 90th percentile
-    else:
-        # Not enough data for percentiles
-        p10 = distribution[0]
-        p90 = distribution[-1]
+    actual_sims = digest.count
+    p10, median, p90, summary = _summarize_run(
+        digest, retained if retain else None, distribution_format, histogram_bins
+    )
 
     return MonteCarloResult(
         simulations=actual_sims,
         buy_wins_pct=buy_wins_count / actual_sims * 100,
-        median=median(distribution),
+        median=median,
+        p10=p10,
+        p90=p90,
+        distribution_format=distribution_format,
+        **summary,
+    )
+
+
+def tenure_weights(
+    median_years: float,
+    log_std: float = TENURE_LOG_STD,
+    max_years: int = MAX_TENURE_YEARS,
+) -> list[float]:
+    """Chance of selling at the end of each year under a lognormal tenure.
+
+    Tenure is rounded to the nearest whole year; tenures beyond ``max_years``
+    are counted as selling in the final year.
+
+    Args:
+        median_years: Median tenure (e.g. the planned holding period)
+        log_std: Standard deviation of log tenure
+        max_years: Longest holding period considered
+
+    Returns:
+        Probabilities for selling at the end of year 1 .. ``max_years``
+    """
+    if median_years <= 0:
+        raise ValueError("median_years must be positive")
+    if log_std <= 0:
+        raise ValueError("log_std must be positive")
+
+    tenure = NormalDist(math.log(median_years), log_std)
+    edges = [tenure.cdf(math.log(year + 0.5)) for year in range(1, max_years)]
+    cumulative = [0.0, *edges, 1.0]
+    return [high - low for low, high in zip(cumulative, cumulative[1:])]
+
+
+def merge_monte_carlo_results(
+    results: list[MonteCarloResult],
+    distribution_format: DistributionFormat = "sketch",
+    histogram_bins: int = DEFAULT_HISTOGRAM_BINS,
+) -> MonteCarloResult:
+    """Combine partial Monte Carlo runs (e.g. from separate processes).
+
+    Each partial result must have been produced with
+    ``distribution_format="sketch"`` and a distinct seed.
+
+    Args:
+        results: Partial results to combine
+        distribution_format: Format of the combined distribution
+            ("histogram", "quantiles", or "sketch")
+        histogram_bins: Number of bins for the histogram format
+
+    Returns:
+        MonteCarloResult summarizing every simulation
+    """
+    if not results:
+        raise ValueError("At least one result is required")
+    if any(result.sketch is None for result in results):
+        raise ValueError("Only results with a sketch distribution can be merged")
+
+    digest = QuantileDigest(compression=results[0].sketch.compression)
+    for result in results:
+        digest.merge(QuantileDigest.from_sketch(result.sketch))
+
+    buy_wins = sum(result.buy_wins_pct * result.simulations for result in results)
+    p10, median, p90 = digest.quantiles([0.1, 0.5, 0.9])
+
+    return MonteCarloResult(
+        simulations=digest.count,
+        buy_wins_pct=buy_wins / digest.count,
+        median=median,
+        p10=p10,
+        p90=p90,
+        distribution_format=distribution_format,
+        **summarize_digest(digest, distribution_format, histogram_bins),
+    )
+
+
+def run_paired_monte_carlo(
+    scenario_a: CalculatorInputs,
+    scenario_b: CalculatorInputs,
+    simulations: int = 1000,
+    seed: int | None = None,
+    std_devs: dict[str, float] | None = None,
+    correlation: list[list[float]] | None = None,
+    distribution_format: DistributionFormat = "full",
+    histogram_bins: int = DEFAULT_HISTOGRAM_BINS,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    dtype: ComputeDtype = "float64",
+) -> PairedMonteCarloResult:
+    """Compare two scenarios under common random numbers.
+
+    Both scenarios are evaluated against the same standard-normal draws
+    (each shifted to its own means) in one vectorized batch, so shared
+    market luck cancels out of their difference. The difference therefore
+    needs far fewer simulations to resolve than two independent runs.
+
+    Args:
+        scenario_a: Inputs for scenario A
+        scenario_b: Inputs for scenario B
+        simulations: Number of paired simulations to run
+        seed: Optional random seed for reproducibility
+        std_devs: Optional custom standard deviations
+        correlation: Optional correlation matrix between the variables in
+            ``std_devs``, in their insertion order
+        distribution_format: How to return the distribution of the difference
+        histogram_bins: Number of bins for the histogram format
+        batch_size: Paired simulations evaluated per vectorized batch
+        dtype: Precision of the monthly kernel arrays
+
+    Returns:
+        PairedMonteCarloResult describing net benefit of A minus net benefit of B
+    """
+    rng = np.random.default_rng(seed)
+
+    if std_devs is None:
+        std_devs = DEFAULT_STD_DEVS
+    factor = uncertainty_factor(std_devs, correlation)
+
+    # Scenario B enters the batch as per-row overrides of every input
+    fields = NUMERIC_FIELDS + ("filing_status",)
+    base_a = {name: getattr(scenario_a, name) for name in fields}
+    base_b = {name: getattr(scenario_b, name) for name in fields}
+    years = max(scenario_a.holding_period_years, scenario_b.holding_period_years)
+
+    digests = {key: QuantileDigest() for key in ("a", "b", "difference")}
+    retain = simulations <= EXACT_QUANTILE_LIMIT or distribution_format == "full"
+    retained: list[np.ndarray] = []
+    a_wins_count = 0
+    total = 0.0
+    total_squares = 0.0
+
+    for start in range(0, simulations, batch_size):
+        size = min(batch_size, simulations - start)
+        draws = standard_normals(rng, (size, len(std_devs)), factor)
+        sampled_a = apply_draws(scenario_a, std_devs, draws)
+        sampled_b = apply_draws(scenario_b, std_devs, draws)
+
+        overrides = {
+            name: np.concatenate(
+                [
+                    np.broadcast_to(sampled_a.get(name, base_a[name]), (size,)),
+                    np.broadcast_to(sampled_b.get(name, base_b[name]), (size,)),
+                ]
+            )
+            for name in fields
+        }
+        net_benefit = calculate_batch(
+            scenario_a, overrides, years=years, dtype=dtype
+        ).net_benefit_at_horizon
+        net_a, net_b = net_benefit[:size], net_benefit[size:]
+
+        # Skip failed simulations
+        valid = np.isfinite(net_a) & np.isfinite(net_b)
+        net_a, net_b = net_a[valid], net_b[valid]
+        difference = net_a - net_b
+
+        a_wins_count += int(np.count_nonzero(difference > 0))
+        total += float(difference.sum())
+        total_squares += float(np.square(difference).sum())
+        digests["a"].update(net_a)
+        digests["b"].update(net_b)
+        digests["difference"].update(difference)
+        if retain:
+            retained.append(difference)
+
+    count = digests["difference"].count
+    if count == 0:
+        raise ValueError("Every paired simulation failed")
+
+    p10, median, p90, summary = _summarize_run(
+        digests["difference"], retained if retain else None, distribution_format, histogram_bins
+    )
+    mean = total / count
+    variance = max(total_squares / count - mean**2, 0.0) * count / max(count - 1, 1)
+
+    return PairedMonteCarloResult(
+        simulations=count,
+        a_wins_pct=a_wins_count / count * 100,
+        mean_difference=mean,
+        std_error=float(np.sqrt(variance / count)),
+        median=median,
         p10=p10,
         p90=p90,
-        distribution=distribution,
+        median_a=float(digests["a"].quantiles([0.5])[0]),
+        median_b=float(digests["b"].quantiles([0.5])[0]),
+        distribution_format=distribution_format,
+        **summary,
     )
+
+
+def _summarize_run(
+    digest: QuantileDigest,
+    retained: list[np.ndarray] | None,
+    distribution_format: DistributionFormat,
+    histogram_bins: int,
+) -> tuple[float, float, float, dict]:
+    """Percentiles and distribution fields of a finished run.
+
+    Percentiles are exact when the samples were retained, otherwise they are
+    read from the digest.
+    """
+    if retained is not None:
+        distribution = np.concatenate(retained)
+        # "weibull" matches statistics.quantiles' default exclusive method
+        p10, p90 = np.quantile(distribution, [0.1, 0.9], method="weibull")
+        median = float(np.median(distribution))
+    else:
+        p10, median, p90 = digest.quantiles([0.1, 0.5, 0.9])
+
+    if retained is not None and distribution_format != "sketch":
+        summary = summarize_distribution(distribution, distribution_format, histogram_bins)
+    else:
+        summary = summarize_digest(digest, distribution_format, histogram_bins)
+    return float(p10), float(median), float(p90), summary
+
+
+def _normalized_weights(weights: Sequence[float]) -> np.ndarray:
+    """Validate holding-period weights and scale them to probabilities."""
+    probabilities = np.asarray(weights, dtype=np.float64)
+    if probabilities.ndim != 1 or not 1 <= len(probabilities) <= MAX_TENURE_YEARS:
+        raise ValueError(f"Holding-period weights must cover 1 to {MAX_TENURE_YEARS} years")
+    if not np.all(np.isfinite(probabilities)) or np.any(probabilities < 0):
+        raise ValueError("Holding-period weights must be non-negative")
+    total = probabilities.sum()
+    if total <= 0:
+        raise ValueError("Holding-period weights must not all be zero")
+    return probabilities / total
@@ -0,0 +1,102 @@
+"""Financing optimizer over loan term, down payment and holding period.
+
+Every (loan term, down payment) pair is one scenario of a single batch
+simulated to the longest requested holding period. A batch row already
+holds net benefit for a sale at the end of every year (see batch.py), so
+each holding period reads its column instead of re-simulating the shared
+prefix, and each distinct loan gets one amortization schedule.
+
+Options are compared within each holding period on two criteria: net
+benefit (higher is better) and monthly ownership cost (lower is better).
+Only Pareto-optimal options, which no other option beats on both, are
+returned.
+"""
+
+import numpy as np
+
+from ownvsrent.engine.batch import calculate_batch, verdict_labels
+from ownvsrent.engine.sensitivity import LOAN_TERMS
+from ownvsrent.engine.types import CalculatorInputs, FinancingOption, FinancingResult
+
+# Down payments tried when none are given (3.5% is the FHA minimum)
+DEFAULT_DOWN_PAYMENTS = (0.035, 0.05, 0.10, 0.15, 0.20, 0.25, 0.30, 0.40, 0.50)
+
+
+def optimize_financing(
+    inputs: CalculatorInputs,
+    down_payments: list[float] | None = None,
+    holding_periods: list[int] | None = None,
+) -> FinancingResult:
+    """Find the Pareto-optimal financing options.
+
+    Args:
+        inputs: Base calculator inputs; loan term, down payment and holding
+            period are replaced by every combination tried
+        down_payments: Down payment fractions to try. Defaults to
+            DEFAULT_DOWN_PAYMENTS.
+        holding_periods: Holding periods in years to try. Defaults to the
+            inputs' holding period.
+
+    Returns:
+        FinancingResult with the Pareto-optimal options of each holding
+        period, ranked by net benefit (highest first)
+    """
+    if down_payments is None:
+        down_payments = list(DEFAULT_DOWN_PAYMENTS)
+    if holding_periods is None:
+        holding_periods = [inputs.holding_period_years]
+    if any(not 0 <= down_payment <= 1 for down_payment in down_payments):
+        raise ValueError("Down payments must be between 0 and 1")
+    if any(not 1 <= years <= 30 for years in holding_periods):
+        raise ValueError("Holding periods must be between 1 and 30 years")
+    down_payments = sorted(set(down_payments))
+    holding_periods = sorted(set(holding_periods))
+
+    terms, fractions = (grid.ravel() for grid in np.meshgrid(LOAN_TERMS, down_payments))
+    batch = calculate_batch(
+        inputs,
+        {
+            "loan_term_years": terms,
+            "down_payment_percent": fractions,
+            "holding_period_years": max(holding_periods),
+        },
+    )
+    size = len(terms)
+    net_benefit = np.broadcast_to(batch.net_benefit, (size, batch.years))
+    monthly_cost = np.broadcast_to(batch.monthly_ownership_cost, size)
+    mortgage_payment = np.broadcast_to(batch.monthly_mortgage_payment, size)
+
+    options = []
+    for years in holding_periods:
+        net = net_benefit[:, years - 1]
+        verdicts = verdict_labels(net)
+        for row in _pareto_front(net, monthly_cost):
+            options.append(
+                FinancingOption(
+                    loan_term_years=int(terms[row]),
+                    down_payment_percent=float(fractions[row]),
+                    holding_period_years=years,
+                    net_benefit=float(net[row]),
+                    monthly_cost=float(monthly_cost[row]),
+                    monthly_mortgage_payment=float(mortgage_payment[row]),
+                    verdict=verdicts[row],
+                )
+            )
+
+    return FinancingResult(evaluated=size * len(holding_periods), options=options)
+
+
+def _pareto_front(net_benefit: np.ndarray, monthly_cost: np.ndarray) -> list[int]:
+    """Indices of options not beaten on both criteria, by net benefit (highest first).
+
+    Walking options from highest net benefit down, an option is on the front
+    exactly when it is cheaper than everything before it.
+    """
+    order = np.lexsort((monthly_cost, -net_benefit))
+    front = []
+    cheapest = np.inf
+    for row in order:
+        if monthly_cost[row] < cheapest:
+            front.append(int(row))
+            cheapest = monthly_cost[row]
+    return front
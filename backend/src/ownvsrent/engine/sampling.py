@@ -0,0 +1,347 @@
+"""Sampling of randomized inputs for Monte Carlo and its variants.
+
+A run's uncertainty model is a standard deviation per randomized input and
+an optional correlation matrix between them. `sampling_model` validates it
+once; the matrix is Cholesky-factored (and cached), so every variable comes
+from a single correlated standard-normal draw.
+
+Draws are scaled around the base inputs and clipped to valid values. Callers
+that share draws between scenarios (paired runs, grid cells, goal seek) call
+`standard_normals` once and `apply_draws` per scenario.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from ownvsrent.engine.batch import NUMERIC_FIELDS, PATH_FIELDS
+from ownvsrent.engine.historical import bootstrap_paths, load_history
+from ownvsrent.engine.sensitivity import field_bounds
+from ownvsrent.engine.types import CalculatorInputs, SimulationMode
+
+# Default standard deviations for random variables
+DEFAULT_STD_DEVS = {
+    "annual_appreciation": 0.05,  # High volatility in home prices
+    "annual_investment_return": 0.15,  # Stock market volatility
+    "annual_rent_increase": 0.02,  # Moderate rent variation
+}
+
+# Suggested standard deviations for further variables that can be randomized
+EXTRA_STD_DEVS = {
+    "mortgage_rate": 0.01,
+    "property_tax_rate": 0.002,
+    "maintenance_rate": 0.005,
+}
+
+# Bounds applied to sampled values; other inputs are clipped to their Field range
+SAMPLING_BOUNDS = {
+    "annual_appreciation": (-0.15, 0.20),
+    "annual_investment_return": (-0.10, 0.25),
+    "annual_rent_increase": (0, 0.15),
+    "mortgage_rate": (0, 0.20),
+    "property_tax_rate": (0, 0.05),
+    "maintenance_rate": (0, 0.05),
+}
+
+# Inputs that can be randomized (whole-number inputs are excluded)
+SAMPLEABLE_FIELDS = tuple(
+    name for name in NUMERIC_FIELDS if name not in ("holding_period_years", "loan_term_years")
+)
+
+
+def _sampling_limits(var_name: str) -> tuple[float, float]:
+    """Range sampled values of an input are clipped to."""
+    if var_name in SAMPLING_BOUNDS:
+        return SAMPLING_BOUNDS[var_name]
+    low, high = field_bounds(var_name)
+    metadata = CalculatorInputs.model_fields[var_name].metadata
+    if any(getattr(constraint, "gt", None) is not None for constraint in metadata):
+        # Strictly positive inputs (the purchase price) stay above their bound
+        low = float(np.nextafter(low, np.inf))
+    return low, high
+
+
+_SAMPLING_LIMITS = {name: _sampling_limits(name) for name in SAMPLEABLE_FIELDS}
+
+
+def sampling_model(
+    std_devs: dict[str, float] | None,
+    correlation: list[list[float]] | None,
+    mode: SimulationMode,
+    autocorrelation: float,
+) -> tuple[dict[str, float], np.ndarray | None]:
+    """Validate a run's uncertainty model and return the variables to sample.
+
+    Args:
+        std_devs: Standard deviation per randomized input, or None for
+            DEFAULT_STD_DEVS
+        correlation: Optional correlation matrix between the variables in
+            ``std_devs``, in their insertion order
+        mode: Simulation mode; "bootstrap" takes rate paths from history
+            and samples only the remaining variables
+        autocorrelation: Year-to-year autocorrelation of "path" mode rates
+
+    Returns:
+        Tuple of (standard deviations to draw from, correlation factor or None)
+
+    Raises:
+        ValueError: If a variable cannot be randomized or the model is invalid
+    """
+    if not -1 < autocorrelation < 1:
+        raise ValueError("autocorrelation must be between -1 and 1")
+
+    if std_devs is None:
+        std_devs = DEFAULT_STD_DEVS
+    if mode == "bootstrap":
+        if correlation is not None:
+            raise ValueError("Correlation matrices do not apply to bootstrap mode")
+        # History supplies the rate paths; only the remaining variables are sampled
+        std_devs = {name: std for name, std in std_devs.items() if name not in PATH_FIELDS}
+    return std_devs, uncertainty_factor(std_devs, correlation)
+
+
+def uncertainty_factor(
+    std_devs: dict[str, float], correlation: list[list[float]] | None
+) -> np.ndarray | None:
+    """Validate randomized variables and return the correlation factor, if any.
+
+    Args:
+        std_devs: Standard deviation per randomized input
+        correlation: Optional correlation matrix in ``std_devs`` order
+
+    Returns:
+        Cholesky factor of the correlation matrix, or None without one
+
+    Raises:
+        ValueError: If a variable cannot be randomized, a standard deviation
+            is negative, or the matrix is invalid or the wrong size
+    """
+    for var_name, std_dev in std_devs.items():
+        if var_name not in SAMPLEABLE_FIELDS:
+            raise ValueError(f"Cannot randomize input: {var_name}")
+        if std_dev < 0:
+            raise ValueError(f"Standard deviation for {var_name} must be non-negative")
+
+    if correlation is None:
+        return None
+    factor = correlation_factor(correlation)
+    if len(factor) != len(std_devs):
+        raise ValueError(
+            f"Correlation matrix is {len(factor)}x{len(factor)} "
+            f"but {len(std_devs)} variables are randomized"
+        )
+    return factor
+
+
+def correlation_factor(correlation: list[list[float]]) -> np.ndarray:
+    """Validate a correlation matrix and return its Cholesky factor.
+
+    Factors are cached, so requests reusing a matrix skip the decomposition.
+
+    Args:
+        correlation: Symmetric positive-definite matrix with a unit diagonal
+
+    Returns:
+        Read-only lower-triangular factor L with L @ L.T == correlation
+
+    Raises:
+        ValueError: If the matrix is not a valid correlation matrix
+    """
+    return _cholesky_factor(tuple(tuple(float(value) for value in row) for row in correlation))
+
+
+@lru_cache(maxsize=64)
+def _cholesky_factor(correlation: tuple[tuple[float, ...], ...]) -> np.ndarray:
+    """Cached body of correlation_factor (the matrix must be hashable)."""
+    if any(len(row) != len(correlation) for row in correlation):
+        raise ValueError("Correlation matrix must be square")
+
+    matrix = np.array(correlation, dtype=np.float64).reshape(len(correlation), -1)
+    if not np.all(np.isfinite(matrix)):
+        raise ValueError("Correlation matrix must be finite")
+    if not np.allclose(matrix, matrix.T):
+        raise ValueError("Correlation matrix must be symmetric")
+    if not np.allclose(np.diag(matrix), 1.0):
+        raise ValueError("Correlation matrix must have ones on the diagonal")
+    if np.any(np.abs(matrix) > 1):
+        raise ValueError("Correlations must be between -1 and 1")
+
+    try:
+        factor = np.linalg.cholesky(matrix)
+    except np.linalg.LinAlgError:
+        raise ValueError("Correlation matrix must be positive definite") from None
+
+    factor.setflags(write=False)
+    return factor
+
+
+def sample_batch(
+    inputs: CalculatorInputs,
+    std_devs: dict[str, float],
+    size: int,
+    rng: np.random.Generator,
+    mode: SimulationMode,
+    autocorrelation: float,
+    factor: np.ndarray | None,
+    block_length: int,
+) -> dict[str, np.ndarray]:
+    """Draw one batch of overrides in the given simulation mode.
+
+    Args:
+        inputs: Base calculator inputs (means for distributions)
+        std_devs: Standard deviations from `sampling_model`
+        size: Number of draws
+        rng: Random generator
+        mode: "constant", "path" or "bootstrap"
+        autocorrelation: Year-to-year autocorrelation of "path" mode rates
+        factor: Correlation factor from `sampling_model`
+        block_length: Years per resampled block in "bootstrap" mode
+
+    Returns:
+        Overrides for `calculate_batch`, one entry per sampled input
+    """
+    if mode == "path":
+        return sample_paths(inputs, std_devs, size, rng, autocorrelation, factor)
+    if mode == "bootstrap":
+        overrides = sample_inputs(inputs, std_devs, size, rng)
+        overrides.update(
+            bootstrap_paths(load_history(), size, inputs.holding_period_years, block_length, rng)
+        )
+        return overrides
+    return sample_inputs(inputs, std_devs, size, rng, factor)
+
+
+def standard_normals(
+    rng: np.random.Generator, shape: tuple[int, ...], factor: np.ndarray | None
+) -> np.ndarray:
+    """Draw standard normals correlated along the last axis by a Cholesky factor.
+
+    Args:
+        rng: Random generator
+        shape: Shape of the draws; the last axis is one column per variable
+        factor: Optional Cholesky factor from `correlation_factor`
+
+    Returns:
+        Array of draws with the given shape
+    """
+    draws = rng.standard_normal(shape)
+    if factor is None:
+        return draws
+    return draws @ factor.T
+
+
+def sample_inputs(
+    inputs: CalculatorInputs,
+    std_devs: dict[str, float],
+    size: int,
+    rng: np.random.Generator,
+    factor: np.ndarray | None = None,
+) -> dict[str, np.ndarray]:
+    """Draw one batch of randomized inputs around the base values.
+
+    Args:
+        inputs: Base calculator inputs (means for distributions)
+        std_devs: Standard deviation per randomized input
+        size: Number of draws
+        rng: Random generator
+        factor: Optional correlation factor
+
+    Returns:
+        Sampled values per randomized input, each of length ``size``
+    """
+    return apply_draws(inputs, std_devs, standard_normals(rng, (size, len(std_devs)), factor))
+
+
+def apply_draws(
+    inputs: CalculatorInputs,
+    std_devs: dict[str, float],
+    draws: np.ndarray,
+) -> dict[str, np.ndarray]:
+    """Scale standard-normal draws (one column per variable) around the base values.
+
+    Args:
+        inputs: Base calculator inputs (means for distributions)
+        std_devs: Standard deviation per randomized input
+        draws: Standard normals from `standard_normals`, one row per draw
+
+    Returns:
+        Sampled values per randomized input, clipped to valid values
+    """
+    sampled_values = {}
+
+    for column, (var_name, std_dev) in enumerate(std_devs.items()):
+        mean = getattr(inputs, var_name)
+        sampled = mean + std_dev * draws[:, column]
+
+        sampled_values[var_name] = clip_sampled(var_name, sampled)
+
+    return sampled_values
+
+
+def sample_paths(
+    inputs: CalculatorInputs,
+    std_devs: dict[str, float],
+    size: int,
+    rng: np.random.Generator,
+    autocorrelation: float,
+    factor: np.ndarray | None = None,
+) -> dict[str, np.ndarray]:
+    """Draw one batch of per-year rate paths around the base values.
+
+    Rates follow a stationary AR(1) process, so each year keeps the base
+    value as its mean and the configured standard deviation as its spread:
+    x[t] = mean + phi * (x[t-1] - mean) + sqrt(1 - phi^2) * std_dev * e[t].
+    Shocks within a year are correlated across variables by ``factor``.
+    Variables that cannot vary by year use their first-year shock throughout.
+
+    Args:
+        inputs: Base calculator inputs (means for distributions)
+        std_devs: Standard deviation per randomized input
+        size: Number of draws
+        rng: Random generator
+        autocorrelation: Year-to-year autocorrelation (phi)
+        factor: Optional correlation factor
+
+    Returns:
+        Sampled values per input: (size, years) paths for PATH_FIELDS,
+        length-``size`` vectors otherwise
+    """
+    years = inputs.holding_period_years
+    innovation_scale = np.sqrt(1 - autocorrelation**2)
+    draws = standard_normals(rng, (size, years, len(std_devs)), factor)
+    sampled_values = {}
+
+    for column, (var_name, std_dev) in enumerate(std_devs.items()):
+        if var_name not in PATH_FIELDS:
+            sampled_values[var_name] = clip_sampled(
+                var_name, getattr(inputs, var_name) + std_dev * draws[:, 0, column]
+            )
+            continue
+
+        mean = getattr(inputs, var_name)
+        shocks = draws[:, :, column] * std_dev
+        deviations = np.empty_like(shocks)
+        deviations[:, 0] = shocks[:, 0]
+        for year in range(1, years):
+            deviations[:, year] = (
+                autocorrelation * deviations[:, year - 1] + innovation_scale * shocks[:, year]
+            )
+        sampled = mean + deviations
+
+        sampled_values[var_name] = clip_sampled(var_name, sampled)
+
+    return sampled_values
+
+
+def clip_sampled(var_name: str, sampled: np.ndarray) -> np.ndarray:
+    """Clip sampled values to the variable's sampling bounds or valid range.
+
+    Args:
+        var_name: Randomized input
+        sampled: Sampled values
+
+    Returns:
+        Values clipped to SAMPLING_BOUNDS, or else the input's Field range
+    """
+    low, high = _SAMPLING_LIMITS[var_name]
+    return np.clip(sampled, low, high)
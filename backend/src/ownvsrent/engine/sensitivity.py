@@ -2,10 +2,24 @@
 
 This module varies key input parameters to show their impact on the
 rent vs. buy decision.
+
+The tornado chart varies one input at a time. Global (Sobol) sensitivity
+instead varies every input at once across a range and splits the variance of
+net benefit between inputs, including their interactions.
 """
 
-from ownvsrent.engine.calculator import calculate
-from ownvsrent.engine.types import CalculatorInputs, SensitivityResult
+from typing import get_args
+
+import numpy as np
+
+from ownvsrent.engine.batch import NUMERIC_FIELDS, calculate_batch
+from ownvsrent.engine.types import (
+    CalculatorInputs,
+    GlobalSensitivityResult,
+    SensitivityCurve,
+    SensitivityResult,
+    SobolIndex,
+)
 
 
 # Variables to analyze with their display labels and default delta ranges
@@ -20,6 +34,9 @@ SENSITIVITY_VARIABLES = [
     ("maintenance_rate", "Maintenance Rate", 0.005),  # ±0.5%
 ]
 
+# Loan terms CalculatorInputs allows
+LOAN_TERMS = get_args(CalculatorInputs.model_fields["loan_term_years"].annotation)
+
 
 def run_sensitivity_analysis(
     inputs: CalculatorInputs,
@@ -28,12 +45,16 @@ def run_sensitivity_analysis(
     """Run sensitivity analysis on key variables.
 
     For each variable, calculates the net benefit at low and high values
-    to show how sensitive the outcome is to that parameter.
+    to show how sensitive the outcome is to that parameter. The base case
+    and every low/high variant are evaluated together as one batch, so
+    adding variables costs little extra time.
 
     Args:
         inputs: Base calculator inputs
         variables: Optional list of (variable_name, label, delta) tuples.
-                   Defaults to SENSITIVITY_VARIABLES.
+                   Any numeric input can be varied; an empty label falls
+                   back to the default label. Defaults to
+                   SENSITIVITY_VARIABLES.
 
     Returns:
         List of SensitivityResult sorted by impact (highest first)
@@ -41,53 +62,59 @@ def run_sensitivity_analysis(
     if variables is None:
         variables = SENSITIVITY_VARIABLES
 
-    # Calculate base case
-    base_result = calculate(inputs)
-    base_outcome = base_result.net_benefit_at_horizon
-
-    results: list[SensitivityResult] = []
+    unknown = {name for name, _, _ in variables} - set(NUMERIC_FIELDS)
+    if unknown:
+        raise ValueError(f"Cannot vary input: {', '.join(sorted(unknown))}")
 
-    for var_name, label, delta in variables:
-        base_value = getattr(inputs, var_name)
+    ranges = [
+        _tornado_range(var_name, getattr(inputs, var_name), delta)
+        for var_name, _, delta in variables
+    ]
 
-        # Calculate low and high values
+    # Row 0 is the base case, followed by the low and high rows of each
+    # variable. Holding periods need no rows: the base row, simulated to the
+    # longest one, already holds net benefit for a sale in every year.
+    rows = 1
+    variant_rows = []
+    for var_name, _, _ in variables:
         if var_name == "holding_period_years":
-            # Integer variable
-            low_value = max(1, int(base_value - delta))
-            high_value = min(30, int(base_value + delta))
+            variant_rows.append(None)
+        else:
+            variant_rows.append((rows, rows + 1))
+            rows += 2
+
+    overrides = {}
+    years = inputs.holding_period_years
+    for (var_name, _, _), variant_range, variant_row in zip(variables, ranges, variant_rows):
+        if variant_row is None:
+            years = max(years, int(variant_range[1]))
+            continue
+        if var_name not in overrides:
+            overrides[var_name] = np.full(rows, float(getattr(inputs, var_name)))
+        overrides[var_name][list(variant_row)] = variant_range
+
+    batch = calculate_batch(inputs, overrides, years=years)
+    outcomes = np.broadcast_to(batch.net_benefit_at_horizon, (rows,))
+    base_outcome = float(outcomes[0])
+    base_by_year = np.broadcast_to(batch.net_benefit, (rows, batch.years))[0]
+    # A variant that cannot be evaluated falls back to the base outcome
+    outcomes = np.where(np.isfinite(outcomes), outcomes, base_outcome)
+    base_by_year = np.where(np.isfinite(base_by_year), base_by_year, base_outcome)
+
+    results: list[SensitivityResult] = []
+
+    for i, (var_name, label, _) in enumerate(variables):
+        if not label:
+            label = _default_label(var_name)
+        low_value, high_value = ranges[i]
+        if variant_rows[i] is None:
+            # Holding period: read the base row at the low and high sale years
+            low_outcome = float(base_by_year[int(low_value) - 1])
+            high_outcome = float(base_by_year[int(high_value) - 1])
         else:
-            # Float variable
-            low_value = max(0, base_value - delta)
-            high_value = base_value + delta
-
-            # Apply upper bounds for rate variables
-            if var_name == "annual_appreciation":
-                high_value = min(0.15, high_value)
-                low_value = max(-0.10, low_value)
-            elif var_name in ("mortgage_rate", "annual_investment_return"):
-                high_value = min(0.15, high_value)
-            elif var_name == "annual_rent_increase":
-                high_value = min(0.20, high_value)
-            elif var_name in ("property_tax_rate", "maintenance_rate"):
-                high_value = min(0.05, high_value)
-            elif var_name == "selling_costs_percent":
-                high_value = min(0.15, high_value)
-
-        # Calculate outcomes at low and high values
-        low_inputs = inputs.model_copy(update={var_name: low_value})
-        high_inputs = inputs.model_copy(update={var_name: high_value})
-
-        try:
-            low_result = calculate(low_inputs)
-            low_outcome = low_result.net_benefit_at_horizon
-        except Exception:
-            low_outcome = base_outcome
-
-        try:
-            high_result = calculate(high_inputs)
-            high_outcome = high_result.net_benefit_at_horizon
-        except Exception:
-            high_outcome = base_outcome
+            low_row, high_row = variant_rows[i]
+            low_outcome = float(outcomes[low_row])
+            high_outcome = float(outcomes[high_row])
 
         # Calculate impact (absolute spread)
         impact = abs(high_outcome - low_outcome)
@@ -109,3 +136,385 @@ def run_sensitivity_analysis(
     results.sort(key=lambda r: r.impact, reverse=True)
 
     return results
+
+
+def _tornado_range(var_name: str, base_value: float, delta: float) -> tuple[float, float]:
+    """Low and high values of a variable, kept within its valid range."""
+    if var_name == "holding_period_years":
+        # Integer variable
+        return max(1, int(base_value - delta)), min(30, int(base_value + delta))
+    if var_name == "loan_term_years":
+        # Nearest allowed terms at or beyond base -+ delta
+        shorter = [term for term in LOAN_TERMS if term <= base_value - delta]
+        longer = [term for term in LOAN_TERMS if term >= base_value + delta]
+        return max(shorter, default=min(LOAN_TERMS)), min(longer, default=max(LOAN_TERMS))
+
+    # Float variable
+    low_value = max(0, base_value - delta)
+    high_value = base_value + delta
+
+    # Apply upper bounds for rate variables
+    if var_name == "annual_appreciation":
+        high_value = min(0.15, high_value)
+        low_value = max(-0.10, low_value)
+    elif var_name in ("mortgage_rate", "annual_investment_return"):
+        high_value = min(0.15, high_value)
+    elif var_name == "annual_rent_increase":
+        high_value = min(0.20, high_value)
+    elif var_name in ("property_tax_rate", "maintenance_rate"):
+        high_value = min(0.05, high_value)
+    elif var_name == "selling_costs_percent":
+        high_value = min(0.15, high_value)
+
+    # Any other input stays within its Field bounds
+    low_bound, high_bound = field_bounds(var_name)
+    return max(low_value, low_bound), min(high_value, high_bound)
+
+
+def _default_label(var_name: str) -> str:
+    """Display label of an input: its tornado label, else derived from the name."""
+    for name, label, _ in SENSITIVITY_VARIABLES:
+        if name == var_name:
+            return label
+    return var_name.replace("_", " ").capitalize()
+
+
+# Half-width of curve ranges for inputs without an upper Field bound,
+# relative to the base value
+CURVE_FALLBACK_RANGE = 0.5
+
+
+def run_sensitivity_curves(
+    inputs: CalculatorInputs,
+    variables: list[str] | None = None,
+    points: int = 21,
+    ranges: dict[str, tuple[float, float]] | None = None,
+) -> list[SensitivityCurve]:
+    """Trace net benefit and break-even across each variable's range.
+
+    Each variable is evaluated at ``points`` evenly spaced values while the
+    others stay at their base values, and every point of every variable is
+    one row of a single batch. Holding periods need no rows: the base row,
+    simulated to 30 years, holds the outcome of every sale year.
+
+    Args:
+        inputs: Base calculator inputs
+        variables: Inputs to trace. Defaults to the tornado chart's
+            variables (SENSITIVITY_VARIABLES).
+        points: Values per variable. Whole-number inputs take each distinct
+            whole value (loan terms: each allowed term) in range once.
+        ranges: Optional (low, high) per variable. Defaults to the input's
+            Field bounds; inputs without an upper bound span
+            CURVE_FALLBACK_RANGE of the base value either way.
+
+    Returns:
+        One SensitivityCurve per variable, in the order given
+    """
+    if variables is None:
+        variables = [name for name, _, _ in SENSITIVITY_VARIABLES]
+    ranges = ranges or {}
+    unknown = set(variables) - set(NUMERIC_FIELDS)
+    if unknown:
+        raise ValueError(f"Cannot vary input: {', '.join(sorted(unknown))}")
+    if points < 2:
+        raise ValueError("Curves need at least 2 points")
+
+    curve_values = [_curve_values(inputs, name, points, ranges.get(name)) for name in variables]
+
+    # Row 0 is the base case; each other variable's points follow in order
+    rows = 1
+    curve_rows = []
+    for name, values in zip(variables, curve_values):
+        if name == "holding_period_years":
+            curve_rows.append(None)
+        else:
+            curve_rows.append(slice(rows, rows + len(values)))
+            rows += len(values)
+
+    overrides = {}
+    for name, values, row_slice in zip(variables, curve_values, curve_rows):
+        if row_slice is None:
+            continue
+        if name not in overrides:
+            overrides[name] = np.full(rows, float(getattr(inputs, name)))
+        overrides[name][row_slice] = values
+
+    horizons = [
+        int(values[-1])
+        for name, values in zip(variables, curve_values)
+        if name == "holding_period_years"
+    ]
+    years = max([inputs.holding_period_years, *horizons])
+    batch = calculate_batch(inputs, overrides, years=years)
+    net_benefit = np.broadcast_to(batch.net_benefit_at_horizon, rows)
+    break_even = np.broadcast_to(batch.break_even_years(), rows)
+    # The base row holds every holding period's outcome
+    base_by_year = np.broadcast_to(batch.net_benefit, (rows, batch.years))[0]
+    base_break_even = np.broadcast_to(batch.break_even_by_horizon(), (rows, batch.years))[0]
+
+    curves = []
+    for name, values, row_slice in zip(variables, curve_values, curve_rows):
+        if row_slice is None:
+            sale_years = values.astype(np.int64) - 1
+            outcomes = base_by_year[sale_years]
+            break_evens = base_break_even[sale_years]
+        else:
+            outcomes = net_benefit[row_slice]
+            break_evens = break_even[row_slice]
+        curves.append(
+            SensitivityCurve(
+                variable=name,
+                label=_default_label(name),
+                base_value=getattr(inputs, name),
+                values=values.tolist(),
+                net_benefit=outcomes.tolist(),
+                break_even_year=[int(year) or None for year in break_evens],
+            )
+        )
+    return curves
+
+
+def _curve_values(
+    inputs: CalculatorInputs,
+    name: str,
+    points: int,
+    value_range: tuple[float, float] | None,
+) -> np.ndarray:
+    """Evenly spaced values of one curve, snapped for whole-number inputs."""
+    low_bound, high_bound = field_bounds(name)
+    if value_range is None:
+        low, high = low_bound, high_bound
+        if np.isinf(high_bound):
+            # Dollar amounts have no upper bound; span around the base value
+            base = getattr(inputs, name)
+            low = max(low_bound, base * (1 - CURVE_FALLBACK_RANGE))
+            high = base * (1 + CURVE_FALLBACK_RANGE)
+    else:
+        low, high = value_range
+        check_range(name, low, high)
+
+    if name == "loan_term_years":
+        return np.array([term for term in LOAN_TERMS if low <= term <= high], dtype=float)
+    values = np.linspace(low, high, points)
+    if name == "holding_period_years":
+        values = np.unique(np.round(values))
+    return values
+
+
+# Half-width of default global ranges for inputs without a tornado delta,
+# relative to the base value
+DEFAULT_RELATIVE_RANGE = 0.2
+
+# Bootstrap resamples for Sobol index confidence intervals
+SOBOL_BOOTSTRAP_RESAMPLES = 100
+
+
+def run_global_sensitivity(
+    inputs: CalculatorInputs,
+    ranges: dict[str, tuple[float, float]] | None = None,
+    samples: int = 1024,
+    seed: int | None = None,
+) -> GlobalSensitivityResult:
+    """Compute first-order and total-effect Sobol indices of net benefit.
+
+    Every numeric input is drawn uniformly from its range. Saltelli's scheme
+    needs matrices A and B of ``samples`` draws each, plus for every input a
+    copy of A with that input's column taken from B; all
+    ``samples * (inputs + 2)`` scenarios are evaluated as one batch. First-
+    order indices use Saltelli's (2010) estimator and total effects Jansen's.
+
+    Args:
+        inputs: Base calculator inputs
+        ranges: Optional (low, high) per input. Inputs not listed vary over
+            their tornado delta (see SENSITIVITY_VARIABLES) or
+            +-DEFAULT_RELATIVE_RANGE of their base value, within the input's
+            valid bounds. A range with low == high holds an input fixed.
+        samples: Draws per Saltelli base matrix
+        seed: Optional random seed for reproducibility
+
+    Returns:
+        GlobalSensitivityResult with indices sorted by total effect
+    """
+    if samples < 2:
+        raise ValueError("At least 2 samples are required")
+
+    bounds = _global_ranges(inputs, ranges or {})
+    names = list(bounds)
+    dimensions = len(names)
+    rng = np.random.default_rng(seed)
+    a, b = rng.random((2, samples, dimensions))
+
+    # Rows: A, B, then A with column i from B for each input i
+    design = np.concatenate([a, b, np.repeat(a[None], dimensions, axis=0).reshape(-1, dimensions)])
+    for i in range(dimensions):
+        rows = slice((2 + i) * samples, (3 + i) * samples)
+        design[rows, i] = b[:, i]
+
+    overrides = {
+        name: _scale_uniform(name, design[:, column], *bounds[name])
+        for column, name in enumerate(names)
+    }
+    outcomes = calculate_batch(inputs, overrides).net_benefit_at_horizon
+    if not np.all(np.isfinite(outcomes)):
+        raise ValueError("Net benefit is undefined somewhere in the given ranges")
+
+    f_a = outcomes[:samples]
+    f_b = outcomes[samples : 2 * samples]
+    f_ab = outcomes[2 * samples :].reshape(dimensions, samples)
+
+    first_order, total_effect = _sobol_estimates(f_a, f_b, f_ab)
+
+    # Bootstrap over base-sample rows for 95% confidence half-widths
+    resamples = rng.integers(0, samples, (SOBOL_BOOTSTRAP_RESAMPLES, samples))
+    boot_first, boot_total = _sobol_estimates(
+        f_a[resamples], f_b[resamples], f_ab[:, resamples].transpose(1, 0, 2)
+    )
+    first_conf = 1.96 * boot_first.std(axis=0)
+    total_conf = 1.96 * boot_total.std(axis=0)
+
+    indices = [
+        SobolIndex(
+            variable=name,
+            low=bounds[name][0],
+            high=bounds[name][1],
+            first_order=first_order[i],
+            first_order_conf=first_conf[i],
+            total_effect=total_effect[i],
+            total_effect_conf=total_conf[i],
+        )
+        for i, name in enumerate(names)
+    ]
+    indices.sort(key=lambda index: index.total_effect, reverse=True)
+
+    both = np.concatenate([f_a, f_b])
+    return GlobalSensitivityResult(
+        samples=samples,
+        evaluations=len(outcomes),
+        mean=float(both.mean()),
+        variance=float(both.var()),
+        indices=indices,
+    )
+
+
+def _sobol_estimates(
+    f_a: np.ndarray, f_b: np.ndarray, f_ab: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """First-order and total-effect indices from Saltelli outputs.
+
+    Samples run along the last axis; ``f_ab`` has one more axis (before the
+    sample axis) for the inputs. Leading axes of ``f_a`` and ``f_b`` are
+    batch dimensions (e.g. bootstrap resamples).
+    """
+    both = np.concatenate([f_a, f_b], axis=-1)
+    variance = both.var(axis=-1)[..., None]
+    # Zero variance: nothing varies, so no input explains anything
+    variance = np.where(variance > 0, variance, np.inf)
+    # Centering leaves the estimators unbiased but cuts their noise when the
+    # mean is large relative to the spread
+    center = both.mean(axis=-1)[..., None]
+    f_a = (f_a - center)[..., None, :]
+    f_b = (f_b - center)[..., None, :]
+    f_ab = f_ab - center[..., None]
+    first_order = np.mean(f_b * (f_ab - f_a), axis=-1) / variance
+    total_effect = np.mean(np.square(f_a - f_ab), axis=-1) / 2 / variance
+    return first_order, total_effect
+
+
+def _global_ranges(
+    inputs: CalculatorInputs, ranges: dict[str, tuple[float, float]]
+) -> dict[str, tuple[float, float]]:
+    """Resolve the (low, high) range of every numeric input."""
+    unknown = set(ranges) - set(NUMERIC_FIELDS)
+    if unknown:
+        raise ValueError(f"Cannot vary input: {', '.join(sorted(unknown))}")
+
+    deltas = {name: delta for name, _, delta in SENSITIVITY_VARIABLES}
+    resolved = {}
+    for name in NUMERIC_FIELDS:
+        low_bound, high_bound = field_bounds(name)
+        if name in ranges:
+            low, high = ranges[name]
+            check_range(name, low, high)
+        else:
+            base = getattr(inputs, name)
+            delta = deltas.get(name, abs(base) * DEFAULT_RELATIVE_RANGE)
+            low = max(base - delta, low_bound)
+            high = min(base + delta, high_bound)
+        resolved[name] = (float(low), float(high))
+    return resolved
+
+
+def _scale_uniform(name: str, uniforms: np.ndarray, low: float, high: float) -> np.ndarray:
+    """Map uniform [0, 1) draws onto an input's range.
+
+    Whole-number inputs take each whole value in range with equal chance;
+    loan terms pick among the allowed terms in range.
+    """
+    if name == "loan_term_years":
+        allowed = [term for term in LOAN_TERMS if low <= term <= high]
+        if not allowed:
+            raise ValueError(f"No allowed loan term lies within [{low}, {high}]")
+        return np.asarray(allowed)[(uniforms * len(allowed)).astype(np.int64)]
+    if name == "holding_period_years":
+        first, last = np.ceil(low), np.floor(high)
+        if first > last:
+            raise ValueError(f"No whole holding period lies within [{low}, {high}]")
+        return first + np.floor(uniforms * (last - first + 1))
+    return low + uniforms * (high - low)
+
+
+def field_bounds(name: str) -> tuple[float, float]:
+    """Valid (low, high) range of a numeric input from its ``Field`` constraints.
+
+    Unbounded sides are infinite. Loan terms span the allowed terms.
+
+    Args:
+        name: CalculatorInputs field name
+
+    Returns:
+        Tuple of (low, high)
+    """
+    if name == "loan_term_years":
+        return float(min(LOAN_TERMS)), float(max(LOAN_TERMS))
+
+    low, high = -np.inf, np.inf
+    for constraint in CalculatorInputs.model_fields[name].metadata:
+        for attribute in ("ge", "gt"):
+            if getattr(constraint, attribute, None) is not None:
+                low = float(getattr(constraint, attribute))
+        for attribute in ("le", "lt"):
+            if getattr(constraint, attribute, None) is not None:
+                high = float(getattr(constraint, attribute))
+    return low, high
+
+
+def check_range(name: str, low: float, high: float) -> None:
+    """Reject a (low, high) range that is inverted or leaves an input's valid values.
+
+    Strict ``Field`` bounds (``gt``/``lt``) exclude the bound itself, so a
+    purchase price range may not start at 0.
+
+    Args:
+        name: CalculatorInputs field name
+        low: Lower end of the range
+        high: Upper end of the range
+
+    Raises:
+        ValueError: If low > high or the range extends past the field's bounds
+    """
+    if low > high:
+        raise ValueError(f"Range for {name} must have low <= high")
+    low_bound, high_bound = field_bounds(name)
+    low_open = high_open = False
+    if name != "loan_term_years":
+        metadata = CalculatorInputs.model_fields[name].metadata
+        low_open = any(getattr(constraint, "gt", None) is not None for constraint in metadata)
+        high_open = any(getattr(constraint, "lt", None) is not None for constraint in metadata)
+    if (
+        low < low_bound
+        or high > high_bound
+        or (low_open and low == low_bound)
+        or (high_open and high == high_bound)
+    ):
+        interval = f"{'(' if low_open else '['}{low_bound}, {high_bound}{')' if high_open else ']'}"
+        raise ValueError(f"Range for {name} must lie within {interval}")
@@ -0,0 +1,349 @@
+"""Goal seek: the value of one input at which buying and renting tie.
+
+Answers questions such as "what is the highest price at which buying still
+wins?" without the client binary-searching through ``/calculate``. Net
+benefit at the target year is a smooth function of each solvable input, so
+a coarse scan across the search range (one batch) brackets the tie and
+Brent's method refines it. Every evaluation simulates only up to the target
+year and keeps every other input fixed.
+
+Brent steps do not cache the schedules that stay fixed between iterations
+(amortization, rent and investment growth when another input varies). A
+solve takes about 35 evaluations: the 33-point scan, which shares those
+schedules inside one batch (see batch.py), and then only 2-5 single-row
+Brent steps of roughly 0.6 ms each. Most of a step is per-call parameter
+setup rather than the schedules, so caching them would save well under a
+millisecond per solve.
+
+The probabilistic variant solves for a target chance that buying wins
+under the Monte Carlo uncertainty model instead.
+"""
+
+import math
+from collections.abc import Callable
+
+import numpy as np
+
+from ownvsrent.engine.batch import calculate_batch
+from ownvsrent.engine.grid import win_probabilities
+from ownvsrent.engine.montecarlo import DEFAULT_BATCH_SIZE
+from ownvsrent.engine.sampling import sampling_model, standard_normals
+from ownvsrent.engine.sensitivity import field_bounds
+from ownvsrent.engine.types import (
+    CalculatorInputs,
+    ProbabilitySolveResult,
+    SolveResult,
+    SolveTarget,
+    SolveVariable,
+)
+
+# Values evaluated together to bracket the tie
+SOLVE_SCAN_POINTS = 33
+
+# Inputs without an upper bound are searched within base / span .. base * span
+SOLVE_RELATIVE_SPAN = 20
+
+# Bracket width, relative to the search range, at which Brent's method stops
+SOLVE_TOLERANCE = 1e-9
+
+# Win probabilities move in steps of one simulation, so a looser tolerance suffices
+PROBABILITY_SOLVE_TOLERANCE = 1e-6
+
+# Brent steps a probability solve may take after the scan
+PROBABILITY_SOLVE_MAX_ITERATIONS = 30
+
+# Most simulated years (simulations x values tried x years) one probability solve may cost
+MAX_PROBABILITY_SOLVE_YEARS = 1_500_000
+
+_EPSILON = np.finfo(float).eps
+
+
+def solve_for_input(
+    inputs: CalculatorInputs,
+    variable: SolveVariable,
+    target: SolveTarget = "net_benefit",
+    year: int | None = None,
+    low: float | None = None,
+    high: float | None = None,
+) -> SolveResult:
+    """Find the value of one input at which net benefit is zero.
+
+    Args:
+        inputs: Base calculator inputs; every other input stays fixed
+        variable: Input to solve for
+        target: "net_benefit" ties buying and renting at the holding period;
+            "break_even" ties them when selling at the end of ``year``
+        year: Sale year for the "break_even" target
+        low: Optional lower end of the search range
+        high: Optional upper end of the search range
+
+    Returns:
+        SolveResult with the tie value and on which side of it buying wins
+
+    Raises:
+        ValueError: If the range is invalid or net benefit does not change
+            sign within it
+    """
+    if target == "break_even":
+        if year is None:
+            raise ValueError("A year is required for the break_even target")
+        inputs = inputs.model_copy(update={"holding_period_years": year})
+    year = inputs.holding_period_years
+    low, high = _search_range(inputs, variable, low, high)
+
+    evaluations = 0
+
+    def net_benefit(values: np.ndarray) -> np.ndarray:
+        nonlocal evaluations
+        evaluations += len(values)
+        batch = calculate_batch(inputs, {variable: values})
+        return np.broadcast_to(batch.net_benefit_at_horizon, len(values))
+
+    base = getattr(inputs, variable)
+    root, rising = _find_root(
+        net_benefit, variable, base, low, high, xtol=SOLVE_TOLERANCE * (high - low)
+    )
+
+    return SolveResult(
+        variable=variable,
+        target=target,
+        year=year,
+        value=root,
+        base_value=base,
+        buy_wins_above=rising,
+        evaluations=evaluations,
+    )
+
+
+def solve_for_probability(
+    inputs: CalculatorInputs,
+    variable: SolveVariable,
+    buy_wins_pct: float,
+    target: SolveTarget = "net_benefit",
+    year: int | None = None,
+    low: float | None = None,
+    high: float | None = None,
+    simulations: int = 1000,
+    seed: int | None = None,
+    std_devs: dict[str, float] | None = None,
+    correlation: list[list[float]] | None = None,
+) -> ProbabilitySolveResult:
+    """Find the value of one input that gives buying a target chance to win.
+
+    One standard-normal sample matrix is drawn up front and reused for
+    every trial value (see grid.py), so the win probability is a
+    deterministic, monotone step function of the input rather than a fresh
+    noisy estimate per iteration. A randomized input is drawn around each
+    trial value.
+
+    Args:
+        inputs: Base calculator inputs (means for distributions)
+        variable: Input to solve for
+        buy_wins_pct: Target percentage of simulations in which buying wins
+        target: "net_benefit" compares at the holding period; "break_even"
+            when selling at the end of ``year``
+        year: Sale year for the "break_even" target
+        low: Optional lower end of the search range
+        high: Optional upper end of the search range
+        simulations: Number of simulations in the shared sample matrix
+        seed: Optional random seed for reproducibility
+        std_devs: Optional custom standard deviations (see `run_monte_carlo`)
+        correlation: Optional correlation matrix between the variables in
+            ``std_devs``, in their insertion order
+
+    Returns:
+        ProbabilitySolveResult with the required value
+
+    Raises:
+        ValueError: If the range is invalid, the target probability is not
+            reached within it, or the worst-case cost exceeds
+            MAX_PROBABILITY_SOLVE_YEARS
+    """
+    if not 0 < buy_wins_pct < 100:
+        raise ValueError("buy_wins_pct must be between 0 and 100 (exclusive)")
+    if target == "break_even":
+        if year is None:
+            raise ValueError("A year is required for the break_even target")
+        inputs = inputs.model_copy(update={"holding_period_years": year})
+    # The scan, every allowed Brent step and the base value
+    passes = SOLVE_SCAN_POINTS + PROBABILITY_SOLVE_MAX_ITERATIONS + 1
+    years = inputs.holding_period_years
+    if simulations * passes * years > MAX_PROBABILITY_SOLVE_YEARS:
+        raise ValueError(
+            f"{simulations} simulations x up to {passes} values tried x {years} years "
+            f"exceeds {MAX_PROBABILITY_SOLVE_YEARS:,} simulated years; "
+            f"use at most {MAX_PROBABILITY_SOLVE_YEARS // (passes * years)} simulations"
+        )
+    low, high = _search_range(inputs, variable, low, high)
+
+    std_devs, factor = sampling_model(std_devs, correlation, "constant", 0.0)
+    draws = standard_normals(np.random.default_rng(seed), (simulations, len(std_devs)), factor)
+    evaluations = 0
+
+    def excess_probability(values: np.ndarray) -> np.ndarray:
+        nonlocal evaluations
+        evaluations += len(values) * simulations
+        wins = win_probabilities(inputs, {variable: values}, std_devs, draws, DEFAULT_BATCH_SIZE)
+        return wins - buy_wins_pct
+
+    base = getattr(inputs, variable)
+    root, rising = _find_root(
+        excess_probability,
+        variable,
+        base,
+        low,
+        high,
+        xtol=PROBABILITY_SOLVE_TOLERANCE * (high - low),
+        max_iterations=PROBABILITY_SOLVE_MAX_ITERATIONS,
+    )
+
+    return ProbabilitySolveResult(
+        variable=variable,
+        buy_wins_pct=buy_wins_pct,
+        year=inputs.holding_period_years,
+        value=root,
+        base_value=base,
+        base_buy_wins_pct=float(excess_probability(np.array([base]))[0] + buy_wins_pct),
+        buy_wins_above=rising,
+        simulations=simulations,
+        evaluations=evaluations,
+    )
+
+
+def _find_root(
+    f: Callable[[np.ndarray], np.ndarray],
+    variable: str,
+    base: float,
+    low: float,
+    high: float,
+    xtol: float,
+    max_iterations: int = 100,
+) -> tuple[float, bool]:
+    """Zero of a vectorized objective in [low, high], nearest the base value.
+
+    A scan of SOLVE_SCAN_POINTS values (one call of ``f``) brackets every
+    sign change; Brent's method refines the one nearest ``base`` in at most
+    ``max_iterations`` further calls.
+
+    Returns:
+        Tuple of (root, whether ``f`` rises through the root)
+    """
+    points = np.linspace(low, high, SOLVE_SCAN_POINTS)
+    values = f(points)
+    signs = np.sign(values)
+    crossings = np.flatnonzero(signs[:-1] * signs[1:] <= 0)
+    if len(crossings) == 0:
+        side = "above" if np.nanmin(values) > 0 else "below"
+        raise ValueError(
+            f"Outcome does not change sign for {variable} between {low} and {high} "
+            f"(it stays {side} the target)"
+        )
+    index = crossings[np.argmin(np.abs(points[crossings] - base))]
+
+    root = _brent(
+        lambda x: float(f(np.array([x]))[0]),
+        points[index],
+        points[index + 1],
+        values[index],
+        values[index + 1],
+        xtol=xtol,
+        max_iterations=max_iterations,
+    )
+    return float(root), bool(values[index + 1] > values[index])
+
+
+def _search_range(
+    inputs: CalculatorInputs,
+    variable: SolveVariable,
+    low: float | None,
+    high: float | None,
+) -> tuple[float, float]:
+    """Resolve and validate the search range for a variable."""
+    low_bound, high_bound = field_bounds(variable)
+    if math.isinf(high_bound):
+        base = getattr(inputs, variable)
+        if base <= 0 and (low is None or high is None):
+            raise ValueError(f"Provide low and high to search for {variable}")
+        default_low, default_high = base / SOLVE_RELATIVE_SPAN, base * SOLVE_RELATIVE_SPAN
+    else:
+        default_low, default_high = low_bound, high_bound
+
+    low = default_low if low is None else low
+    high = default_high if high is None else high
+    if low >= high:
+        raise ValueError(f"Search range for {variable} must have low < high")
+    if low < low_bound or high > high_bound:
+        raise ValueError(f"Search range for {variable} must lie within [{low_bound}, {high_bound}]")
+    return float(low), float(high)
+
+
+def _brent(
+    f: Callable[[float], float],
+    a: float,
+    b: float,
+    fa: float,
+    fb: float,
+    xtol: float,
+    max_iterations: int = 100,
+) -> float:
+    """Root of ``f`` in [a, b] by Brent's method.
+
+    Combines inverse quadratic interpolation and the secant method with
+    bisection as a fallback, so convergence is superlinear for smooth
+    functions yet never slower than bisection.
+
+    Args:
+        f: Function of one variable
+        a: One end of the bracket
+        b: Other end of the bracket
+        fa: f(a)
+        fb: f(b), of opposite sign to fa (or zero)
+        xtol: Absolute tolerance on the root
+        max_iterations: Maximum evaluations of f
+
+    Returns:
+        The root, to within ``xtol``
+    """
+    if fa == 0:
+        return a
+    c, fc = a, fa
+    d = e = b - a
+    for _ in range(max_iterations):
+        if (fb > 0) == (fc > 0):
+            # Keep the root bracketed between b and c
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tolerance = 2 * _EPSILON * abs(b) + xtol / 2
+        midpoint = (c - b) / 2
+        if abs(midpoint) <= tolerance or fb == 0:
+            return b
+
+        if abs(e) >= tolerance and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                # Secant step
+                p, q = 2 * midpoint * s, 1 - s
+            else:
+                # Inverse quadratic interpolation
+                q, r = fa / fc, fb / fc
+                p = s * (2 * midpoint * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2 * p < min(3 * midpoint * q - abs(tolerance * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = midpoint
+        else:
+            d = e = midpoint
+
+        a, fa = b, fb
+        b += d if abs(d) > tolerance else math.copysign(tolerance, midpoint)
+        fb = f(b)
+
+    raise ValueError("Root finding did not converge")
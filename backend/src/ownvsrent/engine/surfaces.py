@@ -0,0 +1,332 @@
+"""Precomputed net benefit surfaces for instant approximate answers.
+
+Most requests start from the defaults or a city preset and move a few
+sliders. For each such starting point, net benefit is tabulated over a grid
+of the most-moved inputs (SURFACE_AXES) and every holding period: the whole
+table is one batch simulated to 30 years, each holding period being a column
+of the yearly net benefit. A request that differs from a starting point only
+in those inputs is then answered by multilinear interpolation in
+microseconds.
+
+The tables are built offline by scripts/build_surfaces.py and shipped as
+package data (data/surfaces.npz), which is loaded on import. Without that
+file every request falls back to the exact engine.
+
+Along each axis, linear interpolation of a smooth function errs by about
+4 t (1 - t) times its error at the edge midpoint, where t is the position
+within the cell. The build measures that midpoint error on every cell edge
+against the exact engine, and a query's error estimate is the sum over the
+axes of the position weight times the cell's largest edge error. The sum is
+then multiplied by a factor calibrated on random held-out points, so the
+estimate covers SURFACE_ERROR_COVERAGE of them. It remains an estimate:
+net benefit jumps where PMI starts or stops, and a jump inside a cell can
+exceed it. Requests outside a surface fall back to the exact engine.
+"""
+
+from dataclasses import dataclass
+from functools import cache
+from importlib import resources
+from pathlib import Path
+
+import numpy as np
+
+from ownvsrent.engine.batch import calculate_batch, verdict_labels
+from ownvsrent.engine.cities import CITY_PRESETS, LOCATION_FIELDS
+from ownvsrent.engine.defaults import DEFAULTS
+from ownvsrent.engine.types import CalculatorInputs, NetBenefitEstimate
+
+# Tabulated inputs and their grid nodes; holding periods 1-30 are exact
+SURFACE_AXES = {
+    "annual_appreciation": np.linspace(-0.02, 0.10, 9),
+    "annual_investment_return": np.linspace(0.02, 0.14, 7),
+    "mortgage_rate": np.linspace(0.03, 0.09, 7),
+    "down_payment_percent": np.linspace(0.0, 0.5, 6),
+}
+
+SURFACE_YEARS = 30
+
+# Bundled tables, written by scripts/build_surfaces.py
+SURFACE_FILE = "surfaces.npz"
+
+# Share of held-out points whose error the calibrated estimate covers
+SURFACE_ERROR_COVERAGE = 0.99
+
+# Random held-out points per surface used for calibration
+SURFACE_CALIBRATION_POINTS = 2000
+
+# Edge errors are stored as float16 in units of this many dollars
+EDGE_ERROR_UNIT = 1000.0
+
+_FLOAT32_EPSILON = float(np.finfo(np.float32).eps)
+
+
+@dataclass(frozen=True)
+class InterpolationSurface:
+    """Net benefit tabulated over SURFACE_AXES and every holding period.
+
+    ``net_benefit`` (float32) has one axis per entry of SURFACE_AXES plus a
+    last axis of holding periods. ``edge_error`` (float16, in units of
+    EDGE_ERROR_UNIT dollars, rounded up) has one entry per grid cell and
+    holding period, with a last axis holding the largest edge-midpoint
+    interpolation error of the cell along each of SURFACE_AXES.
+    """
+
+    name: str
+    net_benefit: np.ndarray
+    edge_error: np.ndarray
+
+
+def surface_base(name: str) -> CalculatorInputs:
+    """Starting point of a surface: the defaults, or a city preset over them.
+
+    Args:
+        name: "defaults" or a city slug
+
+    Returns:
+        Calculator inputs whose non-axis values the surface assumes
+    """
+    values = dict(DEFAULTS)
+    if name != "defaults":
+        preset = next((p for p in CITY_PRESETS if p.slug == name), None)
+        if preset is None:
+            raise ValueError(f"Unknown surface: {name}")
+        values.update({field: getattr(preset, field) for field in LOCATION_FIELDS})
+    return CalculatorInputs(**values)
+
+
+SURFACE_NAMES = ("defaults", *(preset.slug for preset in CITY_PRESETS))
+
+# Inputs a request must share with a surface's starting point
+_FIXED_FIELDS = tuple(
+    name
+    for name in CalculatorInputs.model_fields
+    if name not in SURFACE_AXES and name != "holding_period_years"
+)
+
+
+def build_surface(name: str) -> InterpolationSurface:
+    """Tabulate a surface and measure its edge interpolation errors.
+
+    Args:
+        name: "defaults" or a city slug
+
+    Returns:
+        The InterpolationSurface for the starting point
+    """
+    base = surface_base(name)
+    axes = list(SURFACE_AXES.values())
+    net_benefit = _tabulate(base, axes)
+
+    edge_error = []
+    for axis, nodes in enumerate(axes):
+        midpoints = [*axes[:axis], (nodes[:-1] + nodes[1:]) / 2, *axes[axis + 1 :]]
+        low = np.take(net_benefit, range(len(nodes) - 1), axis=axis)
+        high = np.take(net_benefit, range(1, len(nodes)), axis=axis)
+        error = np.abs(_tabulate(base, midpoints) - (low + high) / 2)
+        edge_error.append(_cell_max(error, skip=axis))
+
+    edge_error = np.stack(edge_error, axis=-1) / EDGE_ERROR_UNIT
+    stored_error = edge_error.astype(np.float16)
+    # Round up, so storage never shrinks an error estimate
+    rounded_down = stored_error < edge_error
+    stored_error[rounded_down] = np.nextafter(stored_error[rounded_down], np.float16(np.inf))
+
+    return InterpolationSurface(
+        name=name,
+        net_benefit=net_benefit.astype(np.float32),
+        edge_error=stored_error,
+    )
+
+
+def calibrate_error_scale(surfaces: dict[str, InterpolationSurface], seed: int = 0) -> float:
+    """Factor that makes the error estimate cover SURFACE_ERROR_COVERAGE of held-out points.
+
+    Args:
+        surfaces: Built surfaces by name
+        seed: Random seed for the held-out points
+
+    Returns:
+        The SURFACE_ERROR_COVERAGE quantile of actual / raw estimated error
+    """
+    rng = np.random.default_rng(seed)
+    ratios = []
+    for name, surface in surfaces.items():
+        base = surface_base(name)
+        overrides = {
+            axis: rng.uniform(nodes[0], nodes[-1], SURFACE_CALIBRATION_POINTS)
+            for axis, nodes in SURFACE_AXES.items()
+        }
+        overrides["holding_period_years"] = rng.integers(
+            1, SURFACE_YEARS + 1, SURFACE_CALIBRATION_POINTS
+        )
+        exact = calculate_batch(base, overrides).net_benefit_at_horizon
+
+        for i in range(SURFACE_CALIBRATION_POINTS):
+            update = {axis: values[i].item() for axis, values in overrides.items()}
+            net_benefit, raw_error = _interpolate(surface, base.model_copy(update=update), 1.0)
+            ratios.append(abs(net_benefit - exact[i]) / raw_error)
+    return float(np.quantile(ratios, SURFACE_ERROR_COVERAGE))
+
+
+def write_surfaces(path: Path) -> None:
+    """Build and calibrate every surface and save them to ``path``.
+
+    Args:
+        path: Destination .npz file (normally data/SURFACE_FILE)
+    """
+    surfaces = {name: build_surface(name) for name in SURFACE_NAMES}
+    arrays = {"error_scale": np.array(calibrate_error_scale(surfaces))}
+    for name, surface in surfaces.items():
+        arrays[f"{name}/net_benefit"] = surface.net_benefit
+        arrays[f"{name}/edge_error"] = surface.edge_error
+    np.savez_compressed(path, **arrays)
+
+
+def load_surfaces() -> tuple[dict[str, InterpolationSurface], float]:
+    """Load the bundled surfaces.
+
+    Returns:
+        Tuple of (surfaces by name, calibrated error scale); no surfaces
+        when the data file has not been built
+    """
+    source = resources.files("ownvsrent.engine").joinpath("data", SURFACE_FILE)
+    if not source.is_file():
+        return {}, 1.0
+    surfaces = {}
+    with source.open("rb") as f, np.load(f) as data:
+        for name in SURFACE_NAMES:
+            if f"{name}/net_benefit" not in data:
+                continue
+            surface = InterpolationSurface(
+                name=name,
+                net_benefit=data[f"{name}/net_benefit"],
+                edge_error=data[f"{name}/edge_error"],
+            )
+            surface.net_benefit.setflags(write=False)
+            surface.edge_error.setflags(write=False)
+            surfaces[name] = surface
+        error_scale = float(data["error_scale"])
+    return surfaces, error_scale
+
+
+_SURFACES, _ERROR_SCALE = load_surfaces()
+
+
+def get_surface(name: str) -> InterpolationSurface:
+    """Return the bundled surface for a starting point.
+
+    Args:
+        name: "defaults" or a city slug
+
+    Returns:
+        The InterpolationSurface loaded from package data
+
+    Raises:
+        ValueError: If no surface with that name was loaded
+    """
+    if name not in _SURFACES:
+        raise ValueError(f"Unknown surface: {name}")
+    return _SURFACES[name]
+
+
+def estimate_net_benefit(inputs: CalculatorInputs, approximate: bool = False) -> NetBenefitEstimate:
+    """Net benefit at the holding period, optionally from a surface.
+
+    Args:
+        inputs: Calculator inputs
+        approximate: Interpolate from a precomputed surface when the inputs
+            differ from the defaults or a city preset only in SURFACE_AXES
+            (within their grid) and the holding period
+
+    Returns:
+        NetBenefitEstimate; ``approximate`` tells whether a surface was used
+    """
+    if approximate:
+        name = _matching_surface(inputs)
+        if name is not None:
+            net_benefit, error_estimate = _interpolate(get_surface(name), inputs, _ERROR_SCALE)
+            return NetBenefitEstimate(
+                net_benefit=net_benefit,
+                verdict=verdict_labels(np.array(net_benefit)).item(),
+                approximate=True,
+                error_estimate=error_estimate,
+                surface=name,
+            )
+
+    net_benefit = float(calculate_batch(inputs).net_benefit_at_horizon[0])
+    return NetBenefitEstimate(
+        net_benefit=net_benefit,
+        verdict=verdict_labels(np.array(net_benefit)).item(),
+        approximate=False,
+        error_estimate=0.0,
+    )
+
+
+def _matching_surface(inputs: CalculatorInputs) -> str | None:
+    """Name of a loaded surface covering the inputs, if any."""
+    for axis, nodes in SURFACE_AXES.items():
+        if not nodes[0] <= getattr(inputs, axis) <= nodes[-1]:
+            return None
+    fixed = tuple(getattr(inputs, name) for name in _FIXED_FIELDS)
+    return _surface_keys().get(fixed)
+
+
+@cache
+def _surface_keys() -> dict[tuple, str]:
+    """Fixed-input values of every loaded surface's starting point, built on first use."""
+    return {
+        tuple(getattr(surface_base(name), field) for field in _FIXED_FIELDS): name
+        for name in reversed(SURFACE_NAMES)
+        if name in _SURFACES
+    }
+
+
+def _tabulate(base: CalculatorInputs, axes: list[np.ndarray]) -> np.ndarray:
+    """Net benefit at every combination of axis values and every holding period."""
+    nodes = np.meshgrid(*axes, indexing="ij")
+    overrides = {axis: grid.ravel() for axis, grid in zip(SURFACE_AXES, nodes)}
+    overrides["holding_period_years"] = SURFACE_YEARS
+
+    batch = calculate_batch(base, overrides)
+    net_benefit = np.broadcast_to(batch.net_benefit, (nodes[0].size, SURFACE_YEARS))
+    return net_benefit.reshape(*nodes[0].shape, SURFACE_YEARS)
+
+
+def _interpolate(
+    surface: InterpolationSurface, inputs: CalculatorInputs, error_scale: float
+) -> tuple[float, float]:
+    """Multilinear interpolation and its estimated error at the inputs."""
+    column = inputs.holding_period_years - 1
+    corners = surface.net_benefit[..., column].astype(float)
+    cell = []
+    position_weights = []
+    for axis, nodes in SURFACE_AXES.items():
+        value = getattr(inputs, axis)
+        index = int(np.clip(np.searchsorted(nodes, value, side="right") - 1, 0, len(nodes) - 2))
+        cell.append(index)
+        weight = (value - nodes[index]) / (nodes[index + 1] - nodes[index])
+        position_weights.append(4 * weight * (1 - weight))
+        # Collapse this axis: the remaining axes keep their full extent
+        corners = corners[index] * (1 - weight) + corners[index + 1] * weight
+    net_benefit = float(corners)
+    edge_error = surface.edge_error[(*cell, column)].astype(float) * EDGE_ERROR_UNIT
+    error_estimate = error_scale * float(np.dot(position_weights, edge_error))
+    # Allow for float32 storage of the tabulated values
+    error_estimate += abs(net_benefit) * _FLOAT32_EPSILON * 2
+    return net_benefit, error_estimate
+
+
+def _cell_max(values: np.ndarray, skip: int) -> np.ndarray:
+    """Largest value over each grid cell's edges along the gridded axes except ``skip``.
+
+    The last axis (holding periods) is not gridded.
+    """
+    for axis in range(values.ndim - 1):
+        if axis == skip:
+            continue
+        size = values.shape[axis]
+        values = np.maximum(
+            np.take(values, range(size - 1), axis=axis),
+            np.take(values, range(1, size), axis=axis),
+        )
+    return values
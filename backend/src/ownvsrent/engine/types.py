@@ -126,12 +126,493 @@ class SensitivityResult(BaseModel):
     impact: float
 
 
+class SensitivityCurvesRequest(BaseModel):
+    """Inputs plus the variables to trace across their ranges."""
+
+    inputs: CalculatorInputs
+    variables: list[str] | None = Field(default=None, min_length=1, max_length=30)
+    points: int = Field(default=21, ge=2, le=101, description="Values per variable")
+    ranges: dict[str, tuple[float, float]] | None = Field(
+        default=None, description="(low, high) per variable; others use Field bounds"
+    )
+
+
+class SensitivityCurve(BaseModel):
+    """Outcome across the range of one input (one line of a spider plot)."""
+
+    variable: str
+    label: str
+    base_value: float
+    values: list[float]
+    net_benefit: list[float]
+    break_even_year: list[int | None]
+
+
+class InputGradient(BaseModel):
+    """Local effect of one input on net benefit."""
+
+    variable: str
+    value: float
+    derivative: float  # d(net benefit) / d(input)
+    impact_per_percent: float  # change in net benefit for a 1% relative change
+
+
+class GradientResult(BaseModel):
+    """Net benefit with its exact derivative for every continuous input."""
+
+    net_benefit: float
+    gradients: list[InputGradient]  # sorted by |impact_per_percent|
+
+
+class SensitivityVariable(BaseModel):
+    """An input to vary in the tornado chart."""
+
+    variable: str
+    delta: float = Field(gt=0, description="Amount to vary the input by, each way")
+    label: str = ""  # defaults to a label derived from the variable name
+
+
+class SensitivityRequest(BaseModel):
+    """Inputs plus the variables to vary in the tornado chart."""
+
+    inputs: CalculatorInputs
+    variables: list[SensitivityVariable] = Field(min_length=1, max_length=50)
+
+
+class GridAxis(BaseModel):
+    """One input of a heatmap grid and the values it spans."""
+
+    variable: str
+    low: float
+    high: float
+    steps: int = Field(ge=1, le=100, description="Evenly spaced values from low to high")
+
+
+class GridRequest(BaseModel):
+    """Inputs plus the two inputs to vary across a heatmap grid."""
+
+    inputs: CalculatorInputs
+    x: GridAxis
+    y: GridAxis
+    std_devs: dict[str, float] | None = Field(
+        default=None, description="Standard deviation per randomized input"
+    )
+    correlation: list[list[float]] | None = Field(
+        default=None, description="Correlation matrix in std_devs order"
+    )
+
+
+class GridResult(BaseModel):
+    """Net benefit and verdict for every cell of a two-input grid."""
+
+    x_variable: str
+    y_variable: str
+    x_values: list[float]
+    y_values: list[float]
+    net_benefit: list[list[float]]  # indexed [y][x]
+    verdicts: list[list[Literal["buy", "rent", "toss-up"]]]
+    simulations: int = 0  # Monte Carlo simulations per cell, if any
+    buy_wins_pct: list[list[float]] | None = None  # indexed [y][x]
+
+
+SolveVariable = Literal[
+    "purchase_price",
+    "monthly_rent",
+    "annual_appreciation",
+    "mortgage_rate",
+    "down_payment_percent",
+]
+SolveTarget = Literal["net_benefit", "break_even"]
+
+
+class SolveRequest(BaseModel):
+    """Goal seek: the input to solve for and the tie to aim at."""
+
+    inputs: CalculatorInputs
+    variable: SolveVariable
+    target: SolveTarget = "net_benefit"
+    year: int | None = Field(
+        default=None, ge=1, le=30, description="Sale year for the break_even target"
+    )
+    low: float | None = Field(default=None, description="Lower end of the search range")
+    high: float | None = Field(default=None, description="Upper end of the search range")
+
+
+class SolveResult(BaseModel):
+    """Value of an input at which buying and renting tie."""
+
+    variable: str
+    target: SolveTarget
+    year: int  # sale year at which net benefit is zero
+    value: float
+    base_value: float
+    buy_wins_above: bool  # whether buying wins for values above the tie
+    evaluations: int
+
+
+class ProbabilitySolveRequest(BaseModel):
+    """Probabilistic goal seek: the input needed for a target chance buying wins."""
+
+    inputs: CalculatorInputs
+    variable: SolveVariable
+    buy_wins_pct: float = Field(gt=0, lt=100, description="Target chance buying wins (%)")
+    target: SolveTarget = "net_benefit"
+    year: int | None = Field(
+        default=None, ge=1, le=30, description="Sale year for the break_even target"
+    )
+    low: float | None = Field(default=None, description="Lower end of the search range")
+    high: float | None = Field(default=None, description="Upper end of the search range")
+    std_devs: dict[str, float] | None = Field(
+        default=None, description="Standard deviation per randomized input"
+    )
+    correlation: list[list[float]] | None = Field(
+        default=None, description="Correlation matrix in std_devs order"
+    )
+
+
+class ProbabilitySolveResult(BaseModel):
+    """Value of an input at which buying wins with a target probability."""
+
+    variable: str
+    buy_wins_pct: float  # target chance buying wins
+    year: int
+    value: float
+    base_value: float
+    base_buy_wins_pct: float  # chance buying wins at the base value
+    buy_wins_above: bool  # whether the chance is higher above the value
+    simulations: int
+    evaluations: int  # scenarios evaluated (values tried x simulations)
+
+
+class FinancingRequest(BaseModel):
+    """Inputs plus the down payments and holding periods to try."""
+
+    inputs: CalculatorInputs
+    down_payments: list[float] | None = Field(
+        default=None, min_length=1, max_length=20, description="Down payment fractions"
+    )
+    holding_periods: list[int] | None = Field(
+        default=None, min_length=1, max_length=30, description="Holding periods in years"
+    )
+
+
+class FinancingOption(BaseModel):
+    """One combination of loan term, down payment and holding period."""
+
+    loan_term_years: int
+    down_payment_percent: float
+    holding_period_years: int
+    net_benefit: float
+    monthly_cost: float  # first month's total ownership cost
+    monthly_mortgage_payment: float
+    verdict: Literal["buy", "rent", "toss-up"]
+
+
+class FinancingResult(BaseModel):
+    """Pareto-optimal financing options."""
+
+    evaluated: int  # combinations tried
+    options: list[FinancingOption]  # by holding period, then net benefit (highest first)
+
+
+class HorizonOutcome(BaseModel):
+    """Outcome of selling at the end of one holding period."""
+
+    holding_period_years: int
+    net_benefit: float
+    verdict: Literal["buy", "rent", "toss-up"]
+    break_even_year: int | None
+    rent_equivalent: float
+
+
+class HorizonsResult(BaseModel):
+    """Outcomes for every holding period from one simulation."""
+
+    horizons: list[HorizonOutcome]  # holding periods 1, 2, ...
+
+
+class CityPreset(BaseModel):
+    """Location-specific inputs for a preset city."""
+
+    name: str
+    slug: str
+    monthly_rent: float
+    purchase_price: float
+    property_tax_rate: float
+    home_insurance_rate: float
+    hoa_monthly: float
+    state_tax_rate: float
+
+
+class CityCompareRequest(BaseModel):
+    """The user's inputs plus the cities to evaluate them in."""
+
+    inputs: CalculatorInputs
+    cities: list[str] | None = Field(
+        default=None, min_length=1, description="City slugs; defaults to every preset"
+    )
+
+
+class CityComparison(BaseModel):
+    """Outcome of the user's situation in one city."""
+
+    name: str
+    slug: str
+    rank: int  # 1 = most favorable to buying
+    verdict: Literal["buy", "rent", "toss-up"]
+    net_benefit: float
+    rent_equivalent: float
+    monthly_rent: float
+    monthly_cost: float  # first month's total ownership cost
+    break_even_year: int | None
+
+
+class CityComparisonResult(BaseModel):
+    """Cities ranked by net benefit."""
+
+    cities: list[CityComparison]
+
+
+class NetBenefitEstimate(BaseModel):
+    """Net benefit at the holding period, exact or from a precomputed surface."""
+
+    net_benefit: float
+    verdict: Literal["buy", "rent", "toss-up"]
+    approximate: bool  # False when the exact engine answered
+    error_estimate: float  # estimated |approximate - exact| (not a guarantee); 0 when exact
+    surface: str | None = None  # "defaults" or a city slug when approximate
+
+
+class SobolIndex(BaseModel):
+    """Share of net benefit variance attributable to one input."""
+
+    variable: str
+    low: float
+    high: float
+    first_order: float  # variance explained by this input alone
+    first_order_conf: float  # 95% confidence half-width
+    total_effect: float  # including every interaction with other inputs
+    total_effect_conf: float
+
+
+class GlobalSensitivityRequest(BaseModel):
+    """Inputs plus optional ranges for global sensitivity analysis."""
+
+    inputs: CalculatorInputs
+    ranges: dict[str, tuple[float, float]] | None = Field(
+        default=None, description="(low, high) per input; others use default ranges"
+    )
+
+
+class GlobalSensitivityResult(BaseModel):
+    """Variance-based (Sobol) sensitivity of net benefit."""
+
+    samples: int
+    evaluations: int
+    mean: float
+    variance: float
+    indices: list[SobolIndex]  # sorted by total effect
+
+
+DistributionFormat = Literal["histogram", "quantiles", "sketch", "full"]
+
+# Floating-point precision of vectorized (scenarios x months) intermediates
+ComputeDtype = Literal["float64", "float32"]
+
+# How uncertainty is evaluated: Monte Carlo draws, or analytic moment propagation
+UncertaintyMethod = Literal["simulation", "moments"]
+
+# Time step of the vectorized kernel: exact monthly, or a coarse annual model
+TimeResolution = Literal["monthly", "annual"]
+
+# How Monte Carlo picks the sale year: always the holding period, or drawn
+# from a typical tenure distribution centred on it
+HoldingPeriodMode = Literal["fixed", "empirical"]
+
+# How Monte Carlo draws rates: one rate per simulation, one per simulated year,
+# or per-year rates resampled in blocks from history
+SimulationMode = Literal["constant", "path", "bootstrap"]
+
+
+class Histogram(BaseModel):
+    """Fixed-bin histogram of simulated outcomes."""
+
+    bin_edges: list[float]
+    counts: list[int]
+
+
+class QuantileGrid(BaseModel):
+    """Outcome values at a grid of quantile levels."""
+
+    levels: list[float]
+    values: list[float]
+
+
+class QuantileSketch(BaseModel):
+    """Serialized t-digest; sketches from separate runs can be merged."""
+
+    compression: float
+    count: int
+    min: float
+    max: float
+    means: list[float]
+    weights: list[float]
+
+
+class MonteCarloRequest(BaseModel):
+    """Monte Carlo request with a custom, optionally correlated, uncertainty model."""
+
+    inputs: CalculatorInputs
+    std_devs: dict[str, float] | None = Field(
+        default=None, description="Standard deviation per randomized input"
+    )
+    correlation: list[list[float]] | None = Field(
+        default=None, description="Correlation matrix in std_devs order"
+    )
+    holding_period_weights: list[float] | None = Field(
+        default=None,
+        description="Relative chance of selling at the end of year 1, 2, ...",
+    )
+
+
 class MonteCarloResult(BaseModel):
-    """Monte Carlo simulation results."""
+    """Monte Carlo simulation results.
+
+    Exactly one of the distribution fields is populated, depending on the
+    requested distribution format.
+    """
 
     simulations: int
     buy_wins_pct: float
     median: float
     p10: float
     p90: float
-    distribution: list[float]
+    distribution_format: DistributionFormat = "full"
+    distribution: list[float] | None = None
+    histogram: Histogram | None = None
+    quantiles: QuantileGrid | None = None
+    sketch: QuantileSketch | None = None
+
+
+class PercentileBand(BaseModel):
+    """10th, 50th and 90th percentiles of a simulated quantity."""
+
+    p10: float
+    median: float
+    p90: float
+
+
+class FanChartYear(BaseModel):
+    """Simulated outcome spread at the end of one year."""
+
+    year: int
+    buyer_wealth: PercentileBand
+    renter_wealth: PercentileBand
+    net_benefit: PercentileBand
+    buy_ahead_pct: float  # share of simulations with positive net benefit
+    break_even_pct: float  # share of simulations first breaking even this year
+
+
+class FanChartResult(BaseModel):
+    """Year-by-year Monte Carlo percentile bands (values as in yearly snapshots)."""
+
+    simulations: int
+    years: list[FanChartYear]
+    never_breaks_even_pct: float
+    median_break_even_year: int | None  # None if most simulations never break even
+
+
+class CompareRequest(BaseModel):
+    """Two scenarios to compare under the same uncertainty model."""
+
+    a: CalculatorInputs
+    b: CalculatorInputs
+    std_devs: dict[str, float] | None = Field(
+        default=None, description="Standard deviation per randomized input"
+    )
+    correlation: list[list[float]] | None = Field(
+        default=None, description="Correlation matrix in std_devs order"
+    )
+
+
+class PairedMonteCarloResult(BaseModel):
+    """Distribution of scenario A's net benefit minus scenario B's.
+
+    Exactly one of the distribution fields is populated, depending on the
+    requested distribution format.
+    """
+
+    simulations: int
+    a_wins_pct: float  # share of draws where A's net benefit exceeds B's
+    mean_difference: float
+    std_error: float  # standard error of mean_difference
+    median: float
+    p10: float
+    p90: float
+    median_a: float
+    median_b: float
+    distribution_format: DistributionFormat = "full"
+    distribution: list[float] | None = None
+    histogram: Histogram | None = None
+    quantiles: QuantileGrid | None = None
+    sketch: QuantileSketch | None = None
+
+
+class TailRiskResult(BaseModel):
+    """Importance-sampled estimate of a large loss from buying.
+
+    Loss is renting's advantage over buying (-net benefit), in dollars.
+    """
+
+    loss_threshold: float
+    simulations: int
+    probability: float  # P(loss > loss_threshold)
+    probability_std_error: float
+    plain_std_error: float  # standard error plain Monte Carlo would have
+    expected_shortfall: float | None  # E[loss | loss > loss_threshold]
+    expected_shortfall_std_error: float | None
+    effective_sample_size: float
+    shift: dict[str, float]  # sampling mean shift, in standard deviations
+
+
+class MultilevelLevel(BaseModel):
+    """Samples and statistics of one multilevel Monte Carlo level."""
+
+    name: str
+    samples: int
+    mean: float
+    variance: float
+    cost_per_sample: float  # simulated time steps per draw
+
+
+class MultilevelResult(BaseModel):
+    """Multilevel Monte Carlo estimate of the expected net benefit."""
+
+    mean: float
+    std_error: float
+    target_std_error: float
+    levels: list[MultilevelLevel]
+    total_cost: float  # simulated time steps across all levels
+    plain_cost: float  # time steps plain monthly Monte Carlo would need
+    target_met: bool  # False when the cost budget stopped short of the target
+
+
+class BacktestWindow(BaseModel):
+    """Outcome of the scenario over one historical window."""
+
+    start_year: int
+    end_year: int
+    net_benefit: float  # positive = buy wins
+
+
+class BacktestResult(BaseModel):
+    """Distribution of outcomes across rolling historical windows."""
+
+    windows: int
+    buy_wins_pct: float
+    median: float
+    p10: float
+    p90: float
+    best: BacktestWindow
+    worst: BacktestWindow
+    results: list[BacktestWindow]  # in start-year order
@@ -3,10 +3,49 @@
 import pytest
 from fastapi.testclient import TestClient
 
+from ownvsrent.engine.types import CalculatorInputs
 from ownvsrent.main import app
 
+# Calculator inputs for a typical scenario
+DEFAULT_PAYLOAD = {
+    "monthly_rent": 2000,
+    "annual_rent_increase": 0.03,
+    "renter_insurance": 30,
+    "security_deposit": 1.0,
+    "broker_fee": 0.0,
+    "purchase_price": 400_000,
+    "down_payment_percent": 0.20,
+    "mortgage_rate": 0.068,
+    "loan_term_years": 30,
+    "property_tax_rate": 0.011,
+    "home_insurance_rate": 0.005,
+    "hoa_monthly": 0,
+    "maintenance_rate": 0.015,
+    "pmi_rate": 0.0075,
+    "buyer_closing_costs_percent": 0.03,
+    "selling_costs_percent": 0.08,
+    "holding_period_years": 7,
+    "annual_appreciation": 0.035,
+    "annual_investment_return": 0.07,
+    "marginal_tax_rate": 0.22,
+    "state_tax_rate": 0.05,
+    "filing_status": "single",
+    "capital_gains_tax_rate": 0.15,
+}
+
+
+def make_inputs(**overrides) -> CalculatorInputs:
+    """Create test inputs with defaults."""
+    return CalculatorInputs(**{**DEFAULT_PAYLOAD, **overrides})
+
 
 @pytest.fixture
 def client():
     """Create a test client for the FastAPI app."""
     return TestClient(app)
+
+
+@pytest.fixture
+def payload():
+    """Calculator inputs for a typical scenario, as a JSON request body."""
+    return dict(DEFAULT_PAYLOAD)
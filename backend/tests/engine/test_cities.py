@@ -0,0 +1,82 @@
+"""Tests for city presets and cross-city comparison."""
+
+import re
+from pathlib import Path
+
+import pytest
+
+from ownvsrent.engine.calculator import calculate
+from ownvsrent.engine.cities import (
+    CITY_PRESETS,
+    LOCATION_FIELDS,
+    compare_cities,
+    get_city_preset,
+)
+from tests.conftest import make_inputs
+
+FRONTEND_CITIES = Path(__file__).parents[3] / "frontend" / "src" / "data" / "cities.ts"
+
+
+class TestCityPresets:
+    """Tests for the ported presets."""
+
+    def test_slugs_unique(self):
+        """Every preset should have its own slug."""
+        slugs = [preset.slug for preset in CITY_PRESETS]
+        assert len(slugs) == len(set(slugs))
+
+    def test_presets_are_valid_inputs(self):
+        """Every preset should produce valid calculator inputs."""
+        for preset in CITY_PRESETS:
+            make_inputs(**{name: getattr(preset, name) for name in LOCATION_FIELDS})
+
+    @pytest.mark.skipif(not FRONTEND_CITIES.exists(), reason="frontend not checked out")
+    def test_match_frontend(self):
+        """Presets should match the frontend's city data."""
+        source = FRONTEND_CITIES.read_text()
+        slugs = re.findall(r"slug: '([^']+)'", source)
+        assert slugs == [preset.slug for preset in CITY_PRESETS]
+        for name in LOCATION_FIELDS:
+            values = [float(value) for value in re.findall(rf"\b{name}: ([\d.]+),", source)]
+            assert values == [getattr(preset, name) for preset in CITY_PRESETS]
+
+    def test_unknown_slug(self):
+        """Unknown slugs should raise."""
+        assert get_city_preset("austin").name == "Austin"
+        with pytest.raises(ValueError, match="Unknown city"):
+            get_city_preset("atlantis")
+
+
+class TestCompareCities:
+    """Tests for compare_cities."""
+
+    def test_every_city_matches_calculate(self):
+        """Each city should match calculate() with the preset overlaid."""
+        inputs = make_inputs(down_payment_percent=0.1, holding_period_years=12)
+        result = compare_cities(inputs)
+
+        assert len(result.cities) == len(CITY_PRESETS)
+        for city in result.cities:
+            preset = get_city_preset(city.slug)
+            expected = calculate(
+                inputs.model_copy(update={name: getattr(preset, name) for name in LOCATION_FIELDS})
+            )
+            assert city.net_benefit == pytest.approx(expected.net_benefit_at_horizon, rel=1e-9)
+            assert city.rent_equivalent == pytest.approx(expected.rent_equivalent, rel=1e-9)
+            assert city.monthly_cost == pytest.approx(expected.monthly_ownership_cost)
+            assert city.break_even_year == expected.break_even_year
+            assert city.verdict == expected.verdict
+
+    def test_ranked_by_net_benefit(self):
+        """Cities should be ranked from most to least favorable to buying."""
+        result = compare_cities(make_inputs())
+        net_benefits = [city.net_benefit for city in result.cities]
+        assert net_benefits == sorted(net_benefits, reverse=True)
+        assert [city.rank for city in result.cities] == list(range(1, len(CITY_PRESETS) + 1))
+
+    def test_selected_cities(self):
+        """Only the requested cities should be compared."""
+        result = compare_cities(make_inputs(), ["san-francisco", "houston"])
+        assert {city.slug for city in result.cities} == {"san-francisco", "houston"}
+        with pytest.raises(ValueError, match="Unknown city"):
+            compare_cities(make_inputs(), ["atlantis"])
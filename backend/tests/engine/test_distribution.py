@@ -0,0 +1,133 @@
+"""Tests for distribution summaries and the quantile digest."""
+
+import numpy as np
+import pytest
+
+from ownvsrent.engine.distribution import (
+    QuantileDigest,
+    build_histogram,
+    build_quantile_grid,
+    summarize_distribution,
+)
+
+
+class TestHistogram:
+    """Test fixed-bin histograms."""
+
+    def test_counts_sum_to_samples(self):
+        """Every sample should land in a bin."""
+        values = np.random.default_rng(0).normal(size=1000)
+        hist = build_histogram(values, bins=25)
+
+        assert sum(hist.counts) == 1000
+        assert len(hist.bin_edges) == 26
+
+    def test_edges_span_range(self):
+        """Bin edges should span the sample range."""
+        hist = build_histogram([1.0, 2.0, 3.0], bins=2)
+
+        assert hist.bin_edges[0] == 1.0
+        assert hist.bin_edges[-1] == 3.0
+
+    def test_constant_samples(self):
+        """Identical samples should still produce a valid histogram."""
+        hist = build_histogram([5.0] * 10, bins=4)
+
+        assert sum(hist.counts) == 10
+
+
+class TestQuantileGrid:
+    """Test quantile grids."""
+
+    def test_default_percentiles(self):
+        """Default grid should hold every percentile."""
+        grid = build_quantile_grid(np.arange(101))
+
+        assert len(grid.values) == 99
+        assert grid.values[49] == pytest.approx(50)
+
+    def test_custom_levels(self):
+        """Custom levels should be honoured."""
+        grid = build_quantile_grid(np.arange(11), levels=[0.1, 0.9])
+
+        assert grid.values == pytest.approx([1, 9])
+
+
+class TestQuantileDigest:
+    """Test the t-digest sketch."""
+
+    def test_small_input_exact_extremes(self):
+        """Min and max should be tracked exactly."""
+        digest = QuantileDigest()
+        digest.update([3.0, 1.0, 2.0])
+
+        assert digest.quantiles([0.0, 1.0]).tolist() == [1.0, 3.0]
+
+    def test_bounded_size(self):
+        """Centroid count should not grow with the sample count."""
+        digest = QuantileDigest(compression=100)
+        rng = np.random.default_rng(1)
+        for _ in range(20):
+            digest.update(rng.normal(size=5000))
+
+        assert digest.count == 100_000
+        assert digest.centroid_count <= 100
+
+    def test_median_accuracy(self):
+        """Median of a normal sample should be close to exact."""
+        values = np.random.default_rng(2).normal(size=50_000)
+        digest = QuantileDigest()
+        digest.update(values)
+
+        assert digest.quantiles([0.5])[0] == pytest.approx(np.median(values), abs=0.02)
+
+    def test_merge_matches_single_digest(self):
+        """Merged partial digests should agree with one combined digest."""
+        rng = np.random.default_rng(3)
+        a_values = rng.normal(size=20_000)
+        b_values = rng.normal(loc=1.0, size=20_000)
+
+        a = QuantileDigest()
+        a.update(a_values)
+        b = QuantileDigest()
+        b.update(b_values)
+        a.merge(b)
+
+        exact = np.quantile(np.concatenate([a_values, b_values]), [0.1, 0.5, 0.9])
+        assert a.count == 40_000
+        assert a.quantiles([0.1, 0.5, 0.9]) == pytest.approx(exact, abs=0.03)
+
+    def test_sketch_round_trip(self):
+        """Serialized sketches should rebuild the same digest."""
+        digest = QuantileDigest()
+        digest.update(np.random.default_rng(4).normal(size=1000))
+
+        rebuilt = QuantileDigest.from_sketch(digest.to_sketch())
+
+        assert rebuilt.quantiles([0.25, 0.75]).tolist() == digest.quantiles([0.25, 0.75]).tolist()
+
+    def test_cdf_inverts_quantiles(self):
+        """CDF at a quantile estimate should recover its level."""
+        digest = QuantileDigest()
+        digest.update(np.random.default_rng(5).normal(size=10_000))
+
+        x = digest.quantiles([0.3])
+        assert digest.cdf(x)[0] == pytest.approx(0.3, abs=0.005)
+
+    def test_empty_digest_raises(self):
+        """Querying an empty digest should fail loudly."""
+        with pytest.raises(ValueError):
+            QuantileDigest().quantiles([0.5])
+
+
+class TestSummarizeDistribution:
+    """Test format dispatch."""
+
+    def test_full_is_sorted(self):
+        """Full format should return sorted samples."""
+        assert summarize_distribution([3, 1, 2], "full") == {"distribution": [1, 2, 3]}
+
+    def test_unknown_format(self):
+        """Unknown formats should raise."""
+        with pytest.raises(ValueError):
+            summarize_distribution([1.0], "pickle")
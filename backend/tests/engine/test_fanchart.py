@@ -0,0 +1,87 @@
+"""Tests for year-by-year Monte Carlo fan charts."""
+
+import numpy as np
+import pytest
+
+from ownvsrent.engine.calculator import calculate
+from ownvsrent.engine.fanchart import run_fan_chart
+from ownvsrent.engine.montecarlo import run_monte_carlo
+from tests.conftest import make_inputs
+
+
+class TestFanChart:
+    """Test per-year bands and break-even timing."""
+
+    def test_one_entry_per_year(self):
+        """Every year of the holding period should get a band."""
+        result = run_fan_chart(make_inputs(holding_period_years=7), simulations=200, seed=1)
+
+        assert result.simulations == 200
+        assert [entry.year for entry in result.years] == list(range(1, 8))
+        for entry in result.years:
+            for band in (entry.buyer_wealth, entry.renter_wealth, entry.net_benefit):
+                assert band.p10 <= band.median <= band.p90
+
+    def test_final_year_matches_monte_carlo(self):
+        """The last band should agree with run_monte_carlo under the same seed."""
+        inputs = make_inputs()
+        fan = run_fan_chart(inputs, simulations=2000, seed=3)
+        summary = run_monte_carlo(inputs, simulations=2000, seed=3)
+        final = fan.years[-1]
+
+        spread = summary.p90 - summary.p10
+        assert final.net_benefit.median == pytest.approx(summary.median, abs=0.01 * spread)
+        assert final.net_benefit.p10 == pytest.approx(summary.p10, abs=0.01 * spread)
+        assert final.net_benefit.p90 == pytest.approx(summary.p90, abs=0.01 * spread)
+
+    def test_no_uncertainty_matches_snapshots(self):
+        """Without randomness every band collapses onto calculate()'s snapshots."""
+        inputs = make_inputs(holding_period_years=8)
+        result = run_fan_chart(inputs, simulations=20, seed=1, std_devs={})
+        snapshots = calculate(inputs).yearly_snapshots
+
+        for entry, snapshot in zip(result.years, snapshots):
+            assert entry.buyer_wealth.median == pytest.approx(snapshot.buyer_wealth, rel=1e-9)
+            assert entry.renter_wealth.p10 == pytest.approx(snapshot.renter_wealth, rel=1e-9)
+            assert entry.net_benefit.p90 == pytest.approx(snapshot.net_benefit, abs=1e-3)
+            assert entry.buy_ahead_pct == (100 if snapshot.net_benefit > 0 else 0)
+
+    def test_break_even_distribution(self):
+        """Break-even shares should cover every simulation exactly once."""
+        inputs = make_inputs(holding_period_years=15)
+        result = run_fan_chart(inputs, simulations=1000, seed=5)
+
+        total = sum(entry.break_even_pct for entry in result.years)
+        assert total + result.never_breaks_even_pct == pytest.approx(100)
+
+        # Simulations ahead in year 1 broke even in year 1
+        assert result.years[0].break_even_pct == pytest.approx(result.years[0].buy_ahead_pct)
+
+    def test_median_break_even_year(self):
+        """The median break-even year should match the deterministic case without noise."""
+        inputs = make_inputs(holding_period_years=15)
+        result = run_fan_chart(inputs, simulations=10, std_devs={})
+
+        assert result.median_break_even_year == (calculate(inputs).break_even_year or None)
+
+    def test_batches_agree(self):
+        """Splitting the run into batches should not change the counts."""
+        inputs = make_inputs()
+        whole = run_fan_chart(inputs, simulations=500, seed=9)
+        batched = run_fan_chart(inputs, simulations=500, seed=9, batch_size=128)
+
+        assert [e.buy_ahead_pct for e in batched.years] == [e.buy_ahead_pct for e in whole.years]
+        assert batched.never_breaks_even_pct == whole.never_breaks_even_pct
+
+    def test_path_mode(self):
+        """Per-year rate paths should widen the spread of home-driven wealth."""
+        inputs = make_inputs()
+        constant = run_fan_chart(inputs, simulations=2000, seed=2)
+        path = run_fan_chart(inputs, simulations=2000, seed=2, mode="path")
+
+        def width(result):
+            band = result.years[-1].buyer_wealth
+            return band.p90 - band.p10
+
+        assert width(path) < width(constant)
+        assert np.isfinite(width(path))
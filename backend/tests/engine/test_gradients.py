@@ -0,0 +1,129 @@
+"""Tests for forward-mode automatic differentiation."""
+
+import math
+
+import numpy as np
+import pytest
+
+from ownvsrent.engine.amortization import calculate_monthly_payment
+from ownvsrent.engine.calculator import calculate
+from ownvsrent.engine.gradients import DIFFERENTIABLE_FIELDS, Dual, calculate_gradients
+from ownvsrent.engine.taxes import calculate_annual_tax_benefit
+from ownvsrent.engine.types import CalculatorInputs
+from tests.conftest import make_inputs
+
+
+def finite_difference(inputs: CalculatorInputs, name: str) -> float:
+    """Central-difference derivative of net benefit with respect to one input."""
+    value = getattr(inputs, name)
+    step = max(abs(value), 1) * 1e-6
+
+    def net_benefit(x: float) -> float:
+        return calculate(inputs.model_copy(update={name: x})).net_benefit_at_horizon
+
+    return (net_benefit(value + step) - net_benefit(value - step)) / (2 * step)
+
+
+class TestDual:
+    """Test dual-number arithmetic."""
+
+    def test_arithmetic(self):
+        """Derivatives of a compound expression should follow calculus rules."""
+        x, y = Dual.variables([2.0, 3.0])
+        result = (x * y + 1) / x - y**2 + 2**x
+
+        # f = y + 1/x - y^2 + 2^x
+        assert result.value == pytest.approx(3 + 0.5 - 9 + 4)
+        np.testing.assert_allclose(result.tangent, [-1 / 4 + 4 * math.log(2), 1 - 6])
+
+    def test_dual_exponent(self):
+        """Powers with dual exponents should differentiate both arguments."""
+        x, y = Dual.variables([1.5, 2.0])
+        result = x**y
+
+        np.testing.assert_allclose(result.tangent, [2 * 1.5, 1.5**2 * math.log(1.5)])
+
+    def test_comparisons_use_values(self):
+        """Branching code should follow the plain values."""
+        x, y = Dual.variables([1.0, 2.0])
+
+        assert x < y and y > 1 and x == 1.0 and x != y
+        assert max(0, x - y) == 0
+        assert max(0, y - x).tangent.tolist() == [-1.0, 1.0]
+
+    def test_engine_functions_accept_duals(self):
+        """Scalar engine functions should propagate derivatives unchanged."""
+        principal, rate = Dual.variables([320_000.0, 0.068])
+        payment = calculate_monthly_payment(principal, rate, 30)
+
+        assert payment.value == pytest.approx(calculate_monthly_payment(320_000, 0.068, 30))
+        assert payment.tangent[0] == pytest.approx(payment.value / 320_000)
+
+        interest, rate = Dual.variables([30_000.0, 0.24])
+        benefit, itemized = calculate_annual_tax_benefit(
+            mortgage_interest=interest,
+            property_tax=6_000,
+            state_income_tax=5_000,
+            pmi=0,
+            year=2026,
+            loan_amount=320_000,
+            marginal_tax_rate=rate,
+            filing_status="single",
+            agi=100_000,
+        )
+        assert itemized
+        np.testing.assert_allclose(benefit.tangent, [0.24, benefit.value / 0.24])
+
+
+class TestCalculateGradients:
+    """Test gradients of net benefit."""
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {},
+            {"holding_period_years": 1},
+            {"holding_period_years": 30, "loan_term_years": 15},
+            {"down_payment_percent": 0.05, "holding_period_years": 12},
+            {"monthly_rent": 4000, "hoa_monthly": 300, "broker_fee": 0.1},
+            {"purchase_price": 1_200_000, "annual_appreciation": 0.06},
+        ],
+    )
+    def test_matches_finite_differences(self, overrides):
+        """Every derivative should agree with central differences of calculate()."""
+        inputs = make_inputs(**overrides)
+        result = calculate_gradients(inputs)
+
+        assert result.net_benefit == pytest.approx(
+            calculate(inputs).net_benefit_at_horizon, abs=1e-6
+        )
+        for gradient in result.gradients:
+            expected = finite_difference(inputs, gradient.variable)
+            assert gradient.derivative == pytest.approx(expected, rel=1e-4, abs=1e-3)
+
+    def test_covers_continuous_inputs(self):
+        """Whole-number and categorical inputs have no derivative."""
+        result = calculate_gradients(make_inputs())
+        variables = {gradient.variable for gradient in result.gradients}
+
+        assert variables == set(DIFFERENTIABLE_FIELDS)
+        assert "holding_period_years" not in variables
+        assert "loan_term_years" not in variables
+
+    def test_sorted_by_impact(self):
+        """Gradients should be ranked by the effect of a 1% change."""
+        result = calculate_gradients(make_inputs())
+        impacts = [abs(gradient.impact_per_percent) for gradient in result.gradients]
+
+        assert impacts == sorted(impacts, reverse=True)
+        assert result.gradients[0].variable in ("purchase_price", "monthly_rent")
+
+    def test_signs(self):
+        """Appreciation helps buying; investment returns and rent growth matter as expected."""
+        gradients = {g.variable: g.derivative for g in calculate_gradients(make_inputs()).gradients}
+
+        assert gradients["annual_appreciation"] > 0
+        assert gradients["annual_investment_return"] < 0
+        assert gradients["annual_rent_increase"] > 0
+        assert gradients["mortgage_rate"] < 0
+        assert gradients["marginal_tax_rate"] == 0
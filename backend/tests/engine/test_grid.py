@@ -0,0 +1,152 @@
+"""Tests for two-input heatmap grids."""
+
+import numpy as np
+import pytest
+
+from ownvsrent.engine.calculator import calculate
+from ownvsrent.engine.grid import MAX_GRID_SCENARIOS, evaluate_grid
+from ownvsrent.engine.montecarlo import run_monte_carlo
+from ownvsrent.engine.types import GridAxis
+from tests.conftest import make_inputs
+
+
+class TestEvaluateGrid:
+    """Tests for evaluate_grid."""
+
+    def test_matrix_shape_and_axes(self):
+        """Matrices should be indexed [y][x] with the requested steps."""
+        x = GridAxis(variable="annual_appreciation", low=0.0, high=0.06, steps=7)
+        y = GridAxis(variable="annual_investment_return", low=0.04, high=0.1, steps=4)
+        result = evaluate_grid(make_inputs(), x, y)
+
+        assert result.x_values == pytest.approx(np.linspace(0.0, 0.06, 7))
+        assert result.y_values == pytest.approx(np.linspace(0.04, 0.1, 4))
+        assert len(result.net_benefit) == 4
+        assert all(len(row) == 7 for row in result.net_benefit)
+        assert len(result.verdicts) == 4
+
+    def test_cells_match_calculate(self):
+        """Every cell should match a scalar calculate() run."""
+        x = GridAxis(variable="mortgage_rate", low=0.03, high=0.09, steps=4)
+        y = GridAxis(variable="purchase_price", low=300_000, high=600_000, steps=3)
+        result = evaluate_grid(make_inputs(), x, y)
+
+        for i, price in enumerate(result.y_values):
+            for j, rate in enumerate(result.x_values):
+                expected = calculate(make_inputs(purchase_price=price, mortgage_rate=rate))
+                assert result.net_benefit[i][j] == pytest.approx(
+                    expected.net_benefit_at_horizon, rel=1e-9, abs=1e-6
+                )
+                assert result.verdicts[i][j] == expected.verdict
+
+    def test_appreciation_increases_net_benefit(self):
+        """Net benefit should rise along the appreciation axis."""
+        x = GridAxis(variable="annual_appreciation", low=0.0, high=0.08, steps=9)
+        y = GridAxis(variable="monthly_rent", low=1500, high=3500, steps=3)
+        result = evaluate_grid(make_inputs(), x, y)
+
+        for row in result.net_benefit:
+            assert np.all(np.diff(row) > 0)
+
+    def test_whole_number_inputs_snap(self):
+        """Holding periods round to whole years; loan terms to allowed terms."""
+        x = GridAxis(variable="holding_period_years", low=1, high=10, steps=4)
+        y = GridAxis(variable="loan_term_years", low=10, high=30, steps=3)
+        result = evaluate_grid(make_inputs(), x, y)
+
+        assert result.x_values == [1.0, 4.0, 7.0, 10.0]
+        assert result.y_values == [10.0, 20.0, 30.0]
+        expected = calculate(make_inputs(holding_period_years=7, loan_term_years=20))
+        assert result.net_benefit[1][2] == pytest.approx(expected.net_benefit_at_horizon, rel=1e-9)
+
+    def test_single_step_axis(self):
+        """A one-step axis should evaluate only its low value."""
+        x = GridAxis(variable="annual_appreciation", low=0.03, high=0.03, steps=1)
+        y = GridAxis(variable="mortgage_rate", low=0.05, high=0.07, steps=2)
+        result = evaluate_grid(make_inputs(), x, y)
+
+        assert result.x_values == [0.03]
+        assert len(result.net_benefit) == 2
+
+    def test_invalid_axes_raise(self):
+        """Unknown inputs, repeated inputs and out-of-range values should raise."""
+        rate = GridAxis(variable="mortgage_rate", low=0.03, high=0.09, steps=3)
+        with pytest.raises(ValueError, match="Cannot vary"):
+            evaluate_grid(
+                make_inputs(), rate, GridAxis(variable="filing_status", low=0, high=1, steps=2)
+            )
+        with pytest.raises(ValueError, match="different inputs"):
+            evaluate_grid(make_inputs(), rate, rate)
+        with pytest.raises(ValueError, match="must lie within"):
+            evaluate_grid(
+                make_inputs(), rate, GridAxis(variable="pmi_rate", low=0, high=0.5, steps=2)
+            )
+        with pytest.raises(ValueError, match="low <= high"):
+            evaluate_grid(
+                make_inputs(), rate, GridAxis(variable="pmi_rate", low=0.01, high=0.0, steps=2)
+            )
+
+
+class TestProbabilityGrid:
+    """Tests for P(buy wins) grids."""
+
+    def test_cells_match_run_monte_carlo(self):
+        """Each cell should reproduce run_monte_carlo with the same seed."""
+        x = GridAxis(variable="purchase_price", low=350_000, high=450_000, steps=3)
+        y = GridAxis(variable="monthly_rent", low=1800, high=2400, steps=2)
+        result = evaluate_grid(make_inputs(), x, y, simulations=300, seed=7, batch_size=500)
+
+        assert result.simulations == 300
+        for i, rent in enumerate(result.y_values):
+            for j, price in enumerate(result.x_values):
+                expected = run_monte_carlo(
+                    make_inputs(purchase_price=price, monthly_rent=rent),
+                    simulations=300,
+                    seed=7,
+                )
+                assert result.buy_wins_pct[i][j] == pytest.approx(expected.buy_wins_pct)
+
+    def test_randomized_axis_centres_on_cell(self):
+        """A randomized grid input should be drawn around each cell's value."""
+        x = GridAxis(variable="annual_appreciation", low=0.0, high=0.06, steps=3)
+        y = GridAxis(variable="mortgage_rate", low=0.06, high=0.06, steps=1)
+        result = evaluate_grid(make_inputs(), x, y, simulations=200, seed=3)
+
+        expected = run_monte_carlo(
+            make_inputs(annual_appreciation=0.06, mortgage_rate=0.06), simulations=200, seed=3
+        )
+        assert result.buy_wins_pct[0][2] == pytest.approx(expected.buy_wins_pct)
+
+    def test_common_random_numbers_give_monotone_rows(self):
+        """Shared draws should make P(buy wins) rise smoothly with appreciation."""
+        x = GridAxis(variable="annual_appreciation", low=0.0, high=0.08, steps=9)
+        y = GridAxis(variable="monthly_rent", low=1800, high=2600, steps=3)
+        result = evaluate_grid(make_inputs(), x, y, simulations=200, seed=1)
+
+        for row in result.buy_wins_pct:
+            assert np.all(np.diff(row) >= 0)
+            assert all(0 <= pct <= 100 for pct in row)
+
+    def test_chunking_does_not_change_results(self):
+        """Results should not depend on how cells are split into batches."""
+        x = GridAxis(variable="annual_investment_return", low=0.04, high=0.1, steps=4)
+        y = GridAxis(variable="holding_period_years", low=3, high=9, steps=3)
+        small = evaluate_grid(make_inputs(), x, y, simulations=50, seed=2, batch_size=1)
+        large = evaluate_grid(make_inputs(), x, y, simulations=50, seed=2)
+        assert small.buy_wins_pct == large.buy_wins_pct
+
+    def test_no_simulations_skips_probabilities(self):
+        """Without simulations only the deterministic matrices are returned."""
+        x = GridAxis(variable="annual_appreciation", low=0.0, high=0.06, steps=2)
+        y = GridAxis(variable="mortgage_rate", low=0.05, high=0.07, steps=2)
+        result = evaluate_grid(make_inputs(), x, y)
+        assert result.simulations == 0
+        assert result.buy_wins_pct is None
+
+    def test_scenario_budget(self):
+        """Grids whose cells x simulations exceed the budget should raise."""
+        assert MAX_GRID_SCENARIOS == 100_000
+        x = GridAxis(variable="annual_appreciation", low=0.0, high=0.06, steps=100)
+        y = GridAxis(variable="mortgage_rate", low=0.05, high=0.07, steps=100)
+        with pytest.raises(ValueError, match="100,000 scenarios"):
+            evaluate_grid(make_inputs(), x, y, simulations=11)
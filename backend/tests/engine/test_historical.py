@@ -0,0 +1,182 @@
+"""Tests for historical backtesting."""
+
+import numpy as np
+import pytest
+
+from ownvsrent.engine.calculator import calculate
+from ownvsrent.engine.historical import (
+    HistoricalSeries,
+    bootstrap_paths,
+    load_history,
+    run_backtest,
+)
+from ownvsrent.engine.montecarlo import run_monte_carlo
+from tests.conftest import make_inputs
+
+
+def constant_history(years: int, appreciation: float, investment_return: float, rent: float):
+    """Create a history where every year has the same rates."""
+    return HistoricalSeries(
+        years=np.arange(2000, 2000 + years),
+        appreciation=np.full(years, appreciation),
+        investment_return=np.full(years, investment_return),
+        rent_increase=np.full(years, rent),
+    )
+
+
+class TestHistoricalData:
+    """Test the bundled dataset."""
+
+    def test_years_are_consecutive(self):
+        """Every calendar year should appear once, in order."""
+        history = load_history()
+        assert len(history) >= 30
+        assert np.all(np.diff(history.years) == 1)
+
+    def test_rates_are_decimals(self):
+        """Rates should be stored as decimals, not percentages."""
+        history = load_history()
+        for rates in (history.appreciation, history.investment_return, history.rent_increase):
+            assert np.all(np.abs(rates) < 0.6)
+        # Long-run averages in a plausible range
+        assert 0.02 < history.appreciation.mean() < 0.08
+        assert 0.05 < history.investment_return.mean() < 0.15
+
+    def test_rate_paths(self):
+        """Row i of each window matrix should start at year i."""
+        history = load_history()
+        paths = history.rate_paths(5)
+
+        assert paths["annual_appreciation"].shape == (len(history) - 4, 5)
+        assert paths["annual_investment_return"][3, 0] == history.investment_return[3]
+        assert paths["annual_rent_increase"][3, 4] == history.rent_increase[7]
+
+
+class TestRunBacktest:
+    """Test rolling-window backtests."""
+
+    def test_constant_history_matches_calculator(self):
+        """With flat history, every window equals calculate() at those rates."""
+        history = constant_history(12, appreciation=0.04, investment_return=0.06, rent=0.03)
+        inputs = make_inputs(holding_period_years=5)
+        result = run_backtest(inputs, history)
+
+        expected = calculate(
+            inputs.model_copy(
+                update={
+                    "annual_appreciation": 0.04,
+                    "annual_investment_return": 0.06,
+                    "annual_rent_increase": 0.03,
+                }
+            )
+        ).net_benefit_at_horizon
+        assert result.windows == 8
+        for window in result.results:
+            assert window.net_benefit == pytest.approx(expected, abs=1e-6)
+
+    def test_windows_cover_history(self):
+        """Windows should roll one year at a time through the dataset."""
+        history = load_history()
+        result = run_backtest(make_inputs(holding_period_years=10))
+
+        assert result.windows == len(history) - 9
+        assert result.results[0].start_year == history.years[0]
+        assert result.results[-1].end_year == history.years[-1]
+        assert all(w.end_year - w.start_year == 9 for w in result.results)
+
+    def test_best_and_worst(self):
+        """Best and worst windows should bound the distribution."""
+        result = run_backtest(make_inputs())
+        outcomes = [w.net_benefit for w in result.results]
+
+        assert result.best.net_benefit == max(outcomes)
+        assert result.worst.net_benefit == min(outcomes)
+        assert result.worst.net_benefit <= result.p10 <= result.median <= result.p90
+        assert result.p90 <= result.best.net_benefit
+
+    def test_housing_boom_favors_buying(self):
+        """Buying into the early-2000s boom beat buying into the bust."""
+        result = run_backtest(make_inputs(holding_period_years=5))
+        by_start = {w.start_year: w.net_benefit for w in result.results}
+
+        assert by_start[2000] > by_start[2006]
+
+    def test_holding_period_longer_than_history(self):
+        """A horizon with no complete window should raise."""
+        with pytest.raises(ValueError):
+            run_backtest(make_inputs(holding_period_years=10), constant_history(8, 0, 0, 0))
+
+
+class TestBlockBootstrap:
+    """Test block-bootstrap resampling of history."""
+
+    def test_blocks_are_contiguous(self):
+        """Within a block, consecutive path years are consecutive history years."""
+        history = HistoricalSeries(
+            years=np.arange(1990, 2020),
+            appreciation=np.arange(30) / 100,
+            investment_return=np.arange(30) / 100 + 1,
+            rent_increase=np.arange(30) / 100 + 2,
+        )
+        rng = np.random.default_rng(0)
+        paths = bootstrap_paths(history, size=200, years=12, block_length=4, rng=rng)
+
+        rows = np.rint(paths["annual_appreciation"] * 100).astype(int)
+        assert rows.shape == (200, 12)
+        assert np.all(np.diff(rows.reshape(200, 3, 4), axis=2) == 1)
+        # Every rate in a year comes from the same historical row
+        assert np.allclose(paths["annual_investment_return"] - paths["annual_appreciation"], 1)
+        assert np.allclose(paths["annual_rent_increase"] - paths["annual_appreciation"], 2)
+
+    def test_partial_last_block(self):
+        """Paths not divisible by the block length are truncated."""
+        rng = np.random.default_rng(0)
+        paths = bootstrap_paths(load_history(), size=10, years=7, block_length=5, rng=rng)
+        assert paths["annual_rent_increase"].shape == (10, 7)
+
+    def test_invalid_block_length(self):
+        """Blocks longer than history should raise."""
+        history = load_history()
+        with pytest.raises(ValueError):
+            bootstrap_paths(history, 10, 5, len(history) + 1, np.random.default_rng(0))
+
+    def test_monte_carlo_reproducible(self):
+        """Same seed should give identical bootstrap results."""
+        inputs = make_inputs()
+        first = run_monte_carlo(inputs, simulations=500, seed=9, mode="bootstrap")
+        second = run_monte_carlo(inputs, simulations=500, seed=9, mode="bootstrap")
+
+        assert first.median == second.median
+        assert first.p90 == second.p90
+
+    def test_monte_carlo_within_backtest_range(self):
+        """Resampled outcomes should resemble the historical windows."""
+        inputs = make_inputs()
+        result = run_monte_carlo(inputs, simulations=2000, seed=1, mode="bootstrap")
+        backtest = run_backtest(inputs)
+
+        assert backtest.worst.net_benefit < result.median < backtest.best.net_benefit
+
+    def test_extra_variables_still_sampled(self):
+        """Non-rate variables in std_devs are drawn alongside the bootstrap."""
+        inputs = make_inputs()
+        plain = run_monte_carlo(inputs, simulations=500, seed=4, mode="bootstrap")
+        extra = run_monte_carlo(
+            inputs,
+            simulations=500,
+            seed=4,
+            mode="bootstrap",
+            std_devs={"annual_appreciation": 0.05, "mortgage_rate": 0.01},
+        )
+
+        assert extra.median != plain.median
+
+    def test_correlation_not_supported(self):
+        """A correlation matrix cannot be combined with bootstrap mode."""
+        with pytest.raises(ValueError):
+            run_monte_carlo(
+                make_inputs(),
+                simulations=10,
+                mode="bootstrap",
+                correlation=[[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]],
+            )
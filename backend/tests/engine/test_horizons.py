@@ -0,0 +1,64 @@
+"""Tests for all-horizons results."""
+
+import pytest
+
+from ownvsrent.engine.batch import calculate_batch
+from ownvsrent.engine.calculator import calculate
+from ownvsrent.engine.horizons import calculate_all_horizons
+from tests.conftest import make_inputs
+
+SCENARIOS = [
+    {},
+    {"annual_appreciation": 0.06},
+    {"annual_appreciation": 0.05, "down_payment_percent": 0.05, "filing_status": "married"},
+    {"mortgage_rate": 0.0, "loan_term_years": 10},
+]
+
+
+class TestAllHorizons:
+    """Tests for calculate_all_horizons."""
+
+    @pytest.mark.parametrize("overrides", SCENARIOS)
+    def test_every_horizon_matches_calculate(self, overrides):
+        """Each holding period should match a separate calculate() run."""
+        inputs = make_inputs(**overrides)
+        result = calculate_all_horizons(inputs)
+
+        assert [h.holding_period_years for h in result.horizons] == list(range(1, 31))
+        for horizon in result.horizons:
+            expected = calculate(
+                inputs.model_copy(update={"holding_period_years": horizon.holding_period_years})
+            )
+            assert horizon.net_benefit == pytest.approx(
+                expected.net_benefit_at_horizon, rel=1e-9, abs=1e-6
+            )
+            assert horizon.rent_equivalent == pytest.approx(expected.rent_equivalent, rel=1e-9)
+            assert horizon.break_even_year == expected.break_even_year
+            assert horizon.verdict == expected.verdict
+
+    def test_break_even_depends_on_horizon(self):
+        """Break-even can move with the holding period, as in calculate()."""
+        result = calculate_all_horizons(make_inputs(annual_appreciation=0.06))
+        break_even = {h.break_even_year for h in result.horizons if h.break_even_year}
+        assert len(break_even) > 1
+
+    def test_max_years(self):
+        """Only holding periods up to max_years should be reported."""
+        result = calculate_all_horizons(make_inputs(), max_years=5)
+        assert len(result.horizons) == 5
+        with pytest.raises(ValueError, match="max_years"):
+            calculate_all_horizons(make_inputs(), max_years=31)
+
+
+class TestBreakEvenByHorizon:
+    """Tests for BatchResults.break_even_by_horizon."""
+
+    def test_last_horizon_matches_break_even_years(self):
+        """The full-horizon column should equal break_even_years."""
+        overrides = {"annual_appreciation": [0.0, 0.04, 0.06, 0.08]}
+        batch = calculate_batch(make_inputs(holding_period_years=15), overrides)
+        by_horizon = batch.break_even_by_horizon()
+
+        assert by_horizon.shape == (4, 15)
+        assert list(by_horizon[:, -1]) == list(batch.break_even_years())
+        assert (by_horizon <= range(1, 16)).all()
@@ -0,0 +1,93 @@
+"""Tests for moment-propagation uncertainty estimates."""
+
+import pytest
+
+from ownvsrent.engine.calculator import calculate
+from ownvsrent.engine.moments import propagate_moments
+from ownvsrent.engine.montecarlo import run_monte_carlo
+from tests.conftest import make_inputs
+
+# Spreads narrow enough that Monte Carlo rarely clips a draw
+MODERATE_STD_DEVS = {
+    "annual_appreciation": 0.02,
+    "annual_investment_return": 0.04,
+    "annual_rent_increase": 0.01,
+}
+
+
+class TestCalibration:
+    """Compare the analytic approximation with full Monte Carlo."""
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {},
+            {"holding_period_years": 15},
+            {"monthly_rent": 3000},
+            {"down_payment_percent": 0.05, "holding_period_years": 20},
+        ],
+    )
+    def test_matches_monte_carlo(self, overrides):
+        """Percentiles and win probability should track a large simulation."""
+        inputs = make_inputs(**overrides)
+        approx = propagate_moments(inputs, MODERATE_STD_DEVS)
+        simulated = run_monte_carlo(inputs, simulations=50_000, seed=1, std_devs=MODERATE_STD_DEVS)
+
+        spread = simulated.p90 - simulated.p10
+        assert approx.p10 == pytest.approx(simulated.p10, abs=0.03 * spread)
+        assert approx.median == pytest.approx(simulated.median, abs=0.03 * spread)
+        assert approx.p90 == pytest.approx(simulated.p90, abs=0.03 * spread)
+        assert approx.buy_wins_pct == pytest.approx(simulated.buy_wins_pct, abs=4)
+
+    def test_second_order_beats_first_order(self):
+        """Curvature terms should move the approximation toward simulation."""
+        inputs = make_inputs(holding_period_years=20)
+        first = propagate_moments(inputs, MODERATE_STD_DEVS, order=1)
+        second = propagate_moments(inputs, MODERATE_STD_DEVS, order=2)
+        simulated = run_monte_carlo(inputs, simulations=50_000, seed=2, std_devs=MODERATE_STD_DEVS)
+
+        first_error = abs(first.p90 - simulated.p90) + abs(first.p10 - simulated.p10)
+        second_error = abs(second.p90 - simulated.p90) + abs(second.p10 - simulated.p10)
+        assert second_error < first_error
+
+
+class TestPropagateMoments:
+    """Test the shape of the approximation."""
+
+    def test_first_order_centred_on_base_case(self):
+        """The first-order median is the deterministic result."""
+        inputs = make_inputs()
+        result = propagate_moments(inputs, order=1)
+
+        assert result.median == pytest.approx(calculate(inputs).net_benefit_at_horizon)
+        assert result.median - result.p10 == pytest.approx(result.p90 - result.median)
+
+    def test_no_uncertainty(self):
+        """Zero spread collapses every percentile onto the base case."""
+        inputs = make_inputs(monthly_rent=3000)
+        result = propagate_moments(inputs, {"annual_appreciation": 0.0})
+        expected = calculate(inputs).net_benefit_at_horizon
+
+        assert result.p10 == pytest.approx(expected)
+        assert result.p90 == pytest.approx(expected)
+        assert result.buy_wins_pct == (100 if expected > 1000 else 0)
+
+    def test_quantile_grid(self):
+        """The percentile grid should be increasing and include the reported percentiles."""
+        result = propagate_moments(make_inputs(), MODERATE_STD_DEVS)
+        values = result.quantiles.values
+
+        assert result.simulations == 0
+        assert result.distribution_format == "quantiles"
+        assert all(a < b for a, b in zip(values, values[1:]))
+        assert values[9] == pytest.approx(result.p10)
+        assert values[89] == pytest.approx(result.p90)
+
+    def test_correlation_changes_spread(self):
+        """Correlated inputs should change the approximate spread."""
+        inputs = make_inputs()
+        std_devs = {"annual_appreciation": 0.02, "annual_investment_return": 0.04}
+        independent = propagate_moments(inputs, std_devs)
+        together = propagate_moments(inputs, std_devs, [[1.0, 0.9], [0.9, 1.0]])
+
+        assert together.p90 - together.p10 < independent.p90 - independent.p10
@@ -1,8 +1,16 @@
 """Tests for Monte Carlo simulation."""
 
+import numpy as np
 import pytest
 
-from ownvsrent.engine.montecarlo import run_monte_carlo
+from ownvsrent.engine import montecarlo, sampling
+from ownvsrent.engine.calculator import calculate
+from ownvsrent.engine.montecarlo import (
+    merge_monte_carlo_results,
+    run_monte_carlo,
+    run_paired_monte_carlo,
+    tenure_weights,
+)
 from ownvsrent.engine.types import CalculatorInputs
 
 
@@ -157,9 +165,7 @@ class TestMonteCarloCustomStdDevs:
             "annual_investment_return": 0,
             "annual_rent_increase": 0,
         }
-        result = run_monte_carlo(
-            inputs, simulations=10, seed=42, std_devs=zero_std_devs
-        )
+        result = run_monte_carlo(inputs, simulations=10, seed=42, std_devs=zero_std_devs)
 
         # All outcomes should be identical
         assert len(set(result.distribution)) == 1
@@ -186,3 +192,409 @@ class TestMonteCarloCustomStdDevs:
         spread_high = result_high.p90 - result_high.p10
 
         assert spread_high > spread_low
+
+
+class TestMonteCarloDistributionFormats:
+    """Test compact distribution summaries."""
+
+    def test_full_is_default(self):
+        """Default format should keep every sorted sample and no summary."""
+        inputs = make_inputs()
+        result = run_monte_carlo(inputs, simulations=200, seed=42)
+
+        assert result.distribution_format == "full"
+        assert len(result.distribution) == 200
+        assert result.histogram is None
+
+    def test_histogram_opt_in(self):
+        """The histogram format should return counts with no raw samples."""
+        inputs = make_inputs()
+        result = run_monte_carlo(inputs, simulations=200, seed=42, distribution_format="histogram")
+
+        assert result.distribution_format == "histogram"
+        assert result.distribution is None
+        assert result.histogram is not None
+        assert sum(result.histogram.counts) == 200
+
+    def test_histogram_bins(self):
+        """Histogram should have the requested number of bins."""
+        inputs = make_inputs()
+        result = run_monte_carlo(
+            inputs, simulations=200, seed=42, distribution_format="histogram", histogram_bins=20
+        )
+
+        assert len(result.histogram.counts) == 20
+        assert len(result.histogram.bin_edges) == 21
+
+    def test_histogram_matches_full_distribution(self):
+        """Histogram counts should bin the same samples as the full format."""
+        inputs = make_inputs()
+        full = run_monte_carlo(inputs, simulations=200, seed=7, distribution_format="full")
+        hist = run_monte_carlo(
+            inputs, simulations=200, seed=7, distribution_format="histogram", histogram_bins=10
+        )
+
+        expected, _ = np.histogram(full.distribution, bins=hist.histogram.bin_edges)
+        assert hist.histogram.counts == expected.tolist()
+
+    def test_quantile_grid(self):
+        """Quantile format should return every percentile in order."""
+        inputs = make_inputs()
+        result = run_monte_carlo(inputs, simulations=200, seed=42, distribution_format="quantiles")
+
+        assert len(result.quantiles.levels) == 99
+        assert result.quantiles.values == sorted(result.quantiles.values)
+
+    def test_sketch(self):
+        """Sketch format should summarize every sample compactly."""
+        inputs = make_inputs()
+        result = run_monte_carlo(inputs, simulations=1000, seed=42, distribution_format="sketch")
+
+        assert result.sketch.count == 1000
+        assert len(result.sketch.means) < 1000
+
+
+def rank_error(sorted_samples: np.ndarray, estimate: float, level: float) -> float:
+    """Distance in quantile rank between an estimate and the exact quantile."""
+    return abs(np.searchsorted(sorted_samples, estimate) / len(sorted_samples) - level)
+
+
+class TestMonteCarloStreaming:
+    """Test constant-memory streaming quantiles."""
+
+    def test_streaming_matches_exact_quantiles(self, monkeypatch):
+        """Digest percentiles should be within 0.2% rank of exact ones."""
+        inputs = make_inputs()
+        exact = run_monte_carlo(inputs, simulations=100_000, seed=11, distribution_format="full")
+
+        monkeypatch.setattr(montecarlo, "EXACT_QUANTILE_LIMIT", 0)
+        streamed = run_monte_carlo(
+            inputs, simulations=100_000, seed=11, distribution_format="quantiles"
+        )
+
+        samples = np.array(exact.distribution)
+        assert streamed.simulations == exact.simulations
+        assert streamed.buy_wins_pct == exact.buy_wins_pct
+        assert rank_error(samples, streamed.p10, 0.1) < 0.002
+        assert rank_error(samples, streamed.median, 0.5) < 0.002
+        assert rank_error(samples, streamed.p90, 0.9) < 0.002
+        for level, value in zip(streamed.quantiles.levels, streamed.quantiles.values):
+            assert rank_error(samples, value, level) < 0.002
+
+    def test_streaming_histogram_counts(self, monkeypatch):
+        """Streamed histograms should still account for every simulation."""
+        monkeypatch.setattr(montecarlo, "EXACT_QUANTILE_LIMIT", 0)
+        result = run_monte_carlo(
+            make_inputs(),
+            simulations=5000,
+            seed=3,
+            distribution_format="histogram",
+            batch_size=1000,
+        )
+
+        assert sum(result.histogram.counts) == 5000
+
+    def test_full_format_always_retains_samples(self, monkeypatch):
+        """Full format always retains samples, even above the exact limit."""
+        monkeypatch.setattr(montecarlo, "EXACT_QUANTILE_LIMIT", 0)
+        result = run_monte_carlo(make_inputs(), simulations=500, seed=3, distribution_format="full")
+
+        assert len(result.distribution) == 500
+
+    def test_merge_partial_runs(self):
+        """Merged partial runs should match one pooled run."""
+        inputs = make_inputs()
+        seeds = [1, 2, 3, 4]
+        partials = [
+            run_monte_carlo(inputs, simulations=5000, seed=s, distribution_format="sketch")
+            for s in seeds
+        ]
+        pooled = np.sort(
+            np.concatenate(
+                [
+                    run_monte_carlo(
+                        inputs, simulations=5000, seed=s, distribution_format="full"
+                    ).distribution
+                    for s in seeds
+                ]
+            )
+        )
+
+        merged = merge_monte_carlo_results(partials)
+
+        assert merged.simulations == 20_000
+        assert merged.sketch.count == 20_000
+        assert merged.buy_wins_pct == pytest.approx(np.mean(pooled > 1000) * 100)
+        assert rank_error(pooled, merged.median, 0.5) < 0.002
+        assert rank_error(pooled, merged.p10, 0.1) < 0.002
+
+    def test_merge_requires_sketches(self):
+        """Results without sketches cannot be merged."""
+        result = run_monte_carlo(make_inputs(), simulations=50, seed=1)
+
+        with pytest.raises(ValueError):
+            merge_monte_carlo_results([result])
+
+
+class TestMonteCarloFloat32:
+    """Test the float32 compute mode."""
+
+    def test_float32_percentiles_close_to_float64(self):
+        """Same seed in float32 should reproduce float64 percentiles closely."""
+        inputs = make_inputs()
+        exact = run_monte_carlo(inputs, simulations=2000, seed=5)
+        single = run_monte_carlo(inputs, simulations=2000, seed=5, dtype="float32")
+
+        assert single.median == pytest.approx(exact.median, abs=10)
+        assert single.p10 == pytest.approx(exact.p10, abs=10)
+        assert single.p90 == pytest.approx(exact.p90, abs=10)
+
+
+class TestMonteCarloPaths:
+    """Test year-by-year rate paths."""
+
+    def test_path_mode_reproducible(self):
+        """Same seed should give the same path results."""
+        inputs = make_inputs()
+        first = run_monte_carlo(inputs, simulations=500, seed=3, mode="path")
+        second = run_monte_carlo(inputs, simulations=500, seed=3, mode="path")
+
+        assert first.median == second.median
+        assert first.p10 == second.p10
+
+    def test_independent_years_narrow_the_spread(self):
+        """Independent yearly shocks partly cancel, unlike one rate held for years."""
+        inputs = make_inputs(holding_period_years=10)
+        constant = run_monte_carlo(inputs, simulations=2000, seed=1)
+        paths = run_monte_carlo(inputs, simulations=2000, seed=1, mode="path")
+
+        assert paths.p90 - paths.p10 < constant.p90 - constant.p10
+
+    def test_autocorrelation_widens_the_spread(self):
+        """Persistent shocks should spread outcomes more than independent ones."""
+        inputs = make_inputs(holding_period_years=10)
+        independent = run_monte_carlo(inputs, simulations=2000, seed=1, mode="path")
+        persistent = run_monte_carlo(
+            inputs, simulations=2000, seed=1, mode="path", autocorrelation=0.8
+        )
+
+        assert persistent.p90 - persistent.p10 > independent.p90 - independent.p10
+
+    def test_invalid_autocorrelation(self):
+        """Autocorrelation must be strictly between -1 and 1."""
+        with pytest.raises(ValueError):
+            run_monte_carlo(make_inputs(), simulations=10, mode="path", autocorrelation=1.0)
+
+
+class TestMonteCarloCorrelation:
+    """Test correlated sampling of randomized inputs."""
+
+    STD_DEVS = {
+        "annual_appreciation": 0.05,
+        "annual_investment_return": 0.15,
+        "mortgage_rate": 0.01,
+    }
+
+    def test_samples_follow_correlation(self):
+        """Sampled variables should reproduce the requested correlations."""
+        correlation = [[1.0, 0.6, -0.4], [0.6, 1.0, 0.0], [-0.4, 0.0, 1.0]]
+        factor = sampling.correlation_factor(correlation)
+        rng = np.random.default_rng(0)
+        # Spreads narrow enough that clipping to bounds is negligible
+        std_devs = {**self.STD_DEVS, "annual_investment_return": 0.03}
+        inputs = make_inputs(annual_appreciation=0.03, mortgage_rate=0.07)
+        sampled = sampling.sample_inputs(inputs, std_devs, 50_000, rng, factor)
+
+        observed = np.corrcoef([sampled[name] for name in std_devs])
+        assert np.allclose(observed, correlation, atol=0.02)
+        assert sampled["mortgage_rate"].std() == pytest.approx(0.01, rel=0.02)
+
+    def test_path_shocks_follow_correlation(self):
+        """Per-year shocks should be correlated across variables within a year."""
+        correlation = [[1.0, 0.7, 0.0], [0.7, 1.0, 0.0], [0.0, 0.0, 1.0]]
+        factor = sampling.correlation_factor(correlation)
+        rng = np.random.default_rng(0)
+        sampled = sampling.sample_paths(make_inputs(), self.STD_DEVS, 20_000, rng, 0.0, factor)
+
+        year = 3
+        observed = np.corrcoef(
+            sampled["annual_appreciation"][:, year], sampled["annual_investment_return"][:, year]
+        )[0, 1]
+        assert observed == pytest.approx(0.7, abs=0.03)
+        assert sampled["mortgage_rate"].shape == (20_000,)
+
+    def test_positive_correlation_narrows_spread(self):
+        """Home prices moving with stocks should narrow the spread of outcomes."""
+        std_devs = {"annual_appreciation": 0.05, "annual_investment_return": 0.15}
+        inputs = make_inputs()
+        independent = run_monte_carlo(inputs, simulations=2000, seed=2, std_devs=std_devs)
+        # Home prices and stocks moving together hedge the buy-vs-rent bet
+        together = run_monte_carlo(
+            inputs,
+            simulations=2000,
+            seed=2,
+            std_devs=std_devs,
+            correlation=[[1.0, 0.9], [0.9, 1.0]],
+        )
+
+        assert together.p90 - together.p10 < independent.p90 - independent.p10
+
+    def test_factor_cached(self):
+        """Reusing a matrix should return the cached factor."""
+        correlation = [[1.0, 0.25], [0.25, 1.0]]
+        first = sampling.correlation_factor(correlation)
+        second = sampling.correlation_factor([row[:] for row in correlation])
+
+        assert first is second
+        assert np.allclose(first @ first.T, correlation)
+
+    @pytest.mark.parametrize(
+        "correlation",
+        [
+            [[1.0, 0.5], [0.4, 1.0]],  # not symmetric
+            [[2.0, 0.0], [0.0, 1.0]],  # diagonal not one
+            [[1.0, 0.5, 0.5], [0.5, 1.0]],  # ragged
+            [[1.0, 0.9, -0.9], [0.9, 1.0, 0.9], [-0.9, 0.9, 1.0]],  # not positive definite
+        ],
+    )
+    def test_invalid_matrix(self, correlation):
+        """Invalid correlation matrices should raise."""
+        with pytest.raises(ValueError):
+            sampling.correlation_factor(correlation)
+
+    def test_matrix_size_must_match(self):
+        """The matrix must cover exactly the randomized variables."""
+        with pytest.raises(ValueError):
+            run_monte_carlo(make_inputs(), simulations=10, correlation=[[1.0, 0.0], [0.0, 1.0]])
+
+    def test_unknown_variable(self):
+        """Only non-integer calculator inputs can be randomized."""
+        with pytest.raises(ValueError):
+            run_monte_carlo(make_inputs(), simulations=10, std_devs={"loan_term_years": 1.0})
+
+    def test_every_sampled_input_stays_valid(self):
+        """Inputs without sampling bounds should be clipped to their Field range."""
+        std_devs = {
+            "purchase_price": 1_000_000,
+            "down_payment_percent": 1.0,
+            "monthly_rent": 5000,
+            "pmi_rate": 0.05,
+        }
+        rng = np.random.default_rng(0)
+        sampled = sampling.sample_inputs(make_inputs(), std_devs, 10_000, rng)
+
+        base = make_inputs().model_dump()
+        for name, values in sampled.items():
+            for extreme in (values.min(), values.max()):
+                CalculatorInputs.model_validate({**base, name: extreme})
+
+
+class TestPairedMonteCarlo:
+    """Test A/B comparison under common random numbers."""
+
+    def test_identical_scenarios_have_zero_difference(self):
+        """Comparing a scenario with itself gives exactly zero difference."""
+        inputs = make_inputs()
+        result = run_paired_monte_carlo(inputs, inputs, simulations=500, seed=1)
+
+        assert result.mean_difference == 0
+        assert result.std_error == 0
+        assert result.a_wins_pct == 0
+        assert result.median_a == result.median_b
+
+    def test_without_uncertainty_matches_calculator(self):
+        """With no randomness every draw is the deterministic difference."""
+        a = make_inputs(purchase_price=380_000)
+        b = make_inputs(purchase_price=420_000, holding_period_years=10)
+        result = run_paired_monte_carlo(a, b, simulations=20, seed=1, std_devs={})
+
+        expected = calculate(a).net_benefit_at_horizon - calculate(b).net_benefit_at_horizon
+        assert result.mean_difference == pytest.approx(expected, abs=1e-6)
+        assert result.median == pytest.approx(expected, abs=1e-6)
+        assert result.a_wins_pct == 100
+
+    def test_common_random_numbers_reduce_noise(self):
+        """Paired draws should estimate a small difference far more precisely."""
+        a = make_inputs(purchase_price=395_000)
+        b = make_inputs(purchase_price=400_000)
+        paired = run_paired_monte_carlo(a, b, simulations=1000, seed=3)
+
+        # Independent runs: spread of each run swamps the $5k price difference
+        run_a = run_monte_carlo(a, simulations=1000, seed=4, distribution_format="full")
+        run_b = run_monte_carlo(b, simulations=1000, seed=5, distribution_format="full")
+        independent_error = np.sqrt(
+            (np.var(run_a.distribution) + np.var(run_b.distribution)) / 1000
+        )
+
+        assert paired.std_error < independent_error / 10
+        assert paired.mean_difference > 10 * paired.std_error
+
+    def test_reproducible(self):
+        """Same seed should give the same comparison."""
+        a = make_inputs()
+        b = make_inputs(mortgage_rate=0.06)
+        first = run_paired_monte_carlo(a, b, simulations=300, seed=8)
+        second = run_paired_monte_carlo(a, b, simulations=300, seed=8)
+
+        assert first.mean_difference == second.mean_difference
+        assert first.histogram == second.histogram
+
+
+class TestStochasticHoldingPeriod:
+    """Test drawing each simulation's sale year."""
+
+    def test_tenure_weights(self):
+        """Tenure probabilities should cover 30 years and peak near the median."""
+        weights = tenure_weights(7)
+
+        assert len(weights) == 30
+        assert sum(weights) == pytest.approx(1)
+        assert sum(weights[:7]) == pytest.approx(0.5, abs=0.05)
+        assert int(np.argmax(weights)) + 1 in (5, 6, 7)
+
+    def test_single_sale_year_matches_fixed_horizon(self):
+        """All weight on one year reproduces a fixed holding period."""
+        inputs = make_inputs(holding_period_years=12)
+        fixed = run_monte_carlo(
+            make_inputs(holding_period_years=5), simulations=500, seed=4, distribution_format="full"
+        )
+        weighted = run_monte_carlo(
+            inputs,
+            simulations=500,
+            seed=4,
+            distribution_format="full",
+            holding_period_weights=[0, 0, 0, 0, 1],
+        )
+
+        np.testing.assert_allclose(weighted.distribution, fixed.distribution, rtol=1e-9)
+
+    def test_mixture_of_sale_years(self):
+        """Win rate should average the win rates of the possible sale years."""
+        short = run_monte_carlo(make_inputs(holding_period_years=3), simulations=4000, seed=1)
+        long = run_monte_carlo(make_inputs(holding_period_years=20), simulations=4000, seed=2)
+        weights = [0.0] * 20
+        weights[2] = weights[19] = 1.0
+        mixed = run_monte_carlo(
+            make_inputs(), simulations=4000, seed=3, holding_period_weights=weights
+        )
+
+        expected = (short.buy_wins_pct + long.buy_wins_pct) / 2
+        assert mixed.buy_wins_pct == pytest.approx(expected, abs=3)
+
+    def test_path_mode_covers_longest_sale_year(self):
+        """Rate paths must extend to the latest possible sale year."""
+        result = run_monte_carlo(
+            make_inputs(holding_period_years=3),
+            simulations=200,
+            seed=1,
+            mode="path",
+            holding_period_weights=tenure_weights(3),
+        )
+
+        assert result.simulations == 200
+
+    @pytest.mark.parametrize("weights", [[], [0, 0], [1, -1], [1] * 31])
+    def test_invalid_weights(self, weights):
+        """Empty, all-zero, negative, or over-long weights should be rejected."""
+        with pytest.raises(ValueError):
+            run_monte_carlo(make_inputs(), simulations=10, holding_period_weights=weights)
@@ -0,0 +1,69 @@
+"""Tests for multilevel Monte Carlo."""
+
+import numpy as np
+import pytest
+
+from ownvsrent.engine.calculator import calculate
+from ownvsrent.engine.montecarlo import run_monte_carlo
+from ownvsrent.engine.multilevel import MAX_TOTAL_COST, run_multilevel_monte_carlo
+from tests.conftest import make_inputs
+
+
+class TestMultilevelMonteCarlo:
+    """Test the two-level estimator."""
+
+    def test_matches_plain_monte_carlo(self):
+        """The multilevel mean should agree with a plain monthly run."""
+        inputs = make_inputs()
+        result = run_multilevel_monte_carlo(inputs, target_std_error=1000, seed=1)
+        plain = run_monte_carlo(
+            inputs, simulations=50_000, seed=2, distribution_format="full"
+        ).distribution
+        plain_std_error = np.std(plain) / np.sqrt(len(plain))
+
+        combined = np.hypot(result.std_error, plain_std_error)
+        assert result.mean == pytest.approx(np.mean(plain), abs=4 * combined)
+
+    def test_reaches_target(self):
+        """Sample allocation should hit the requested standard error."""
+        for seed in range(3, 8):
+            result = run_multilevel_monte_carlo(make_inputs(), target_std_error=1500, seed=seed)
+            assert result.std_error <= 1500
+            assert result.target_met
+
+    def test_cost_budget(self):
+        """Unreachable targets should stop at the cost budget and say so."""
+        inputs = make_inputs(holding_period_years=30)
+        result = run_multilevel_monte_carlo(inputs, target_std_error=100, seed=8)
+
+        assert not result.target_met
+        assert result.std_error > 100
+        assert result.total_cost <= MAX_TOTAL_COST * 1.01
+
+    def test_cheaper_than_plain_monte_carlo(self):
+        """Most draws should go to the cheap level, cutting total cost."""
+        result = run_multilevel_monte_carlo(make_inputs(), target_std_error=1000, seed=4)
+        annual, correction = result.levels
+
+        assert annual.samples > 10 * correction.samples
+        assert correction.variance < annual.variance / 1000
+        assert result.total_cost < result.plain_cost / 3
+
+    def test_no_uncertainty(self):
+        """Without randomness the estimate is the deterministic result."""
+        inputs = make_inputs()
+        result = run_multilevel_monte_carlo(inputs, seed=5, std_devs={}, pilot_samples=10)
+
+        assert result.mean == pytest.approx(calculate(inputs).net_benefit_at_horizon)
+        assert result.std_error == 0
+
+    def test_reproducible(self):
+        """Same seed should give the same estimate."""
+        first = run_multilevel_monte_carlo(make_inputs(), target_std_error=3000, seed=6)
+        second = run_multilevel_monte_carlo(make_inputs(), target_std_error=3000, seed=6)
+        assert first.mean == second.mean
+
+    def test_invalid_target(self):
+        """The target standard error must be positive."""
+        with pytest.raises(ValueError):
+            run_multilevel_monte_carlo(make_inputs(), target_std_error=0)
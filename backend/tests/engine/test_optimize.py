@@ -0,0 +1,82 @@
+"""Tests for the financing optimizer."""
+
+import numpy as np
+import pytest
+
+from ownvsrent.engine.calculator import calculate
+from ownvsrent.engine.optimize import _pareto_front, optimize_financing
+from ownvsrent.engine.sensitivity import LOAN_TERMS
+from tests.conftest import make_inputs
+
+
+class TestParetoFront:
+    """Tests for _pareto_front."""
+
+    def test_keeps_only_undominated_options(self):
+        """Options beaten on both criteria should be dropped."""
+        net_benefit = np.array([10.0, 5.0, 8.0, 12.0, 8.0])
+        monthly_cost = np.array([100.0, 50.0, 120.0, 150.0, 90.0])
+        assert _pareto_front(net_benefit, monthly_cost) == [3, 0, 4, 1]
+
+    def test_ties_keep_cheapest(self):
+        """Equal net benefit should keep only the cheaper option."""
+        assert _pareto_front(np.array([1.0, 1.0]), np.array([20.0, 10.0])) == [1]
+
+
+class TestOptimizeFinancing:
+    """Tests for optimize_financing."""
+
+    def test_options_match_calculate(self):
+        """Every returned option should match a scalar calculate() run."""
+        inputs = make_inputs()
+        result = optimize_financing(inputs, holding_periods=[3, 7, 12])
+
+        assert result.evaluated == len(LOAN_TERMS) * 9 * 3
+        for option in result.options:
+            expected = calculate(
+                inputs.model_copy(
+                    update={
+                        "loan_term_years": option.loan_term_years,
+                        "down_payment_percent": option.down_payment_percent,
+                        "holding_period_years": option.holding_period_years,
+                    }
+                )
+            )
+            assert option.net_benefit == pytest.approx(expected.net_benefit_at_horizon, rel=1e-9)
+            assert option.monthly_cost == pytest.approx(expected.monthly_ownership_cost)
+            assert option.verdict == expected.verdict
+
+    def test_options_are_pareto_optimal(self):
+        """No option should be beaten on both criteria by another of its horizon."""
+        result = optimize_financing(
+            make_inputs(mortgage_rate=0.04), down_payments=[0.05, 0.1, 0.2, 0.3]
+        )
+        options = result.options
+        assert options
+        for option in options:
+            for other in options:
+                assert not (
+                    other.net_benefit > option.net_benefit
+                    and other.monthly_cost < option.monthly_cost
+                )
+        net_benefits = [option.net_benefit for option in options]
+        assert net_benefits == sorted(net_benefits, reverse=True)
+
+    def test_defaults_to_inputs_holding_period(self):
+        """Without holding periods, only the inputs' horizon is tried."""
+        result = optimize_financing(make_inputs(holding_period_years=5))
+        assert {option.holding_period_years for option in result.options} == {5}
+
+    def test_options_grouped_by_holding_period(self):
+        """Options should be listed by holding period."""
+        result = optimize_financing(make_inputs(), holding_periods=[10, 2, 10])
+        years = [option.holding_period_years for option in result.options]
+        assert years == sorted(years)
+        assert set(years) == {2, 10}
+
+    def test_invalid_levels_raise(self):
+        """Out-of-range down payments and holding periods should raise."""
+        with pytest.raises(ValueError, match="Down payments"):
+            optimize_financing(make_inputs(), down_payments=[1.5])
+        with pytest.raises(ValueError, match="Holding periods"):
+            optimize_financing(make_inputs(), holding_periods=[0])
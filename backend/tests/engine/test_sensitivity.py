@@ -2,7 +2,16 @@
 
 import pytest
 
-from ownvsrent.engine.sensitivity import SENSITIVITY_VARIABLES, run_sensitivity_analysis
+from ownvsrent.engine.batch import NUMERIC_FIELDS
+from ownvsrent.engine.calculator import calculate
+from ownvsrent.engine.sensitivity import (
+    SENSITIVITY_VARIABLES,
+    check_range,
+    field_bounds,
+    run_global_sensitivity,
+    run_sensitivity_analysis,
+    run_sensitivity_curves,
+)
 from ownvsrent.engine.types import CalculatorInputs
 
 
@@ -130,3 +139,234 @@ class TestSensitivityAnalysis:
         holding_result = next(r for r in results if r.variable == "holding_period_years")
         assert holding_result.low_value >= 1
         assert holding_result.high_value <= 30
+
+
+class TestBatchedSensitivity:
+    """Test that the batched tornado chart matches individual calculations."""
+
+    def test_matches_calculate(self):
+        """Each low/high outcome should equal a separate calculate() run."""
+        inputs = make_inputs()
+        results = run_sensitivity_analysis(inputs)
+
+        for result in results:
+            for value, outcome in (
+                (result.low_value, result.low_outcome),
+                (result.high_value, result.high_outcome),
+            ):
+                if result.variable == "holding_period_years":
+                    value = int(value)
+                expected = calculate(inputs.model_copy(update={result.variable: value}))
+                assert outcome == pytest.approx(expected.net_benefit_at_horizon, abs=1e-4)
+
+    def test_any_numeric_input(self):
+        """Inputs outside the default list can be varied, within their bounds."""
+        inputs = make_inputs(down_payment_percent=0.95)
+        variables = [
+            ("down_payment_percent", "", 0.10),
+            ("loan_term_years", "Term", 5),
+            ("monthly_rent", "Rent", 500),
+        ]
+        results = {r.variable: r for r in run_sensitivity_analysis(inputs, variables)}
+
+        down_payment = results["down_payment_percent"]
+        assert down_payment.label == "Down payment percent"
+        assert down_payment.high_value == 1.0
+        term = results["loan_term_years"]
+        assert (term.low_value, term.high_value) == (25, 30)
+        assert results["monthly_rent"].high_outcome > results["monthly_rent"].low_outcome
+
+    def test_same_variable_twice(self):
+        """A variable can appear with several deltas."""
+        inputs = make_inputs()
+        variables = [("mortgage_rate", "Small", 0.005), ("mortgage_rate", "Large", 0.02)]
+        results = {r.label: r for r in run_sensitivity_analysis(inputs, variables)}
+
+        assert results["Large"].impact > results["Small"].impact
+
+    def test_holding_period_read_from_base_row(self):
+        """Holding period variants should match calculate() at both sale years."""
+        inputs = make_inputs(holding_period_years=20, annual_appreciation=0.05)
+        variables = [("holding_period_years", "", 8), ("mortgage_rate", "", 0.01)]
+        results = {r.variable: r for r in run_sensitivity_analysis(inputs, variables)}
+
+        horizon = results["holding_period_years"]
+        assert (horizon.low_value, horizon.high_value) == (12, 28)
+        for years, outcome in ((12, horizon.low_outcome), (28, horizon.high_outcome)):
+            expected = calculate(inputs.model_copy(update={"holding_period_years": years}))
+            assert outcome == pytest.approx(expected.net_benefit_at_horizon, abs=1e-4)
+        expected = calculate(inputs)
+        assert horizon.base_outcome == pytest.approx(expected.net_benefit_at_horizon, abs=1e-4)
+
+    def test_unknown_variable(self):
+        """Non-numeric or unknown inputs should be rejected."""
+        with pytest.raises(ValueError):
+            run_sensitivity_analysis(make_inputs(), [("filing_status", "Status", 1)])
+
+
+def fixed_ranges(inputs: CalculatorInputs, **ranges) -> dict[str, tuple[float, float]]:
+    """Hold every numeric input fixed except the given ranges."""
+    fixed = {name: (getattr(inputs, name),) * 2 for name in NUMERIC_FIELDS}
+    fixed.update(ranges)
+    return fixed
+
+
+class TestGlobalSensitivity:
+    """Test Sobol indices."""
+
+    def test_covers_every_numeric_input(self):
+        """Every numeric input should get an index from one batch."""
+        result = run_global_sensitivity(make_inputs(), samples=256, seed=1)
+
+        assert {index.variable for index in result.indices} == set(NUMERIC_FIELDS)
+        assert result.evaluations == 256 * (len(NUMERIC_FIELDS) + 2)
+        totals = [index.total_effect for index in result.indices]
+        assert totals == sorted(totals, reverse=True)
+
+    def test_single_varying_input_explains_everything(self):
+        """With one input varying, its indices should be close to one."""
+        inputs = make_inputs()
+        ranges = fixed_ranges(inputs, annual_appreciation=(0.0, 0.06))
+        result = run_global_sensitivity(inputs, ranges, samples=2048, seed=2)
+
+        top = result.indices[0]
+        assert top.variable == "annual_appreciation"
+        assert top.first_order == pytest.approx(1, abs=0.1)
+        assert top.total_effect == pytest.approx(1, abs=0.1)
+        assert all(index.total_effect == 0 for index in result.indices[1:])
+
+    def test_indices_are_consistent(self):
+        """First-order effects should sum to about one and stay below total effects."""
+        result = run_global_sensitivity(make_inputs(), samples=2048, seed=3)
+
+        assert sum(index.first_order for index in result.indices) == pytest.approx(1, abs=0.15)
+        for index in result.indices:
+            # Allow for sampling noise in the first-order estimate
+            assert index.first_order <= index.total_effect + 2 * index.first_order_conf
+            assert index.first_order_conf >= 0
+
+    def test_fixed_inputs_have_no_effect(self):
+        """Inputs with zero-width ranges should score zero."""
+        inputs = make_inputs()
+        result = run_global_sensitivity(inputs, {"monthly_rent": (2000, 2000)}, samples=128, seed=4)
+        rent = next(index for index in result.indices if index.variable == "monthly_rent")
+
+        assert rent.first_order == 0
+        assert rent.total_effect == 0
+
+    def test_reproducible(self):
+        """Same seed should give the same indices."""
+        first = run_global_sensitivity(make_inputs(), samples=128, seed=5)
+        second = run_global_sensitivity(make_inputs(), samples=128, seed=5)
+
+        assert first == second
+
+    def test_whole_number_inputs(self):
+        """Holding periods and loan terms should only take valid values."""
+        inputs = make_inputs()
+        ranges = fixed_ranges(inputs, holding_period_years=(3, 10), loan_term_years=(12, 30))
+        result = run_global_sensitivity(inputs, ranges, samples=128, seed=6)
+
+        assert {index.variable for index in result.indices[:2]} == {
+            "holding_period_years",
+            "loan_term_years",
+        }
+
+    @pytest.mark.parametrize(
+        "ranges",
+        [
+            {"filing_status": (0, 1)},
+            {"mortgage_rate": (0.08, 0.06)},
+            {"mortgage_rate": (0.05, 0.25)},
+            {"loan_term_years": (11, 14)},
+            {"purchase_price": (0, 600_000)},
+        ],
+    )
+    def test_invalid_ranges(self, ranges):
+        """Unknown inputs, inverted ranges, and out-of-bounds ranges should be rejected."""
+        with pytest.raises(ValueError):
+            run_global_sensitivity(make_inputs(), ranges, samples=16)
+
+
+class TestFieldBounds:
+    """Test reading valid input ranges from the model."""
+
+    def test_bounds(self):
+        """Bounds should follow each Field's constraints."""
+        assert field_bounds("mortgage_rate") == (0, 0.20)
+        assert field_bounds("annual_appreciation") == (-0.10, 0.15)
+        assert field_bounds("holding_period_years") == (1, 30)
+        assert field_bounds("loan_term_years") == (10, 30)
+        assert field_bounds("monthly_rent") == (0, float("inf"))
+
+    def test_strict_bounds_exclude_the_bound(self):
+        """A range may start at a ``ge`` bound but not at a ``gt`` bound."""
+        check_range("monthly_rent", 0, 3000)
+        check_range("purchase_price", 1, 600_000)
+        with pytest.raises(ValueError, match=r"must lie within \(0.0, inf\]"):
+            check_range("purchase_price", 0, 600_000)
+
+
+class TestSensitivityCurves:
+    """Test multi-point sensitivity curves."""
+
+    def test_matches_calculate(self):
+        """Every point of every default curve should equal a calculate() run."""
+        inputs = make_inputs(annual_appreciation=0.05)
+        curves = run_sensitivity_curves(inputs, points=11)
+
+        assert [c.variable for c in curves] == [name for name, _, _ in SENSITIVITY_VARIABLES]
+        for curve in curves:
+            for value, outcome, break_even in zip(
+                curve.values, curve.net_benefit, curve.break_even_year
+            ):
+                if curve.variable == "holding_period_years":
+                    value = int(value)
+                expected = calculate(inputs.model_copy(update={curve.variable: value}))
+                assert outcome == pytest.approx(expected.net_benefit_at_horizon, abs=1e-4)
+                assert break_even == expected.break_even_year
+
+    def test_ranges_follow_field_bounds(self):
+        """Curves should span each input's Field bounds by default."""
+        curves = run_sensitivity_curves(make_inputs(), ["mortgage_rate", "monthly_rent"])
+        rate, rent = curves
+
+        assert len(rate.values) == 21
+        assert (rate.values[0], rate.values[-1]) == pytest.approx(field_bounds("mortgage_rate"))
+        # Unbounded inputs span the fallback range around the base value
+        assert (rent.values[0], rent.values[-1]) == pytest.approx((1000, 3000))
+        assert rent.label == "Monthly rent"
+
+    def test_whole_number_inputs(self):
+        """Holding periods and loan terms should take each whole value once."""
+        curves = run_sensitivity_curves(
+            make_inputs(), ["holding_period_years", "loan_term_years"], points=50
+        )
+        horizon, term = curves
+        assert horizon.values == [float(year) for year in range(1, 31)]
+        assert term.values == [10.0, 15.0, 20.0, 25.0, 30.0]
+
+    def test_custom_range(self):
+        """A given range should replace the default one."""
+        (curve,) = run_sensitivity_curves(
+            make_inputs(),
+            ["annual_appreciation"],
+            points=3,
+            ranges={"annual_appreciation": (0.0, 0.06)},
+        )
+        assert curve.values == pytest.approx([0.0, 0.03, 0.06])
+        assert curve.net_benefit == sorted(curve.net_benefit)
+
+    @pytest.mark.parametrize(
+        "variables,ranges",
+        [
+            (["filing_status"], None),
+            (["mortgage_rate"], {"mortgage_rate": (0.05, 0.5)}),
+            (["mortgage_rate"], {"mortgage_rate": (0.08, 0.06)}),
+            (["purchase_price"], {"purchase_price": (0, 600_000)}),
+        ],
+    )
+    def test_invalid_requests(self, variables, ranges):
+        """Unknown inputs and invalid ranges should be rejected."""
+        with pytest.raises(ValueError):
+            run_sensitivity_curves(make_inputs(), variables, ranges=ranges)
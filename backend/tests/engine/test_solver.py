@@ -0,0 +1,181 @@
+"""Tests for goal seek."""
+
+import math
+
+import numpy as np
+import pytest
+
+from ownvsrent.engine.calculator import calculate
+from ownvsrent.engine.montecarlo import run_monte_carlo
+from ownvsrent.engine.solver import (
+    MAX_PROBABILITY_SOLVE_YEARS,
+    PROBABILITY_SOLVE_MAX_ITERATIONS,
+    SOLVE_SCAN_POINTS,
+    _brent,
+    solve_for_input,
+    solve_for_probability,
+)
+from tests.conftest import make_inputs
+
+SOLVABLE = [
+    ("purchase_price", False),
+    ("monthly_rent", True),
+    ("annual_appreciation", True),
+    ("mortgage_rate", False),
+]
+
+
+class TestBrent:
+    """Tests for the Brent root finder."""
+
+    def test_finds_root(self):
+        """Should find the root of a smooth function."""
+        root = _brent(lambda x: math.cos(x) - x, 0.0, 1.0, 1.0, math.cos(1) - 1, xtol=1e-12)
+        assert root == pytest.approx(0.7390851332151607, abs=1e-11)
+
+    def test_handles_steps(self):
+        """Should still converge (like bisection) on a discontinuous function."""
+        root = _brent(lambda x: 1.0 if x > 0.3 else -1.0, 0.0, 1.0, -1.0, 1.0, xtol=1e-10)
+        assert root == pytest.approx(0.3, abs=1e-9)
+
+    def test_endpoint_root(self):
+        """A zero at an endpoint should be returned as is."""
+        assert _brent(lambda x: x, 0.0, 1.0, 0.0, 1.0, xtol=1e-12) == 0.0
+
+
+class TestSolveForInput:
+    """Tests for solve_for_input."""
+
+    @pytest.mark.parametrize("variable,buy_wins_above", SOLVABLE)
+    def test_net_benefit_is_zero_at_solution(self, variable, buy_wins_above):
+        """Net benefit should be zero at the solved value."""
+        inputs = make_inputs()
+        result = solve_for_input(inputs, variable)
+
+        solved = calculate(inputs.model_copy(update={variable: result.value}))
+        assert solved.net_benefit_at_horizon == pytest.approx(0, abs=1e-3)
+        assert result.buy_wins_above is buy_wins_above
+        assert result.base_value == getattr(inputs, variable)
+        assert result.year == inputs.holding_period_years
+
+    def test_solution_separates_verdicts(self):
+        """Buying should win on one side of the solved price and lose on the other."""
+        inputs = make_inputs()
+        price = solve_for_input(inputs, "purchase_price").value
+
+        cheaper = calculate(inputs.model_copy(update={"purchase_price": price * 0.99}))
+        dearer = calculate(inputs.model_copy(update={"purchase_price": price * 1.01}))
+        assert cheaper.net_benefit_at_horizon > 0
+        assert dearer.net_benefit_at_horizon < 0
+
+    def test_break_even_year(self):
+        """The break_even target should tie buying and renting at the given year."""
+        inputs = make_inputs(holding_period_years=10)
+        result = solve_for_input(inputs, "annual_appreciation", target="break_even", year=4)
+
+        assert result.year == 4
+        solved = calculate(
+            inputs.model_copy(
+                update={"annual_appreciation": result.value, "holding_period_years": 4}
+            )
+        )
+        assert solved.net_benefit_at_horizon == pytest.approx(0, abs=1e-3)
+
+    def test_fast(self):
+        """Solving should take a handful of evaluations beyond the bracketing scan."""
+        result = solve_for_input(make_inputs(holding_period_years=30), "purchase_price")
+        assert result.evaluations < 50
+
+    def test_explicit_range(self):
+        """A custom range containing the tie should give the same answer."""
+        default = solve_for_input(make_inputs(), "mortgage_rate")
+        narrow = solve_for_input(make_inputs(), "mortgage_rate", low=0.03, high=0.06)
+        assert narrow.value == pytest.approx(default.value, abs=1e-8)
+
+    def test_no_sign_change_raises(self):
+        """Should raise when one option wins across the whole range."""
+        with pytest.raises(ValueError, match="does not change sign"):
+            solve_for_input(make_inputs(), "mortgage_rate", low=0.1, high=0.2)
+
+    def test_invalid_requests_raise(self):
+        """Missing years and invalid ranges should raise."""
+        with pytest.raises(ValueError, match="year is required"):
+            solve_for_input(make_inputs(), "purchase_price", target="break_even")
+        with pytest.raises(ValueError, match="low < high"):
+            solve_for_input(make_inputs(), "mortgage_rate", low=0.05, high=0.05)
+        with pytest.raises(ValueError, match="must lie within"):
+            solve_for_input(make_inputs(), "mortgage_rate", low=0.05, high=0.5)
+        with pytest.raises(ValueError, match="Provide low and high"):
+            solve_for_input(make_inputs(monthly_rent=0), "monthly_rent")
+
+    def test_matches_grid_scan(self):
+        """The solved rent should lie between scanned rents of opposite verdicts."""
+        inputs = make_inputs()
+        rent = solve_for_input(inputs, "monthly_rent").value
+        below = calculate(inputs.model_copy(update={"monthly_rent": rent - 1}))
+        above = calculate(inputs.model_copy(update={"monthly_rent": rent + 1}))
+        assert np.sign(below.net_benefit_at_horizon) == -np.sign(above.net_benefit_at_horizon)
+
+
+class TestSolveForProbability:
+    """Tests for solve_for_probability."""
+
+    @pytest.mark.parametrize(
+        "variable,buy_wins_above",
+        [("annual_appreciation", True), ("purchase_price", False), ("monthly_rent", True)],
+    )
+    def test_reaches_target_probability(self, variable, buy_wins_above):
+        """run_monte_carlo with the same seed should hit the target at the solution."""
+        inputs = make_inputs()
+        result = solve_for_probability(inputs, variable, 80, simulations=500, seed=4)
+
+        assert result.buy_wins_above is buy_wins_above
+        solved = run_monte_carlo(
+            inputs.model_copy(update={variable: result.value}), simulations=500, seed=4
+        )
+        assert solved.buy_wins_pct == pytest.approx(80, abs=0.2 + 1e-9)
+
+    def test_base_probability_matches_monte_carlo(self):
+        """The reported base probability should match run_monte_carlo."""
+        inputs = make_inputs()
+        result = solve_for_probability(inputs, "mortgage_rate", 20, simulations=300, seed=9)
+
+        expected = run_monte_carlo(inputs, simulations=300, seed=9)
+        assert result.base_buy_wins_pct == pytest.approx(expected.buy_wins_pct)
+        assert result.buy_wins_above is False
+
+    def test_deterministic(self):
+        """The same seed should give the same answer."""
+        first = solve_for_probability(make_inputs(), "annual_appreciation", 60, seed=2)
+        second = solve_for_probability(make_inputs(), "annual_appreciation", 60, seed=2)
+        assert first == second
+
+    def test_higher_target_needs_more_appreciation(self):
+        """A higher target probability should need higher appreciation."""
+        values = [
+            solve_for_probability(make_inputs(), "annual_appreciation", pct, seed=5).value
+            for pct in (40, 60, 75)
+        ]
+        assert values == sorted(values)
+
+    def test_unreachable_target_raises(self):
+        """Should raise when the target is not reached anywhere in the range."""
+        with pytest.raises(ValueError, match="does not change sign"):
+            solve_for_probability(
+                make_inputs(), "mortgage_rate", 99, simulations=200, seed=1, low=0.1, high=0.2
+            )
+        with pytest.raises(ValueError, match="between 0 and 100"):
+            solve_for_probability(make_inputs(), "mortgage_rate", 100)
+
+    def test_cost_budget(self):
+        """Simulations x the most values a solve may try x years should stay in budget."""
+        passes = SOLVE_SCAN_POINTS + PROBABILITY_SOLVE_MAX_ITERATIONS + 1
+        inputs = make_inputs(holding_period_years=30)
+        assert MAX_PROBABILITY_SOLVE_YEARS <= 1_500_000
+        with pytest.raises(ValueError, match="simulated years"):
+            solve_for_probability(
+                inputs,
+                "annual_appreciation",
+                60,
+                simulations=MAX_PROBABILITY_SOLVE_YEARS // (passes * 30) + 1,
+            )
@@ -0,0 +1,108 @@
+"""Tests for precomputed interpolation surfaces."""
+
+import numpy as np
+import pytest
+
+from ownvsrent.engine.batch import calculate_batch
+from ownvsrent.engine.calculator import calculate
+from ownvsrent.engine.surfaces import (
+    SURFACE_AXES,
+    SURFACE_NAMES,
+    build_surface,
+    estimate_net_benefit,
+    get_surface,
+    surface_base,
+)
+from tests.conftest import make_inputs
+
+
+class TestInterpolationSurfaces:
+    """Tests for approximate net benefit from precomputed surfaces."""
+
+    @pytest.mark.parametrize("name", ["defaults", "austin", "san-francisco"])
+    def test_error_within_estimate(self, name):
+        """Estimates should cover nearly all errors without overstating them."""
+        base = surface_base(name)
+        rng = np.random.default_rng(7)
+        count = 400
+        overrides = {
+            axis: rng.uniform(nodes[0], nodes[-1], count) for axis, nodes in SURFACE_AXES.items()
+        }
+        overrides["holding_period_years"] = rng.integers(1, 31, count)
+        exact = calculate_batch(base, overrides).net_benefit_at_horizon
+
+        errors = []
+        estimates = []
+        for i in range(count):
+            update = {axis: values[i].item() for axis, values in overrides.items()}
+            estimate = estimate_net_benefit(base.model_copy(update=update), approximate=True)
+            assert estimate.approximate
+            assert estimate.surface == name
+            errors.append(abs(estimate.net_benefit - exact[i]))
+            estimates.append(estimate.error_estimate)
+        errors = np.array(errors)
+        estimates = np.array(estimates)
+
+        assert np.mean(errors <= estimates) >= 0.97
+        assert np.median(estimates / errors) < 4
+
+    def test_exact_at_grid_nodes(self):
+        """At grid nodes interpolation should return the tabulated value."""
+        node = {
+            "annual_appreciation": 0.04,
+            "annual_investment_return": 0.06,
+            "mortgage_rate": 0.06,
+            "down_payment_percent": 0.1,
+            "holding_period_years": 9,
+        }
+        inputs = surface_base("defaults").model_copy(update=node)
+        estimate = estimate_net_benefit(inputs, approximate=True)
+        expected = calculate(inputs).net_benefit_at_horizon
+        assert estimate.net_benefit == pytest.approx(expected, rel=1e-6, abs=1e-2)
+
+    def test_falls_back_outside_surfaces(self):
+        """Inputs no surface covers should be answered exactly."""
+        off_surface = make_inputs()
+        out_of_range = surface_base("defaults").model_copy(update={"mortgage_rate": 0.12})
+        for inputs in (off_surface, out_of_range):
+            estimate = estimate_net_benefit(inputs, approximate=True)
+            assert not estimate.approximate
+            assert estimate.error_estimate == 0
+            assert estimate.surface is None
+            assert estimate.net_benefit == pytest.approx(calculate(inputs).net_benefit_at_horizon)
+
+    def test_exact_by_default(self):
+        """Without approximate=True the exact engine should answer."""
+        estimate = estimate_net_benefit(surface_base("defaults"))
+        assert not estimate.approximate
+
+    def test_shipped_surfaces(self):
+        """Every surface should be bundled, with the expected float32/float16 tables."""
+        for name in SURFACE_NAMES:
+            surface = get_surface(name)
+            assert surface.net_benefit.dtype == np.float32
+            assert surface.net_benefit.shape == (*(len(n) for n in SURFACE_AXES.values()), 30)
+            assert surface.edge_error.dtype == np.float16
+            assert surface.edge_error.shape == (
+                *(len(n) - 1 for n in SURFACE_AXES.values()),
+                30,
+                len(SURFACE_AXES),
+            )
+        assert len(SURFACE_NAMES) == len(set(SURFACE_NAMES))
+
+    @pytest.mark.parametrize("name", ["defaults", "san-francisco"])
+    def test_shipped_surfaces_are_current(self, name):
+        """Bundled tables should match a fresh build (rerun scripts/build_surfaces.py)."""
+        shipped = get_surface(name)
+        built = build_surface(name)
+        np.testing.assert_allclose(shipped.net_benefit, built.net_benefit, rtol=1e-6)
+        np.testing.assert_allclose(
+            shipped.edge_error.astype(float), built.edge_error.astype(float), rtol=1e-2
+        )
+
+    def test_unknown_surface(self):
+        """Unknown surface names should raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown surface"):
+            surface_base("nowhere")
+        with pytest.raises(ValueError, match="Unknown surface"):
+            get_surface("nowhere")
@@ -0,0 +1,75 @@
+"""Tests for importance-sampled tail risk."""
+
+import numpy as np
+import pytest
+
+from ownvsrent.engine.calculator import calculate
+from ownvsrent.engine.montecarlo import run_monte_carlo
+from ownvsrent.engine.tailrisk import estimate_tail_risk
+from tests.conftest import make_inputs
+
+
+@pytest.fixture(scope="module")
+def reference():
+    """A large plain Monte Carlo sample of losses to check estimates against."""
+    inputs = make_inputs(monthly_rent=3000)
+    result = run_monte_carlo(inputs, simulations=200_000, seed=11, distribution_format="full")
+    return inputs, -np.array(result.distribution)
+
+
+class TestEstimateTailRisk:
+    """Test tail probabilities and expected shortfall."""
+
+    def test_matches_plain_monte_carlo(self, reference):
+        """Importance-sampled estimates should agree with a large plain run."""
+        inputs, losses = reference
+        threshold = float(np.quantile(losses, 0.99))
+        result = estimate_tail_risk(inputs, threshold, simulations=20_000, seed=1)
+
+        assert result.probability == pytest.approx(0.01, abs=4 * result.probability_std_error)
+        expected_shortfall = losses[losses > threshold].mean()
+        assert result.expected_shortfall == pytest.approx(
+            expected_shortfall, abs=4 * result.expected_shortfall_std_error
+        )
+        assert result.expected_shortfall > threshold
+
+    def test_rare_event_beats_plain_standard_error(self, reference):
+        """For a ~0.1% event the shifted sampler should be far more precise."""
+        inputs, losses = reference
+        threshold = float(np.quantile(losses, 0.999))
+        result = estimate_tail_risk(inputs, threshold, simulations=5000, seed=2)
+
+        assert 0.0003 < result.probability < 0.003
+        assert result.probability_std_error < result.plain_std_error / 3
+        assert result.effective_sample_size < 5000
+        # Buying loses when home prices fall
+        assert result.shift["annual_appreciation"] < 0
+
+    def test_likely_event_needs_no_shift(self):
+        """If the base case already exceeds the threshold, sampling is not shifted."""
+        inputs = make_inputs(monthly_rent=1000)
+        base_loss = -calculate(inputs).net_benefit_at_horizon
+        result = estimate_tail_risk(inputs, base_loss - 10_000, simulations=1000, seed=3)
+
+        assert all(value == 0 for value in result.shift.values())
+        assert result.effective_sample_size == pytest.approx(1000)
+
+    def test_no_uncertainty(self):
+        """With nothing randomized the outcome is certain."""
+        inputs = make_inputs()
+        base_loss = -calculate(inputs).net_benefit_at_horizon
+        below = estimate_tail_risk(inputs, base_loss - 1, simulations=100, std_devs={})
+        above = estimate_tail_risk(inputs, base_loss + 1, simulations=100, std_devs={})
+
+        assert below.probability == 1
+        assert above.probability == 0
+        assert above.expected_shortfall is None
+
+    def test_reproducible(self):
+        """Same seed should give the same estimate."""
+        inputs = make_inputs()
+        first = estimate_tail_risk(inputs, 200_000, simulations=2000, seed=5)
+        second = estimate_tail_risk(inputs, 200_000, simulations=2000, seed=5)
+
+        assert first.probability == second.probability
+        assert first.expected_shortfall == second.expected_shortfall
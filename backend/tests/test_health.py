@@ -1,5 +1,7 @@
 """Health check and API endpoint tests."""
 
+from ownvsrent.engine import DEFAULTS
+
 
 def test_health_check(client):
     """Health endpoint should return healthy status."""
@@ -120,3 +122,357 @@ def test_montecarlo_endpoint(client):
     assert "buy_wins_pct" in data
     assert "median" in data
     assert "distribution" in data
+    assert len(data["distribution"]) == 50
+
+    response = client.post(
+        "/api/montecarlo?simulations=50&distribution_format=histogram", json=payload
+    )
+    assert response.status_code == 200
+    assert response.json()["distribution"] is None
+    assert sum(response.json()["histogram"]["counts"]) == 50
+
+    response = client.post(
+        "/api/montecarlo?simulations=50&mode=path&autocorrelation=0.5", json=payload
+    )
+    assert response.status_code == 200
+    assert response.json()["simulations"] == 50
+
+    response = client.post("/api/montecarlo?mode=path&autocorrelation=1.5", json=payload)
+    assert response.status_code == 400
+
+    response = client.post("/api/montecarlo?simulations=50&mode=bootstrap", json=payload)
+    assert response.status_code == 200
+    assert response.json()["simulations"] == 50
+
+    response = client.post("/api/montecarlo?mode=bootstrap&block_length=0", json=payload)
+    assert response.status_code == 400
+
+
+def test_correlated_montecarlo_endpoint(client, payload):
+    """Correlated Monte Carlo endpoint should accept extra variables and a matrix."""
+    request = {
+        "inputs": payload,
+        "std_devs": {
+            "annual_appreciation": 0.05,
+            "annual_investment_return": 0.15,
+            "mortgage_rate": 0.01,
+        },
+        "correlation": [[1.0, 0.3, -0.2], [0.3, 1.0, 0.0], [-0.2, 0.0, 1.0]],
+    }
+    response = client.post("/api/montecarlo/correlated?simulations=50", json=request)
+    assert response.status_code == 200
+    assert response.json()["simulations"] == 50
+
+    request["correlation"] = [[1.0, 0.3], [0.3, 1.0]]
+    response = client.post("/api/montecarlo/correlated?simulations=50", json=request)
+    assert response.status_code == 400
+
+    request = {"inputs": payload, "std_devs": {"mortgage_rate": 0.01}}
+    url = "/api/montecarlo/correlated?simulations=50&mode=bootstrap"
+    response = client.post(f"{url}&block_length=3", json=request)
+    assert response.status_code == 200
+    response = client.post(f"{url}&block_length=0", json=request)
+    assert response.status_code == 400
+
+
+def test_backtest_endpoint(client, payload):
+    """Backtest endpoint should return a window per historical start year."""
+    response = client.post("/api/backtest", json=payload)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["windows"] == len(data["results"])
+    assert data["best"]["net_benefit"] >= data["worst"]["net_benefit"]
+
+
+def test_compare_montecarlo_endpoint(client, payload):
+    """Compare endpoint should return the distribution of A minus B."""
+    request = {"a": payload, "b": {**payload, "mortgage_rate": 0.06}}
+    response = client.post("/api/montecarlo/compare?simulations=50", json=request)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["simulations"] == 50
+    # A lower mortgage rate in B always helps B
+    assert data["a_wins_pct"] == 0
+    assert len(data["distribution"]) == 50
+
+
+def test_tail_risk_endpoint(client, payload):
+    """Tail risk endpoint should return a probability with its standard error."""
+    response = client.post(
+        "/api/montecarlo/tailrisk?loss_threshold=150000&simulations=1000", json=payload
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert 0 <= data["probability"] <= 1
+    assert data["probability_std_error"] >= 0
+    assert set(data["shift"]) == {
+        "annual_appreciation",
+        "annual_investment_return",
+        "annual_rent_increase",
+    }
+
+    response = client.post("/api/montecarlo/tailrisk?simulations=10", json=payload)
+    assert response.status_code == 400
+
+
+def test_tail_risk_endpoint_rejects_invalid_arguments(client, payload, monkeypatch):
+    """Engine ValueErrors should come back as 400, not 500."""
+
+    def invalid(inputs, **kwargs):
+        raise ValueError("invalid arguments")
+
+    monkeypatch.setattr("ownvsrent.api.routes.estimate_tail_risk", invalid)
+    response = client.post("/api/montecarlo/tailrisk", json=payload)
+    assert response.status_code == 400
+
+
+def test_multilevel_montecarlo_endpoint(client, payload):
+    """Multilevel endpoint should report both levels."""
+    response = client.post("/api/montecarlo/multilevel?target_std_error=3000", json=payload)
+    assert response.status_code == 200
+    data = response.json()
+    assert [level["name"] for level in data["levels"]] == ["annual", "monthly correction"]
+    assert data["std_error"] <= 3000 * 1.1
+    assert data["target_met"] is True
+
+
+def test_multilevel_endpoint_rejects_invalid_arguments(client, payload, monkeypatch):
+    """Engine ValueErrors should come back as 400, not 500."""
+
+    def invalid(inputs, **kwargs):
+        raise ValueError("invalid arguments")
+
+    monkeypatch.setattr("ownvsrent.api.routes.run_multilevel_monte_carlo", invalid)
+    response = client.post("/api/montecarlo/multilevel", json=payload)
+    assert response.status_code == 400
+
+
+def test_montecarlo_moments_method(client, payload):
+    """The moments method should answer without simulating."""
+    response = client.post("/api/montecarlo?method=moments", json=payload)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["simulations"] == 0
+    assert data["p10"] < data["median"] < data["p90"]
+    assert len(data["quantiles"]["values"]) == 99
+
+
+def test_fan_chart_endpoint(client, payload):
+    """Fan chart should return one band per year."""
+    response = client.post("/api/montecarlo/fan?simulations=100", json={"inputs": payload})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["simulations"] == 100
+    assert len(data["years"]) == payload["holding_period_years"]
+    assert set(data["years"][0]["net_benefit"]) == {"p10", "median", "p90"}
+
+    response = client.post("/api/montecarlo/fan?simulations=5", json={"inputs": payload})
+    assert response.status_code == 400
+
+
+def test_montecarlo_empirical_holding_period(client, payload):
+    """Monte Carlo should accept random sale years."""
+    response = client.post("/api/montecarlo?simulations=100&holding_period=empirical", json=payload)
+    assert response.status_code == 200
+    assert response.json()["simulations"] == 100
+
+    request = {"inputs": payload, "holding_period_weights": [0, 0]}
+    response = client.post("/api/montecarlo/correlated?simulations=50", json=request)
+    assert response.status_code == 400
+
+
+def test_global_sensitivity_endpoint(client, payload):
+    """Global sensitivity should return Sobol indices for every numeric input."""
+    request = {"inputs": payload, "ranges": {"annual_appreciation": [0.0, 0.06]}}
+    response = client.post("/api/sensitivity/global?samples=128", json=request)
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["indices"]) == 22
+    assert {"variable", "first_order", "total_effect"} <= set(data["indices"][0])
+
+    request = {"inputs": payload, "ranges": {"mortgage_rate": [0.05, 0.5]}}
+    response = client.post("/api/sensitivity/global?samples=128", json=request)
+    assert response.status_code == 400
+
+
+def test_custom_sensitivity_endpoint(client, payload):
+    """Custom sensitivity should vary the requested variables."""
+    request = {
+        "inputs": payload,
+        "variables": [
+            {"variable": "purchase_price", "delta": 50_000},
+            {"variable": "mortgage_rate", "delta": 0.01, "label": "Rate"},
+        ],
+    }
+    response = client.post("/api/sensitivity/custom", json=request)
+    assert response.status_code == 200
+    data = response.json()
+    assert {r["label"] for r in data} == {"Purchase price", "Rate"}
+
+    request["variables"] = [{"variable": "filing_status", "delta": 1}]
+    response = client.post("/api/sensitivity/custom", json=request)
+    assert response.status_code == 400
+
+
+def test_gradients_endpoint(client, payload):
+    """Gradients should cover every continuous input."""
+    response = client.post("/api/gradients", json=payload)
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["gradients"]) == 20
+    assert {"variable", "value", "derivative", "impact_per_percent"} == set(data["gradients"][0])
+
+
+def test_gradients_endpoint_rejects_invalid_arguments(client, payload, monkeypatch):
+    """Engine ValueErrors should come back as 400, not 500."""
+
+    def invalid(inputs):
+        raise ValueError("invalid arguments")
+
+    monkeypatch.setattr("ownvsrent.api.routes.calculate_gradients", invalid)
+    response = client.post("/api/gradients", json=payload)
+    assert response.status_code == 400
+
+
+def test_grid_endpoint(client, payload):
+    """Grid should return net benefit and verdict matrices."""
+    request = {
+        "inputs": payload,
+        "x": {"variable": "annual_appreciation", "low": 0.0, "high": 0.06, "steps": 100},
+        "y": {"variable": "annual_investment_return", "low": 0.04, "high": 0.1, "steps": 100},
+    }
+    response = client.post("/api/grid", json=request)
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["net_benefit"]) == 100
+    assert len(data["verdicts"][0]) == 100
+
+    request["x"]["steps"] = 101
+    response = client.post("/api/grid", json=request)
+    assert response.status_code == 422
+
+    request["x"] = {"variable": "annual_appreciation", "low": -2, "high": 0.06, "steps": 5}
+    response = client.post("/api/grid", json=request)
+    assert response.status_code == 400
+
+
+def test_grid_endpoint_probabilities(client, payload):
+    """Grid with simulations should add a P(buy wins) matrix."""
+    request = {
+        "inputs": payload,
+        "x": {"variable": "annual_appreciation", "low": 0.0, "high": 0.06, "steps": 4},
+        "y": {"variable": "purchase_price", "low": 300_000, "high": 500_000, "steps": 3},
+        "std_devs": {"annual_investment_return": 0.15, "mortgage_rate": 0.01},
+    }
+    response = client.post("/api/grid?simulations=100&seed=1", json=request)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["simulations"] == 100
+    assert len(data["buy_wins_pct"]) == 3
+    assert len(data["buy_wins_pct"][0]) == 4
+
+    response = client.post("/api/grid?simulations=5000", json=request)
+    assert response.status_code == 400
+
+    request["x"]["steps"] = request["y"]["steps"] = 100
+    response = client.post("/api/grid?simulations=1000", json=request)
+    assert response.status_code == 400
+
+
+def test_solve_endpoint(client, payload):
+    """Solve should return the tie value of the requested input."""
+    request = {"inputs": payload, "variable": "purchase_price"}
+    response = client.post("/api/solve", json=request)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["value"] > 0
+    assert data["buy_wins_above"] is False
+
+    request = {"inputs": payload, "variable": "mortgage_rate", "low": 0.19, "high": 0.2}
+    response = client.post("/api/solve", json=request)
+    assert response.status_code == 400
+
+    request = {"inputs": payload, "variable": "hoa_monthly"}
+    response = client.post("/api/solve", json=request)
+    assert response.status_code == 422
+
+
+def test_solve_probability_endpoint(client, payload):
+    """Probabilistic solve should return the value for the target chance."""
+    request = {"inputs": payload, "variable": "annual_appreciation", "buy_wins_pct": 75}
+    response = client.post("/api/solve/probability?simulations=200&seed=1", json=request)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["buy_wins_above"] is True
+    assert data["simulations"] == 200
+
+    response = client.post("/api/solve/probability?simulations=5", json=request)
+    assert response.status_code == 400
+
+    response = client.post("/api/solve/probability?simulations=10000", json=request)
+    assert response.status_code == 400
+
+
+def test_optimize_endpoint(client, payload):
+    """Optimize should return Pareto-optimal financing options."""
+    request = {"inputs": payload, "holding_periods": [5, 10]}
+    response = client.post("/api/optimize", json=request)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["evaluated"] == 5 * 9 * 2
+    assert {option["holding_period_years"] for option in data["options"]} == {5, 10}
+
+    request = {"inputs": payload, "down_payments": [2.0]}
+    response = client.post("/api/optimize", json=request)
+    assert response.status_code == 400
+
+
+def test_horizons_endpoint(client, payload):
+    """Horizons should report every holding period."""
+    response = client.post("/api/calculate/horizons?max_years=12", json=payload)
+    assert response.status_code == 200
+    data = response.json()
+    assert [h["holding_period_years"] for h in data["horizons"]] == list(range(1, 13))
+
+    response = client.post("/api/calculate/horizons?max_years=0", json=payload)
+    assert response.status_code == 400
+
+
+def test_compare_cities_endpoint(client, payload):
+    """City comparison should rank every preset city."""
+    response = client.post("/api/cities/compare", json={"inputs": payload})
+    assert response.status_code == 200
+    data = response.json()
+    assert [city["rank"] for city in data["cities"]] == list(range(1, len(data["cities"]) + 1))
+
+    response = client.post("/api/cities/compare", json={"inputs": payload, "cities": ["nowhere"]})
+    assert response.status_code == 400
+
+
+def test_sensitivity_curves_endpoint(client, payload):
+    """Sensitivity curves should return one curve per variable."""
+    response = client.post("/api/sensitivity/curves", json={"inputs": payload, "points": 11})
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 8
+    assert len(data[0]["net_benefit"]) == len(data[0]["values"])
+
+    request = {"inputs": payload, "variables": ["filing_status"]}
+    response = client.post("/api/sensitivity/curves", json=request)
+    assert response.status_code == 400
+
+
+def test_net_benefit_endpoint(client, payload):
+    """Approximate net benefit should come from a surface when one covers the inputs."""
+    response = client.post("/api/calculate/net-benefit", json=payload)
+    assert response.status_code == 200
+    exact = response.json()
+    assert exact["approximate"] is False
+    assert exact["error_estimate"] == 0
+
+    request = {**DEFAULTS, "mortgage_rate": 0.055, "holding_period_years": 12}
+    response = client.post("/api/calculate/net-benefit?approximate=true", json=request)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["approximate"] is True
+    assert data["surface"] == "defaults"